@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Benchmark the rendering of manual pages."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from mkdocs_manpage import Manpage, render_manpages
+from mkdocs_manpage.convert import find_pandoc, parse_html, write_document
+from mkdocs_manpage.filters import normalize_html
+from mkdocs_manpage.logger import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _page(index: int, size: int) -> str:
+    """Generate the HTML of an input page, similar to API reference pages."""
+    sections = []
+    for section in range(size):
+        sections.append(
+            f"<h2>function_{index}_{section}</h2>"
+            f"<p>Do something with <code>value</code>, see <a href='#'>other</a>.</p>"
+            "<table><thead><tr><th>Name</th><th>Type</th><th>Description</th></tr></thead><tbody>"
+            + "".join(f"<tr><td>param{n}</td><td>int</td><td>Parameter {n}.</td></tr>" for n in range(5))
+            + "</tbody></table>"
+            "<div class='highlight'><pre><code>result = function(value)</code></pre></div>",
+        )
+    return f"<h1>Module {index}</h1>" + "".join(sections)
+
+
+def _code_page(index: int, size: int) -> str:
+    """Generate the HTML of an input page with highlighted code, as produced by mkdocs-material and mkdocstrings."""
+    lines = "".join(
+        f'<span class="n">var{line}</span> <span class="o">=</span> <span class="n">call</span>'
+        f'<span class="p">(</span><span class="s2">"value"</span><span class="p">)</span>\n'
+        for line in range(20)
+    )
+    numbers = "\n".join(f'<span class="normal">{line}</span>' for line in range(1, 21))
+    sections = []
+    for section in range(size):
+        sections.append(
+            f"<h2>function_{index}_{section}</h2><p>Example:</p>"
+            f'<div class="highlight"><pre><span></span><code>{lines}</code></pre></div>'
+            '<table class="highlighttable"><tr><td class="linenos"><div class="linenodiv">'
+            f'<pre>{numbers}</pre></div></td><td class="code"><div class="highlight">'
+            f"<pre><span></span><code>{lines}</code></pre></div></td></tr></table>"
+            "<table><tr><td>param</td><td><table><tr><th>Name</th><th>Type</th></tr>"
+            "<tr><td>value</td><td>str</td></tr></table></td></tr></table>",
+        )
+    return f"<h1>Module {index}</h1>" + "".join(sections)
+
+
+def _time(func: Callable[[], object], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def bench_render(manpages: int, pages: int, size: int, jobs: int, repeat: int) -> None:
+    """Compare sequential and parallel rendering of several manual pages."""
+    specs = [
+        Manpage([_page(page, size) for page in range(pages)], f"manpage{index}", "3", formats=("man", "plain"))
+        for index in range(manpages)
+    ]
+    html_size = sum(len(page) for spec in specs for page in spec.pages)
+    print(f"render: {manpages} manpages, {pages} pages each, {html_size / 1024 / 1024:.1f} MiB of HTML")
+    sequential = _time(lambda: [render_manpages([spec]) for spec in specs], repeat)
+    parallel = _time(lambda: render_manpages(specs, jobs=jobs), repeat)
+    print(f"  one at a time:  {sequential:.2f}s")
+    print(f"  batch ({jobs} jobs): {parallel:.2f}s ({sequential / parallel:.1f}x)")
+
+
+def bench_logging(pages: int, size: int, repeat: int, html_file: str | None = None) -> None:
+    """Compare conversions and per-page log calls with debug logging disabled and enabled."""
+    logger = get_logger("mkdocs_manpage.benchmark")
+    package_logger = logging.getLogger("mkdocs.plugins.mkdocs_manpage")
+    package_logger.propagate = False
+    package_logger.addHandler(logging.NullHandler())
+    pandoc = find_pandoc()
+    html = (
+        Path(html_file).read_text(encoding="utf8") if html_file else "".join(_page(page, size) for page in range(pages))
+    )
+    uris = [f"reference/module_{page}.md" for page in range(pages * 100)]
+    print(f"logging: {len(html) / 1024 / 1024:.1f} MiB of HTML, {len(uris)} log calls")
+    for level in (logging.INFO, logging.DEBUG):
+        package_logger.setLevel(level)
+        convert = _time(lambda: parse_html(pandoc, html), repeat)
+        calls = _time(lambda: [logger.debug("Adding page %s to manpage %s", uri, "project.3") for uri in uris], repeat)
+        print(f"  {logging.getLevelName(level).lower()}: conversion {convert:.2f}s, log calls {calls * 1000:.1f}ms")
+
+
+def bench_normalize(pages: int, size: int, repeat: int) -> None:
+    """Compare conversions of highlighted code blocks and nested tables with and without normalization."""
+    pandoc = find_pandoc()
+    html = "".join(_code_page(page, size) for page in range(pages))
+    variables = ["title:project", "section:3"]
+    print(f"normalize: {len(html) / 1024 / 1024:.1f} MiB of HTML")
+
+    def convert(html: str) -> str:
+        return write_document(pandoc, parse_html(pandoc, html), "man", variables)
+
+    normalized = normalize_html(html)
+    raw_time = _time(lambda: convert(html), repeat)
+    normalize_time = _time(lambda: normalize_html(html), repeat)
+    normalized_time = _time(lambda: convert(normalized), repeat)
+    total = normalize_time + normalized_time
+    print(f"  raw HTML:   {raw_time:.2f}s, {len(convert(html)) / 1024:.0f} KiB of roff")
+    print(
+        f"  normalized: {total:.2f}s ({normalize_time:.2f}s normalizing, {raw_time / total:.1f}x), "
+        f"{len(normalized) / 1024 / 1024:.1f} MiB of HTML, {len(convert(normalized)) / 1024:.0f} KiB of roff",
+    )
+
+
+def main(args: list[str] | None = None) -> int:
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs, the best one is reported.")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+    render_parser = subparsers.add_parser("render", help=bench_render.__doc__)
+    render_parser.add_argument("--manpages", type=int, default=8, help="Number of manual pages.")
+    render_parser.add_argument("--pages", type=int, default=20, help="Number of input pages per manual page.")
+    render_parser.add_argument("--size", type=int, default=20, help="Number of sections per input page.")
+    render_parser.add_argument("--jobs", type=int, default=4, help="Number of concurrent Pandoc processes.")
+    logging_parser = subparsers.add_parser("logging", help=bench_logging.__doc__)
+    logging_parser.add_argument("--pages", type=int, default=50, help="Number of input pages.")
+    logging_parser.add_argument("--size", type=int, default=20, help="Number of sections per input page.")
+    logging_parser.add_argument("--html", help="Convert this HTML file instead of generated pages.")
+    normalize_parser = subparsers.add_parser("normalize", help=bench_normalize.__doc__)
+    normalize_parser.add_argument("--pages", type=int, default=20, help="Number of input pages.")
+    normalize_parser.add_argument("--size", type=int, default=20, help="Number of sections per input page.")
+    opts = parser.parse_args(args)
+    if opts.benchmark == "render":
+        bench_render(opts.manpages, opts.pages, opts.size, opts.jobs, opts.repeat)
+    elif opts.benchmark == "logging":
+        bench_logging(opts.pages, opts.size, opts.repeat, opts.html)
+    elif opts.benchmark == "normalize":
+        bench_normalize(opts.pages, opts.size, opts.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
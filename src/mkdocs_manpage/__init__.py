@@ -5,4 +5,6 @@ MkDocs plugin to generate a manpage from the documentation site.
 
 from __future__ import annotations
 
-__all__: list[str] = []
+from mkdocs_manpage.render import Manpage, ManpageMetadata, render_manpage, render_manpages
+
+__all__: list[str] = ["Manpage", "ManpageMetadata", "render_manpage", "render_manpages"]
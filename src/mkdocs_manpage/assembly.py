@@ -0,0 +1,101 @@
+"""Assembly of manual pages from the HTML of their input pages."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from pathlib import Path
+
+separator = "\n\n"
+"""The separator inserted between input pages."""
+
+
+def assemble_html(pages: Iterable[str]) -> str:
+    """Assemble the HTML of input pages in memory.
+
+    Parameters:
+        pages: The HTML of each input page.
+
+    Returns:
+        The HTML of the manual page.
+    """
+    return separator.join(pages)
+
+
+def write_html(pages: Iterable[str], path: Path) -> Path:
+    """Assemble the HTML of input pages into a file, one page at a time.
+
+    Pages are consumed lazily and written as soon as they are produced,
+    so that only one page at a time needs to be held in memory
+    when pages are given as a generator.
+
+    Parameters:
+        pages: The HTML of each input page.
+        path: The file to write.
+
+    Returns:
+        The written file.
+    """
+    with path.open("w", encoding="utf8") as file:
+        for index, page in enumerate(pages):
+            if index:
+                file.write(separator)
+            file.write(page)
+    return path
+
+
+def split_chunks(sizes: Sequence[int], chunks: int) -> list[int]:
+    """Split pages into chunks of similar sizes, at page boundaries.
+
+    Parameters:
+        sizes: The size of each page, in order.
+        chunks: The maximum number of chunks.
+
+    Returns:
+        The number of pages in each chunk, in order. Chunks are never empty.
+    """
+    chunks = max(1, min(chunks, len(sizes)))
+    total = sum(sizes)
+    counts: list[int] = []
+    count = 0
+    cumulated = 0
+    for index, size in enumerate(sizes):
+        count += 1
+        cumulated += size
+        remaining_pages = len(sizes) - index - 1
+        remaining_chunks = chunks - len(counts) - 1
+        # Cut when this chunk reached its share of the total size,
+        # or when each remaining chunk needs one of the remaining pages.
+        if remaining_chunks and (
+            cumulated >= total * (len(counts) + 1) / chunks or remaining_pages == remaining_chunks
+        ):
+            counts.append(count)
+            count = 0
+    counts.append(count)
+    return [count for count in counts if count]
+
+
+def split_budget(sizes: Sequence[int], max_size: int) -> list[int]:
+    """Split pages into consecutive groups whose total size stays within a budget.
+
+    Parameters:
+        sizes: The size of each page, in order.
+        max_size: The maximum size of each group. Pages larger than this get their own group.
+
+    Returns:
+        The number of pages in each group, in order.
+    """
+    counts: list[int] = []
+    count = 0
+    total = 0
+    for size in sizes:
+        if count and total + size > max_size:
+            counts.append(count)
+            count = total = 0
+        count += 1
+        total += size
+    if count:
+        counts.append(count)
+    return counts
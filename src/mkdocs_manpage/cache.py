@@ -0,0 +1,411 @@
+"""Process-safe, size-bounded cache for intermediate and final conversion results.
+
+The cache can be shared by several builds running at the same time,
+for example builds of different sites including the same pages.
+Entries are written atomically, and eviction of least recently used entries
+is done under an exclusive file lock.
+
+Cache directories are marked with a `CACHEDIR.TAG` file when they are created
+(see [the specification](https://bford.info/cachedir/)). Entries are only ever
+evicted or cleared from marked directories, and only within the namespaces of the cache,
+so that pointing the cache to another directory by mistake never deletes unrelated files.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from mkdocs.exceptions import PluginError
+
+from mkdocs_manpage.logger import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection, Iterator
+
+
+logger = get_logger(__name__)
+
+_LOCK_FILE = ".lock"
+_STATS_FILE = ".stats.json"
+_TAG_FILE = "CACHEDIR.TAG"
+_TAG_SIGNATURE = "Signature: 8a477f597d28d172789f06886806bc55"
+_TAG = (
+    f"{_TAG_SIGNATURE}\n"
+    "# This file is a cache directory tag created by mkdocs-manpage.\n"
+    "# For information about cache directory tags, see https://bford.info/cachedir/\n"
+)
+
+default_cache_dir = ".cache/mkdocs-manpage"
+"""The default cache directory, relative to the MkDocs configuration file."""
+default_max_size = "500M"
+"""The default maximum size of the cache."""
+default_namespaces = (
+    "preprocess",
+    "parse_html",
+    "parse_html_file",
+    "write_document",
+    "render_preview",
+    "render_catman",
+)
+"""The namespaces of the entries written by the plugin."""
+
+
+@contextmanager
+def _locked(lock_file: Path) -> Iterator[None]:
+    with lock_file.open("a+b") as file:
+        if sys.platform == "win32":
+            import msvcrt  # noqa: PLC0415
+
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl  # noqa: PLC0415
+
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+
+def parse_size(size: int | str) -> int:
+    """Parse a size, in bytes or with a unit suffix (`K`, `M` or `G`).
+
+    Parameters:
+        size: The size to parse, for example `1048576`, `500M` or `2G`.
+
+    Raises:
+        ValueError: When the size cannot be parsed.
+
+    Returns:
+        The size in bytes.
+    """
+    if isinstance(size, int):
+        return size
+    units = {"K": 1024, "M": 1024**2, "G": 1024**3}
+    size = size.strip().upper().removesuffix("B")
+    if size and size[-1] in units:
+        return int(float(size[:-1]) * units[size[-1]])
+    return int(size)
+
+
+@dataclass
+class CacheStats:
+    """Dataclass describing the contents and usage of a cache."""
+
+    directory: Path
+    """The cache directory."""
+    size: int = 0
+    """Total size of entries, in bytes."""
+    entries: dict[str, int] = field(default_factory=dict)
+    """Number of entries, by namespace."""
+    hits: int = 0
+    """Number of hits recorded by builds."""
+    misses: int = 0
+    """Number of misses recorded by builds."""
+
+    @property
+    def hit_rate(self) -> float:
+        """The ratio of hits to lookups."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class Cache:
+    """A cache of text and files, stored in a directory."""
+
+    def __init__(
+        self,
+        directory: Path,
+        max_size: int | None = None,
+        namespaces: Collection[str] = default_namespaces,
+    ) -> None:
+        """Initialize the cache.
+
+        Parameters:
+            directory: The cache directory. It is created and marked as a cache directory if needed.
+            max_size: The maximum size of the cache, in bytes.
+                When exceeded, least recently used entries are evicted.
+            namespaces: The namespaces of the entries.
+        """
+        self.directory = directory
+        """The cache directory."""
+        self.max_size = max_size
+        """The maximum size of the cache, in bytes."""
+        self.namespaces = frozenset(namespaces)
+        """The namespaces of the entries."""
+        self.hits = 0
+        """Number of hits since the cache was created or stats were last recorded."""
+        self.misses = 0
+        """Number of misses since the cache was created or stats were last recorded."""
+        self._counters_lock = threading.Lock()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if not self.is_marked and self._only_cache_files():
+            self.directory.joinpath(_TAG_FILE).write_text(_TAG, encoding="utf8")
+
+    @property
+    def is_marked(self) -> bool:
+        """Whether the directory is marked as a cache directory, allowing to evict and clear entries."""
+        try:
+            return self.directory.joinpath(_TAG_FILE).read_text(encoding="utf8").startswith(_TAG_SIGNATURE)
+        except (OSError, UnicodeDecodeError):
+            return False
+
+    def _only_cache_files(self) -> bool:
+        # Empty directories, and directories written by previous versions of the cache, are marked.
+        known = {*self.namespaces, _LOCK_FILE, _STATS_FILE}
+        return all(path.name in known for path in self.directory.iterdir())
+
+    @staticmethod
+    def key(*parts: str | Path) -> str:
+        """Compute a cache key.
+
+        Parameters:
+            *parts: Strings, or paths of files whose contents are hashed.
+
+        Returns:
+            The cache key.
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            if isinstance(part, Path):
+                with part.open("rb") as file:
+                    while chunk := file.read(1024 * 1024):
+                        digest.update(chunk)
+            else:
+                digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def path(self, namespace: str, key: str) -> Path:
+        """Return the path of an entry.
+
+        Parameters:
+            namespace: The entry namespace.
+            key: The entry key.
+
+        Raises:
+            ValueError: When the namespace is not one of the cache namespaces.
+
+        Returns:
+            The path of the entry.
+        """
+        if namespace not in self.namespaces:
+            raise ValueError(f"Unknown cache namespace {namespace!r}")
+        return self.directory / namespace / key[:2] / key
+
+    def get(self, namespace: str, key: str) -> str | None:
+        """Get an entry.
+
+        Parameters:
+            namespace: The entry namespace.
+            key: The entry key.
+
+        Returns:
+            The entry value, or none if it is not cached.
+        """
+        path = self.path(namespace, key)
+        try:
+            value = path.read_text(encoding="utf8")
+        except FileNotFoundError:
+            self._count(hit=False)
+            return None
+        self._touch(path)
+        self._count(hit=True)
+        return value
+
+    def set(self, namespace: str, key: str, value: str) -> None:
+        """Set an entry.
+
+        Parameters:
+            namespace: The entry namespace.
+            key: The entry key.
+            value: The entry value.
+        """
+        path = self.path(namespace, key)
+        temp_path = self._temp_path(path)
+        temp_path.write_text(value, encoding="utf8")
+        os.replace(temp_path, path)
+
+    def get_file(self, namespace: str, key: str, destination: Path) -> bool:
+        """Copy a file entry to the given destination.
+
+        Parameters:
+            namespace: The entry namespace.
+            key: The entry key.
+            destination: Where to copy the cached file.
+
+        Returns:
+            Whether the entry was cached.
+        """
+        path = self.path(namespace, key)
+        try:
+            shutil.copyfile(path, destination)
+        except FileNotFoundError:
+            self._count(hit=False)
+            return False
+        self._touch(path)
+        self._count(hit=True)
+        return True
+
+    def set_file(self, namespace: str, key: str, source: Path) -> None:
+        """Set a file entry by copying the given file.
+
+        Parameters:
+            namespace: The entry namespace.
+            key: The entry key.
+            source: The file to cache.
+        """
+        path = self.path(namespace, key)
+        temp_path = self._temp_path(path)
+        shutil.copyfile(source, temp_path)
+        os.replace(temp_path, path)
+
+    def cached(self, namespace: str, key: str, compute: Callable[[], str]) -> str:
+        """Get an entry, computing and setting it if it is not cached.
+
+        Parameters:
+            namespace: The entry namespace.
+            key: The entry key.
+            compute: The function computing the value.
+
+        Returns:
+            The entry value.
+        """
+        value = self.get(namespace, key)
+        if value is None:
+            value = compute()
+            self.set(namespace, key, value)
+        return value
+
+    def _temp_path(self, path: Path) -> Path:
+        # Entries are written to temporary files first, then moved in place atomically,
+        # so that concurrent builds never read partially written entries.
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix=".", dir=path.parent)
+        os.close(fd)
+        return Path(temp_path)
+
+    def _count(self, *, hit: bool) -> None:
+        # The cache can be shared between threads.
+        with self._counters_lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _touch(self, path: Path) -> None:
+        # Modification times track when entries were last used, for eviction.
+        with suppress(OSError):
+            os.utime(path)
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries: list[tuple[float, int, Path]] = []
+        if not self.is_marked:
+            return entries
+        for namespace in self.namespaces:
+            for path in self.directory.joinpath(namespace).glob("*/*"):
+                if path.name.startswith(".") or not path.is_file():
+                    continue
+                with suppress(OSError):
+                    stat = path.stat()
+                    entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def size(self) -> int:
+        """Compute the size of the cache.
+
+        Returns:
+            The total size of entries, in bytes.
+        """
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self) -> int:
+        """Evict least recently used entries until the cache fits in its maximum size.
+
+        Returns:
+            The number of evicted entries.
+        """
+        if self.max_size is None:
+            return 0
+        if not self.is_marked:
+            logger.warning(f"Not evicting entries from {self.directory}: it is not marked with a {_TAG_FILE} file")
+            return 0
+        with _locked(self.directory / _LOCK_FILE):
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            evicted = 0
+            for _, size, path in entries:
+                if total <= self.max_size:
+                    break
+                with suppress(OSError):
+                    path.unlink()
+                    evicted += 1
+                total -= size
+        if evicted:
+            logger.debug("Evicted %d entries from cache %s", evicted, self.directory)
+        return evicted
+
+    def record_stats(self) -> None:
+        """Add hit and miss counters to the statistics stored in the cache directory, and reset them."""
+        with self._counters_lock:
+            hits, misses = self.hits, self.misses
+            self.hits = self.misses = 0
+        with _locked(self.directory / _LOCK_FILE):
+            recorded = self._read_stats()
+            recorded["hits"] = recorded.get("hits", 0) + hits
+            recorded["misses"] = recorded.get("misses", 0) + misses
+            stats_file = self.directory / _STATS_FILE
+            temp_path = self._temp_path(stats_file)
+            temp_path.write_text(json.dumps(recorded), encoding="utf8")
+            os.replace(temp_path, stats_file)
+
+    def stats(self) -> CacheStats:
+        """Compute statistics about the cache.
+
+        Returns:
+            The cache statistics, including hits and misses recorded by builds.
+        """
+        stats = CacheStats(self.directory)
+        for _, size, path in self._entries():
+            namespace = path.parent.parent.name
+            stats.entries[namespace] = stats.entries.get(namespace, 0) + 1
+            stats.size += size
+        recorded = self._read_stats()
+        stats.hits = recorded.get("hits", 0)
+        stats.misses = recorded.get("misses", 0)
+        return stats
+
+    def _read_stats(self) -> dict[str, int]:
+        try:
+            return json.loads((self.directory / _STATS_FILE).read_text(encoding="utf8"))
+        except (OSError, ValueError):
+            return {}
+
+    def clear(self) -> None:
+        """Remove all entries and statistics.
+
+        Raises:
+            PluginError: When the directory is not marked as a cache directory.
+        """
+        if not self.is_marked:
+            raise PluginError(f"Refusing to clear {self.directory}: it is not marked with a {_TAG_FILE} file")
+        with _locked(self.directory / _LOCK_FILE):
+            for namespace in self.namespaces:
+                shutil.rmtree(self.directory / namespace, ignore_errors=True)
+            (self.directory / _STATS_FILE).unlink(missing_ok=True)
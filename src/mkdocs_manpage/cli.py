@@ -0,0 +1,113 @@
+"""Command-line interface, to inspect and clear the cache, and to generate manpages from shards."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+from mkdocs.exceptions import PluginError
+
+from mkdocs_manpage import debug
+from mkdocs_manpage.cache import Cache, default_cache_dir
+from mkdocs_manpage.plugin import merge_shards
+
+
+class _DebugInfo(argparse.Action):
+    def __init__(self, nargs: int | str | None = 0, **kwargs: Any) -> None:
+        super().__init__(nargs=nargs, **kwargs)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ARG002
+        debug.print_debug_info()
+        sys.exit(0)
+
+
+def _format_size(size: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:  # noqa: PLR2004
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Return the CLI argument parser.
+
+    Returns:
+        An argparse parser.
+    """
+    parser = argparse.ArgumentParser(prog="mkdocs-manpage")
+    parser.add_argument("-V", "--version", action="version", version=f"%(prog)s {debug.get_version()}")
+    parser.add_argument("--debug-info", action=_DebugInfo, help="Print debug information.")
+    subparsers = parser.add_subparsers(dest="command", required=True, title="commands")
+
+    cache_parser = subparsers.add_parser("cache", help="Inspect or clear the conversion cache.")
+    cache_parser.add_argument(
+        "-d",
+        "--cache-dir",
+        type=Path,
+        default=Path(os.getenv("MKDOCS_MANPAGE_CACHE_DIR") or default_cache_dir),
+        help="The cache directory. Default: $MKDOCS_MANPAGE_CACHE_DIR, or %(default)s.",
+    )
+    cache_subparsers = cache_parser.add_subparsers(dest="action", required=True, title="actions")
+    cache_subparsers.add_parser("stats", help="Show the size, number of entries, and hit rate of the cache.")
+    cache_subparsers.add_parser("clear", help="Remove all entries from the cache.")
+
+    merge_parser = subparsers.add_parser("merge", help="Generate manpages from shards exported by distributed builds.")
+    merge_parser.add_argument(
+        "-f",
+        "--config-file",
+        type=Path,
+        default=Path("mkdocs.yml"),
+        help="The MkDocs configuration file. Default: %(default)s.",
+    )
+    merge_parser.add_argument("shards", type=Path, nargs="+", help="The shard files exported by each build.")
+    return parser
+
+
+def _merge(opts: argparse.Namespace) -> int:
+    logging.basicConfig(level=logging.INFO, format="%(levelname)-7s -  %(message)s")
+    try:
+        merge_shards(opts.config_file, opts.shards)
+    except PluginError as error:
+        print(f"Could not generate manpages: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(args: list[str] | None = None) -> int:
+    """Run the main program.
+
+    This function is executed when you type `mkdocs-manpage` or `python -m mkdocs_manpage`.
+
+    Parameters:
+        args: Arguments passed from the command line.
+
+    Returns:
+        An exit code.
+    """
+    opts = get_parser().parse_args(args=args)
+    if opts.command == "merge":
+        return _merge(opts)
+    if not opts.cache_dir.is_dir():
+        print(f"No cache at {opts.cache_dir}", file=sys.stderr)
+        return 1
+    cache = Cache(opts.cache_dir)
+    if not cache.is_marked:
+        print(f"Not a cache directory: {opts.cache_dir} (no CACHEDIR.TAG file)", file=sys.stderr)
+        return 1
+    if opts.action == "clear":
+        cache.clear()
+        print(f"Cleared cache at {opts.cache_dir}")
+        return 0
+    stats = cache.stats()
+    print(f"Directory: {stats.directory}")
+    print(f"Size: {_format_size(stats.size)}")
+    print(f"Entries: {sum(stats.entries.values())}")
+    for namespace, count in sorted(stats.entries.items()):
+        print(f"  {namespace}: {count}")
+    print(f"Hits: {stats.hits}, misses: {stats.misses} ({stats.hit_rate:.0%} hit rate)")
+    return 0
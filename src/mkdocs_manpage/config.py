@@ -2,22 +2,95 @@
 
 from __future__ import annotations
 
+import os
+
 from mkdocs.config import config_options as mkconf
 from mkdocs.config.base import Config as BaseConfig
+from mkdocs.config.base import ValidationError
+
+from mkdocs_manpage.cache import default_cache_dir, default_max_size
+from mkdocs_manpage.filters import prune_rules
+from mkdocs_manpage.manifest import default_manifest
+from mkdocs_manpage.preprocess import is_path, split_spec
+
+
+class PreprocessOption(mkconf.BaseConfigOption[list[str]]):
+    """Pre-processing functions, given as a single reference or as a list.
+
+    Functions are referenced by the path of their module, relative to the configuration file,
+    or by dotted path (see [`load_function`][mkdocs_manpage.preprocess.load_function]).
+    """
+
+    def __init__(self) -> None:  # noqa: D107
+        super().__init__()
+        self.default = []
+        self.config_dir: str | None = None
+
+    def pre_validation(self, config: BaseConfig, key_name: str) -> None:  # noqa: ARG002, D102
+        self.config_dir = os.path.dirname(config.config_file_path) if config.config_file_path else None
+
+    def run_validation(self, value: object) -> list[str]:  # noqa: D102
+        if value is None:
+            return []
+        if isinstance(value, str):
+            value = [value]
+        if not isinstance(value, list) or not all(isinstance(spec, str) for spec in value):
+            raise ValidationError("Expected a module path or dotted path, or a list of them")
+        specs = []
+        for spec in value:
+            if is_path(spec):
+                target, function = split_spec(spec)
+                if self.config_dir and not os.path.isabs(target):
+                    target = os.path.join(self.config_dir, target)
+                if not os.path.isfile(target):
+                    raise ValidationError(f"The path '{target}' isn't an existing file.")
+                spec = f"{os.path.abspath(target)}:{function}"  # noqa: PLW2901
+            specs.append(spec)
+        return specs
 
 
 class PageConfig(BaseConfig):
     """Sub-config for each manual page."""
 
-    title = mkconf.Type(str)
-    header = mkconf.Type(str)
+    title = mkconf.Optional(mkconf.Type(str))
+    header = mkconf.Optional(mkconf.Type(str))
+    name = mkconf.Optional(mkconf.Type(str))
+    description = mkconf.Optional(mkconf.Type(str))
+    authors = mkconf.ListOfItems(mkconf.Type(str), default=[])
     output = mkconf.File(exists=False)
     inputs = mkconf.ListOfItems(mkconf.Type(str))
+    formats = mkconf.ListOfItems(mkconf.Choice(("man", "plain", "markdown")), default=["man"])
+    catman = mkconf.Type(bool, default=False)
+    dedup = mkconf.Type(bool, default=False)
+    chunks = mkconf.Type(int, default=1)
+    max_size = mkconf.Optional(mkconf.Type((int, str)))
+    split = mkconf.Type(bool, default=False)
+    timeout = mkconf.Optional(mkconf.Type((int, float)))
+    max_memory = mkconf.Optional(mkconf.Type(str))
 
 
 class PluginConfig(BaseConfig):
     """Configuration options for the plugin."""
 
     enabled = mkconf.Type(bool, default=True)
-    preprocess = mkconf.File(exists=True)
+    preprocess = PreprocessOption()
     pages = mkconf.ListOfItems(mkconf.SubConfig(PageConfig))
+    prune = mkconf.ListOfItems(mkconf.Choice(prune_rules), default=[])
+    normalize = mkconf.Type(bool, default=True)
+    jobs = mkconf.Optional(mkconf.Type(int))
+    low_memory = mkconf.Type(bool, default=False)
+    preprocess_pages = mkconf.Type(bool, default=False)
+    cache = mkconf.Type(bool, default=False)
+    cache_dir = mkconf.Type(str, default=default_cache_dir)
+    cache_max_size = mkconf.Type((int, str), default=default_max_size)
+    cache_salt = mkconf.Type(str, default="")
+    fail_fast = mkconf.Optional(mkconf.Type(bool))
+    diagnose = mkconf.Type(bool, default=False)
+    whatis = mkconf.Optional(mkconf.File(exists=False))
+    reproducible = mkconf.Type(bool, default=False)
+    cross_references = mkconf.Type(bool, default=True)
+    footer = mkconf.Optional(mkconf.Type(str))
+    preview = mkconf.Type(bool, default=True)
+    changed_only = mkconf.Type(bool, default=False)
+    shard = mkconf.Optional(mkconf.File(exists=False))
+    manifest = mkconf.Type(str, default=default_manifest)
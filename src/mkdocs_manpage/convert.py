@@ -0,0 +1,467 @@
+"""Conversion of HTML to manual pages (and other formats) with Pandoc."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass
+from pathlib import Path
+from shutil import which
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from mkdocs.exceptions import PluginError
+
+from mkdocs_manpage.logger import debug_enabled, get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine, Sequence
+
+
+logger = get_logger(__name__)
+
+formats = {
+    "man": "",
+    "plain": ".txt",
+    "markdown": ".md",
+}
+"""Supported output formats, and the suffix appended to the manpage output path for each of them."""
+
+parse_args = ("--from", "html", "--to", "json")
+"""The Pandoc arguments to parse HTML into Pandoc's JSON representation of documents."""
+
+_MAN_DIR_RE = re.compile(r"man[0-9n]\w*")
+_CHUNK_SIZE = 64 * 1024
+_T = TypeVar("_T")
+
+
+def _log_output(program: str, output: str) -> None:
+    if not output or not debug_enabled(logger):
+        return
+    for line in output.split("\n"):
+        if line := line.strip():
+            logger.debug("%s: %s", program, line)
+
+
+@dataclass(frozen=True)
+class Limits:
+    """Resource limits of conversion processes."""
+
+    timeout: float | None = None
+    """Number of seconds after which a process is killed."""
+    max_memory: str | None = None
+    """Maximum heap size of Pandoc processes, for example `512M` or `2G`."""
+
+
+def check_process(command: Sequence[str], returncode: int, stdout: str, stderr: str) -> str:
+    """Log the standard error of a finished process, and return its standard output if it succeeded.
+
+    Parameters:
+        command: The command that was run.
+        returncode: The process' return code.
+        stdout: The process' standard output.
+        stderr: The process' standard error.
+
+    Raises:
+        PluginError: When the process failed.
+
+    Returns:
+        The process' standard output.
+    """
+    program = Path(command[0]).name
+    _log_output(program, stderr)
+    if returncode:
+        reason = f"killed by signal {-returncode}" if returncode < 0 else f"exit code {returncode}"
+        errors = [line.strip() for line in stderr.splitlines() if "[WARNING]" not in line and line.strip()]
+        details = f": {' '.join(errors[-3:])}" if errors else ""
+        raise PluginError(f"{program} failed ({reason}){details}")
+    return stdout
+
+
+async def _write(stream: asyncio.StreamWriter, data: bytes) -> None:
+    try:
+        for start in range(0, len(data), _CHUNK_SIZE):
+            stream.write(data[start : start + _CHUNK_SIZE])
+            await stream.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        # The process exited without reading all its input: its return code tells why.
+        pass
+    finally:
+        stream.close()
+        with suppress(BrokenPipeError, ConnectionResetError):
+            await stream.wait_closed()
+
+
+async def _read(stream: asyncio.StreamReader) -> str:
+    chunks = []
+    while chunk := await stream.read(_CHUNK_SIZE):
+        chunks.append(chunk)
+    return b"".join(chunks).decode("utf8")
+
+
+async def run_process(command: Sequence[str], text: str = "", timeout: float | None = None) -> str:
+    """Run a command in an asyncio subprocess.
+
+    The input is written and the output read in chunks, concurrently.
+    When the task running the command is cancelled, or when it times out, the process is killed.
+
+    Parameters:
+        command: The command to run.
+        text: The input text, written to the process' standard input.
+        timeout: Number of seconds after which the process is killed.
+
+    Raises:
+        PluginError: When the process could not be started, failed, or timed out.
+
+    Returns:
+        The process' standard output.
+    """
+    program = Path(command[0]).name
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except OSError as error:
+        raise PluginError(f"Could not run {program}: {error}") from error
+    communicate = asyncio.gather(
+        _read(process.stdout),  # type: ignore[arg-type]
+        _read(process.stderr),  # type: ignore[arg-type]
+        _write(process.stdin, text.encode("utf8")),  # type: ignore[arg-type]
+    )
+    try:
+        stdout, stderr, _ = await asyncio.wait_for(communicate, timeout)
+        returncode = await process.wait()
+    except asyncio.TimeoutError as error:
+        raise PluginError(f"{program} timed out after {timeout} seconds") from error
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await asyncio.shield(process.wait())
+    return check_process(command, returncode, stdout, stderr)
+
+
+def run_sync(coroutine: Coroutine[Any, Any, _T]) -> _T:
+    """Run a coroutine to completion from synchronous code.
+
+    When an event loop is already running in the current thread,
+    the coroutine is run in an event loop of its own, in another thread.
+
+    Parameters:
+        coroutine: The coroutine to run.
+
+    Returns:
+        The coroutine's result.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+def _run(command: Sequence[str], text: str, limits: Limits | None) -> str:
+    return run_sync(run_process(command, text, limits.timeout if limits else None))
+
+
+def default_jobs() -> int:
+    """Return the number of concurrent conversions used when the `jobs` option is not set.
+
+    Returns:
+        The number of CPUs plus four, capped at 32, like thread pools of the standard library.
+    """
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+def find_pandoc() -> str:
+    """Find the Pandoc executable.
+
+    Returns:
+        The path to the Pandoc executable, or simply `pandoc` if it could not be found.
+    """
+    pandoc = which("pandoc")
+    if pandoc is None:
+        logger.debug("Could not find pandoc executable, trying to call 'pandoc' directly")
+        return "pandoc"
+    return pandoc
+
+
+def pandoc_version(pandoc: str) -> str:
+    """Return the version of Pandoc.
+
+    Parameters:
+        pandoc: The Pandoc executable.
+
+    Returns:
+        The Pandoc version, or an empty string if it could not be determined.
+    """
+    try:
+        output = _run([pandoc, "--version"], "", None)
+    except PluginError:
+        return ""
+    return output.split("\n", 1)[0].removeprefix("pandoc").strip()
+
+
+def run_pandoc(
+    pandoc: str,
+    args: Sequence[str],
+    text: str | Path,
+    *,
+    limits: Limits | None = None,
+) -> str:
+    """Run Pandoc on the given text.
+
+    The maximum memory limit is enforced by Pandoc's runtime (`+RTS -M<size> -RTS`).
+
+    Parameters:
+        pandoc: The Pandoc executable.
+        args: Arguments passed to Pandoc.
+        text: The input text, written to Pandoc's standard input, or the path of an input file.
+        limits: The resource limits of the Pandoc process.
+
+    Raises:
+        PluginError: When Pandoc fails.
+
+    Returns:
+        Pandoc's standard output.
+    """
+    return _run(*pandoc_command(pandoc, args, text, limits), limits)
+
+
+def pandoc_command(
+    pandoc: str,
+    args: Sequence[str],
+    text: str | Path,
+    limits: Limits | None = None,
+) -> tuple[list[str], str]:
+    """Build a Pandoc command line.
+
+    Parameters:
+        pandoc: The Pandoc executable.
+        args: Arguments passed to Pandoc.
+        text: The input text, or the path of an input file.
+        limits: The resource limits of the Pandoc process.
+
+    Returns:
+        The command, and the text to write to its standard input.
+    """
+    options = ["+RTS", f"-M{limits.max_memory}", "-RTS"] if limits and limits.max_memory else []
+    if debug_enabled(logger):
+        # Pandoc's verbose output is only useful in debug logs.
+        options.append("--verbose")
+    if isinstance(text, Path):
+        return [pandoc, *options, *args, str(text)], ""
+    return [pandoc, *options, *args], text
+
+
+def parse_html(
+    pandoc: str,
+    html: str,
+    *,
+    limits: Limits | None = None,
+) -> str:
+    """Parse HTML into Pandoc's JSON representation of the document.
+
+    Parsing is the expensive part of a conversion:
+    the resulting document can then be written to any number of formats cheaply.
+
+    Parameters:
+        pandoc: The Pandoc executable.
+        html: The HTML to parse.
+        limits: The resource limits of the Pandoc process.
+
+    Returns:
+        The document, as Pandoc JSON.
+    """
+    return run_pandoc(pandoc, parse_args, html, limits=limits)
+
+
+def merge_documents(documents: Sequence[str]) -> str:
+    """Merge documents parsed separately into a single document.
+
+    Blocks are concatenated, metadata is taken from the first document.
+    Writing the merged document gives the same output as parsing and writing the concatenated HTML at once,
+    with a single preamble, and consistent numbering of notes and sections.
+
+    Parameters:
+        documents: The documents, as Pandoc JSON.
+
+    Returns:
+        The merged document, as Pandoc JSON.
+    """
+    merged = json.loads(documents[0])
+    for document in documents[1:]:
+        merged["blocks"].extend(json.loads(document)["blocks"])
+    return json.dumps(merged)
+
+
+def merge_document_files(documents: Sequence[Path], destination: Path) -> Path:
+    """Merge document files parsed separately into a single document file.
+
+    Like [`merge_documents`][mkdocs_manpage.convert.merge_documents],
+    but only one document at a time is loaded in memory.
+
+    Parameters:
+        documents: The document files, as Pandoc JSON.
+        destination: The file to write the merged document to.
+
+    Returns:
+        The destination.
+    """
+    with destination.open("w", encoding="utf8") as file:
+        for index, document_file in enumerate(documents):
+            with document_file.open(encoding="utf8") as document_input:
+                document = json.load(document_input)
+            blocks = document.pop("blocks")
+            if index == 0:
+                header = json.dumps(document)
+                file.write(header[:-1] + (', "blocks": [' if document else '"blocks": ['))
+            for block_index, block in enumerate(blocks):
+                if index or block_index:
+                    file.write(",")
+                file.write(json.dumps(block))
+        file.write("]}")
+    return destination
+
+
+def write_document(
+    pandoc: str,
+    document: str | Path,
+    to: str,
+    variables: Sequence[str],
+    *,
+    limits: Limits | None = None,
+) -> str:
+    """Write a parsed document to the given format.
+
+    Parameters:
+        pandoc: The Pandoc executable.
+        document: The document, as Pandoc JSON (see [`parse_html`][mkdocs_manpage.convert.parse_html]),
+            or the path of a file containing it
+            (see [`Engine.parse_html_file`][mkdocs_manpage.engine.Engine.parse_html_file]).
+        to: The output format, one of [`formats`][mkdocs_manpage.convert.formats].
+        variables: Template variables passed to Pandoc.
+        limits: The resource limits of the Pandoc process.
+
+    Returns:
+        The converted document.
+    """
+    return run_pandoc(pandoc, write_args(to, variables), document, limits=limits)
+
+
+def write_args(to: str, variables: Sequence[str]) -> list[str]:
+    """Return the Pandoc arguments to write a parsed document.
+
+    Parameters:
+        to: The output format, one of [`formats`][mkdocs_manpage.convert.formats].
+        variables: Template variables passed to Pandoc.
+
+    Returns:
+        The Pandoc arguments.
+    """
+    return ["--standalone", "--wrap=none", *[f"-V{var}" for var in variables], "--from", "json", "--to", to]
+
+
+def find_groff() -> str | None:
+    """Find the groff executable.
+
+    Returns:
+        The path to the groff executable, or none if it could not be found.
+    """
+    return which("groff")
+
+
+def render_catman(
+    pandoc: str,
+    groff: str | None,
+    roff: str,
+    *,
+    limits: Limits | None = None,
+) -> str:
+    """Render a manual page to formatted text, as found in `cat` directories.
+
+    Parameters:
+        pandoc: The Pandoc executable, used to render the page when groff is not available.
+        groff: The groff executable, if available.
+        roff: The manual page source.
+        limits: The resource limits of the groff or Pandoc process.
+
+    Returns:
+        The formatted manual page.
+    """
+    return _run(*catman_command(pandoc, groff, roff, limits), limits)
+
+
+def catman_command(pandoc: str, groff: str | None, roff: str, limits: Limits | None = None) -> tuple[list[str], str]:
+    """Build the command line rendering a manual page to formatted text.
+
+    Parameters:
+        pandoc: The Pandoc executable, used to render the page when groff is not available.
+        groff: The groff executable, if available.
+        roff: The manual page source.
+        limits: The resource limits of the Pandoc process.
+
+    Returns:
+        The command, and the text to write to its standard input.
+    """
+    if groff is None:
+        return pandoc_command(pandoc, ["--wrap=auto", "--from", "man", "--to", "plain"], roff, limits)
+    return [groff, "-t", "-man", "-Tutf8", "-P-c"], roff
+
+
+def write_output(path: Path, text: str) -> bool:
+    """Write text to a file, unless the file already contains this exact text.
+
+    Leaving unchanged files untouched preserves their modification time,
+    which lets us skip work derived from them.
+
+    Parameters:
+        path: The file path.
+        text: The text to write.
+
+    Returns:
+        Whether the file was written.
+    """
+    try:
+        if path.read_text(encoding="utf8") == text:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_text(text, encoding="utf8")
+    return True
+
+
+def catman_output(output: Path) -> Path:
+    """Return the output path of a pre-formatted manpage.
+
+    Manpages written in a `manN` directory get their formatted version written in the sibling `catN` directory,
+    like `man` itself does. Other manpages get their formatted version written next to them, with a `.cat` suffix.
+
+    Parameters:
+        output: The manpage output path.
+
+    Returns:
+        The output path of the formatted manpage.
+    """
+    if _MAN_DIR_RE.fullmatch(output.parent.name):
+        return output.parent.with_name("cat" + output.parent.name[3:]) / output.name
+    return output.with_name(output.name + ".cat")
+
+
+def format_output(output: Path, to: str) -> Path:
+    """Return the output path of a manpage for the given format.
+
+    Parameters:
+        output: The manpage output path.
+        to: The output format.
+
+    Returns:
+        The output path for this format.
+    """
+    return output.with_name(output.name + formats[to])
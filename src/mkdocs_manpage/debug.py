@@ -5,8 +5,14 @@ from __future__ import annotations
 import os
 import platform
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from importlib import metadata
+from importlib.util import find_spec
+from pathlib import Path
+
+from mkdocs_manpage.cache import Cache, default_cache_dir
+from mkdocs_manpage.convert import default_jobs, find_pandoc, pandoc_version
+from mkdocs_manpage.manifest import read_timings, timings_file
 
 
 @dataclass
@@ -29,6 +35,31 @@ class Package:
     """Package version."""
 
 
+@dataclass
+class Performance:
+    """Dataclass describing what determines the speed of manpage builds."""
+
+    pandoc_path: str
+    """Path to the Pandoc executable."""
+    pandoc_version: str
+    """Pandoc version."""
+    lxml_available: bool
+    """Whether BeautifulSoup can use the lxml parser, used for pre-processing."""
+    cpu_count: int
+    """Number of CPUs available to this process."""
+    default_jobs: int
+    """Number of concurrent conversions when the `jobs` option is not set."""
+    cache_dir: str
+    """Default cache location, from `MKDOCS_MANPAGE_CACHE_DIR` or relative to the current directory.
+
+    The `cache_dir` option of the plugin is not read.
+    """
+    cache_size: int | None
+    """Size of the default cache, in bytes, or none if there is no cache there."""
+    last_build: dict[str, float] = field(default_factory=dict)
+    """Durations of the steps of the last build in the current directory, in seconds, if recorded."""
+
+
 @dataclass
 class Environment:
     """Dataclass to store environment information."""
@@ -45,6 +76,8 @@ class Environment:
     """Installed packages."""
     variables: list[Variable]
     """Environment variables."""
+    performance: Performance
+    """Performance-related information."""
 
 
 def _interpreter_name_version() -> tuple[str, str]:
@@ -73,6 +106,33 @@ def get_version(dist: str = "mkdocs-manpage") -> str:
         return "0.0.0"
 
 
+def _cpu_count() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def get_performance_info() -> Performance:
+    """Get performance-related information.
+
+    Returns:
+        Performance information.
+    """
+    pandoc = find_pandoc()
+    cache_dir = Path(os.getenv("MKDOCS_MANPAGE_CACHE_DIR") or default_cache_dir)
+    cache = Cache(cache_dir) if cache_dir.is_dir() else None
+    return Performance(
+        pandoc_path=pandoc,
+        pandoc_version=pandoc_version(pandoc) or "unknown",
+        lxml_available=find_spec("bs4") is not None and find_spec("lxml") is not None,
+        cpu_count=_cpu_count(),
+        default_jobs=default_jobs(),
+        cache_dir=str(cache_dir.absolute()),
+        cache_size=cache.size() if cache else None,
+        last_build=read_timings(Path(timings_file)),
+    )
+
+
 def get_debug_info() -> Environment:
     """Get debug/environment information.
 
@@ -89,6 +149,7 @@ def get_debug_info() -> Environment:
         platform=platform.platform(),
         variables=[Variable(var, val) for var in variables if (val := os.getenv(var))],
         packages=[Package(pkg, get_version(pkg)) for pkg in packages],
+        performance=get_performance_info(),
     )
 
 
@@ -103,6 +164,16 @@ def print_debug_info() -> None:
     print("- __Installed packages__:")
     for pkg in info.packages:
         print(f"  - `{pkg.name}` v{pkg.version}")
+    perf = info.performance
+    print("- __Performance__:")
+    print(f"  - Pandoc: {perf.pandoc_version} (`{perf.pandoc_path}`)")
+    print(f"  - lxml available: {'yes' if perf.lxml_available else 'no'}")
+    print(f"  - CPUs: {perf.cpu_count} (concurrent conversions when `jobs` is not set: {perf.default_jobs})")
+    cache_size = "no cache" if perf.cache_size is None else f"{perf.cache_size} bytes"
+    print(f"  - Default cache, ignoring the `cache_dir` option: `{perf.cache_dir}` ({cache_size})")
+    if perf.last_build:
+        timings = ", ".join(f"{step} {duration:.2f}s" for step, duration in perf.last_build.items() if step != "time")
+        print(f"  - Last build, in the current directory: {timings}")
 
 
 if __name__ == "__main__":
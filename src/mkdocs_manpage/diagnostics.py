@@ -0,0 +1,131 @@
+"""Diagnostics of manpage conversion performance."""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from mkdocs.exceptions import PluginError
+
+from mkdocs_manpage.convert import run_sync
+from mkdocs_manpage.engine import Engine
+from mkdocs_manpage.logger import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from mkdocs_manpage.convert import Limits
+
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class PageStats:
+    """Dataclass describing the conversion of a single input page."""
+
+    uri: str
+    """Page URI."""
+    input_size: int
+    """Size of the page HTML, in bytes."""
+    output_size: int
+    """Size of the resulting manpage, in bytes."""
+    duration: float
+    """Conversion time, in seconds."""
+    error: str = ""
+    """Conversion error, if any."""
+
+
+async def _profile_page(
+    engine: Engine,
+    semaphore: asyncio.Semaphore,
+    uri: str,
+    html: str,
+) -> PageStats:
+    # Conversions are timed once they are allowed to run, not while they wait for other ones.
+    async with semaphore:
+        start = time.perf_counter()
+        try:
+            roff = await engine.write_document(await engine.parse_html(html), "man", [])
+        except PluginError as error:
+            return PageStats(uri, len(html.encode()), 0, time.perf_counter() - start, str(error))
+        return PageStats(uri, len(html.encode()), len(roff.encode()), time.perf_counter() - start)
+
+
+def profile_pages(
+    pandoc: str,
+    pages: Mapping[str, str],
+    *,
+    jobs: int | None = None,
+    limits: Limits | None = None,
+) -> list[PageStats]:
+    """Convert each page separately, in parallel, and measure the conversions.
+
+    Parameters:
+        pandoc: The Pandoc executable.
+        pages: The HTML of each page, keyed by page URI.
+        jobs: The maximum number of concurrent Pandoc processes.
+        limits: The resource limits of Pandoc processes.
+
+    Returns:
+        Statistics for each page, in the same order as the given pages.
+    """
+
+    async def profile() -> list[PageStats]:
+        engine = Engine(pandoc=pandoc, jobs=jobs, limits=limits)
+        semaphore = asyncio.Semaphore(engine.jobs)
+        return await asyncio.gather(*(_profile_page(engine, semaphore, uri, html) for uri, html in pages.items()))
+
+    return run_sync(profile())
+
+
+def find_outliers(stats: list[PageStats], factor: float = 3.0) -> dict[str, str]:
+    """Find pages that are much slower to convert than the others.
+
+    A page is an outlier when its conversion time, or its conversion time per byte of input,
+    is more than `factor` times the median of all pages.
+
+    Parameters:
+        stats: Statistics of each page.
+        factor: How many times the median a page must exceed to be an outlier.
+
+    Returns:
+        The reason why each outlier was flagged, keyed by page URI.
+    """
+    measured = [page for page in stats if not page.error]
+    if len(measured) < 2:  # noqa: PLR2004
+        return {}
+    median_duration = statistics.median(page.duration for page in measured)
+    median_rate = statistics.median(page.duration / max(page.input_size, 1) for page in measured)
+    outliers = {}
+    for page in measured:
+        if page.duration > factor * median_duration:
+            outliers[page.uri] = f"{page.duration / median_duration:.1f}x the median conversion time"
+        elif page.duration / max(page.input_size, 1) > factor * median_rate:
+            outliers[page.uri] = (
+                f"{page.duration / max(page.input_size, 1) / median_rate:.1f}x the median time per byte"
+            )
+    return outliers
+
+
+def report(output: str, stats: list[PageStats]) -> None:
+    """Log the conversion statistics of the input pages of a manpage.
+
+    Parameters:
+        output: The manpage output path.
+        stats: Statistics of each input page.
+    """
+    outliers = find_outliers(stats)
+    total = sum(page.duration for page in stats)
+    logger.info(f"Conversion of {len(stats)} input pages of {output} took {total:.2f}s in total")
+    for page in sorted(stats, key=lambda page: page.duration, reverse=True):
+        line = f"  {page.uri}: {page.input_size} bytes -> {page.output_size} bytes in {page.duration:.2f}s"
+        if page.error:
+            logger.warning(f"{line}, failed: {page.error}")
+        elif page.uri in outliers:
+            logger.info(f"{line}, OUTLIER: {outliers[page.uri]}")
+        else:
+            logger.info(line)
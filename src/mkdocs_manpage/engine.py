@@ -0,0 +1,204 @@
+"""Asynchronous conversion engine, running Pandoc in asyncio subprocesses.
+
+The engine can be used directly by tools that orchestrate their own asynchronous builds,
+to convert HTML to manual pages without threads and without a MkDocs build:
+
+```python
+import asyncio
+
+from mkdocs_manpage.engine import Engine
+
+
+async def main() -> None:
+    engine = Engine(jobs=4)
+    outputs = await engine.convert(
+        "<h1>Usage</h1><p>Run <code>project</code>.</p>",
+        {"title": "project", "section": "1"},
+        formats=("man", "plain"),
+    )
+    print(outputs["man"])
+
+
+asyncio.run(main())
+```
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
+
+from mkdocs_manpage.convert import (
+    Limits,
+    catman_command,
+    default_jobs,
+    find_groff,
+    find_pandoc,
+    pandoc_command,
+    parse_args,
+    run_process,
+    write_args,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from pathlib import Path
+
+
+class Engine:
+    """Asynchronous conversion engine.
+
+    Processes are run with [`run_process`][mkdocs_manpage.convert.run_process], at most `jobs` at a time.
+    Their input is written and their output read in chunks, concurrently.
+    When a conversion task is cancelled, its process is killed.
+    The plugin itself converts manual pages with an engine.
+    """
+
+    def __init__(
+        self,
+        *,
+        pandoc: str | None = None,
+        groff: str | None = None,
+        jobs: int | None = None,
+        limits: Limits | None = None,
+    ) -> None:
+        """Initialize the engine.
+
+        Parameters:
+            pandoc: The Pandoc executable. Default: found in `PATH`.
+            groff: The groff executable, used to render pre-formatted manual pages. Default: found in `PATH`.
+            jobs: The maximum number of concurrent processes. Default: number of CPUs plus four, capped at 32.
+            limits: The default resource limits of processes.
+        """
+        self.pandoc = pandoc or find_pandoc()
+        """The Pandoc executable."""
+        self.groff = groff or find_groff()
+        """The groff executable, if available."""
+        self.jobs = jobs or default_jobs()
+        """The maximum number of concurrent processes."""
+        self.limits = limits or Limits()
+        """The default resource limits of processes."""
+        # Created lazily, to be bound to the running event loop.
+        self._semaphore: asyncio.Semaphore | None = None
+
+    async def run(self, command: Sequence[str], text: str = "", limits: Limits | None = None) -> str:
+        """Run a command.
+
+        Parameters:
+            command: The command to run.
+            text: The input text, written to the process' standard input.
+            limits: The resource limits of the process. Default: the engine's limits.
+
+        Raises:
+            PluginError: When the process could not be started, failed, or timed out.
+
+        Returns:
+            The process' standard output.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.jobs)
+        async with self._semaphore:
+            return await run_process(command, text, (limits or self.limits).timeout)
+
+    async def run_pandoc(self, args: Sequence[str], text: str | Path, limits: Limits | None = None) -> str:
+        """Run Pandoc on the given text.
+
+        Parameters:
+            args: Arguments passed to Pandoc.
+            text: The input text, or the path of an input file.
+            limits: The resource limits of the process. Default: the engine's limits.
+
+        Returns:
+            Pandoc's standard output.
+        """
+        limits = limits or self.limits
+        return await self.run(*pandoc_command(self.pandoc, args, text, limits), limits)
+
+    async def parse_html(self, html: str | Path, limits: Limits | None = None) -> str:
+        """Parse HTML into Pandoc's JSON representation of the document.
+
+        Parameters:
+            html: The HTML to parse, or the path of an HTML file.
+            limits: The resource limits of the process. Default: the engine's limits.
+
+        Returns:
+            The document, as Pandoc JSON.
+        """
+        return await self.run_pandoc(parse_args, html, limits)
+
+    async def parse_html_file(self, html_file: Path, document_file: Path, limits: Limits | None = None) -> Path:
+        """Parse an HTML file into a file containing Pandoc's JSON representation of the document.
+
+        Unlike [`parse_html`][mkdocs_manpage.engine.Engine.parse_html], neither the HTML
+        nor the parsed document are ever loaded in memory.
+
+        Parameters:
+            html_file: The HTML file to parse.
+            document_file: The file to write the document to, as Pandoc JSON.
+            limits: The resource limits of the process. Default: the engine's limits.
+
+        Returns:
+            The document file.
+        """
+        await self.run_pandoc([*parse_args, "--output", str(document_file)], html_file, limits)
+        return document_file
+
+    async def write_document(
+        self,
+        document: str | Path,
+        to: str,
+        metadata: Mapping[str, str] | Sequence[str],
+        limits: Limits | None = None,
+    ) -> str:
+        """Write a parsed document to the given format.
+
+        Parameters:
+            document: The document, as Pandoc JSON, or the path of a file containing it.
+            to: The output format, one of [`formats`][mkdocs_manpage.convert.formats].
+            metadata: Template variables passed to Pandoc, like `title`, `section`, `header`, `footer` or `date`,
+                either by name or as `name:value` strings.
+            limits: The resource limits of the process. Default: the engine's limits.
+
+        Returns:
+            The converted document.
+        """
+        if isinstance(metadata, Mapping):
+            metadata = [f"{name}:{value}" for name, value in metadata.items()]
+        return await self.run_pandoc(write_args(to, metadata), document, limits)
+
+    async def render_catman(self, roff: str, limits: Limits | None = None) -> str:
+        """Render a manual page to formatted text, as found in `cat` directories.
+
+        Parameters:
+            roff: The manual page source.
+            limits: The resource limits of the process. Default: the engine's limits.
+
+        Returns:
+            The formatted manual page.
+        """
+        limits = limits or self.limits
+        return await self.run(*catman_command(self.pandoc, self.groff, roff, limits), limits)
+
+    async def convert(
+        self,
+        html: str | Path,
+        metadata: Mapping[str, str],
+        formats: Iterable[str] = ("man",),
+    ) -> dict[str, str]:
+        """Convert HTML to the given formats.
+
+        The HTML is parsed once, then written to every format concurrently.
+
+        Parameters:
+            html: The HTML to convert, or the path of an HTML file.
+            metadata: Template variables passed to Pandoc, like `title`, `section`, `header`, `footer` or `date`.
+            formats: The output formats, among [`formats`][mkdocs_manpage.convert.formats].
+
+        Returns:
+            The converted document, by format.
+        """
+        document = await self.parse_html(html)
+        formats = list(formats)
+        outputs = await asyncio.gather(*(self.write_document(document, to, metadata) for to in formats))
+        return dict(zip(formats, outputs))
@@ -0,0 +1,383 @@
+"""Streaming HTML filters, applied without building a document tree."""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from dataclasses import dataclass, field
+from html import escape
+from html.parser import HTMLParser
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+Attrs = list[tuple[str, "str | None"]]
+"""Type of tag attributes, as given by [`HTMLParser`][html.parser.HTMLParser]."""
+
+void_elements = frozenset(
+    ("area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"),
+)
+"""Elements that never have an end tag."""
+
+prune_rules = ("source", "hidden", "images", "permalinks")
+"""Available pruning rules (see [`PruneFilter`][mkdocs_manpage.filters.PruneFilter])."""
+
+
+_PRE_RE = re.compile(r"<pre\b[^>]*>(.*?)</pre>", re.DOTALL | re.IGNORECASE)
+_LINENOS_RE = re.compile(r"<span\b[^>]*\blinenos\b[^>]*>[^<]*</span>", re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]*>")
+
+
+def _classes(attrs: Attrs) -> list[str]:
+    return next((value or "" for name, value in attrs if name == "class"), "").split()
+
+
+class HTMLFilter(HTMLParser):
+    """Base class for streaming HTML filters.
+
+    The HTML is re-emitted as it is parsed, except for elements
+    for which [`drop`][mkdocs_manpage.filters.HTMLFilter.drop] returns true:
+    these elements are removed along with their contents.
+    Subclasses can also override [`emit`][mkdocs_manpage.filters.HTMLFilter.emit]
+    and the `handle_*` methods to rewrite the HTML.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the filter."""
+        super().__init__(convert_charrefs=False)
+        self.output: list[str] = []
+        """The filtered HTML chunks."""
+        self._dropping: str | None = None
+        self._depth = 0
+
+    def filter(self, html: str) -> str:
+        """Filter HTML.
+
+        Parameters:
+            html: The HTML to filter.
+
+        Returns:
+            The filtered HTML.
+        """
+        self.feed(html)
+        self.close()
+        output = "".join(self.output)
+        self.output.clear()
+        self.reset()
+        return output
+
+    def drop(self, tag: str, attrs: Attrs) -> bool:  # noqa: ARG002
+        """Tell whether an element must be dropped.
+
+        Parameters:
+            tag: The tag name.
+            attrs: The tag attributes.
+
+        Returns:
+            Whether to drop the element and its contents.
+        """
+        return False
+
+    def emit(self, text: str) -> None:
+        """Emit text, unless it is part of a dropped element.
+
+        Parameters:
+            text: The text to emit.
+        """
+        if self._dropping is None:
+            self.output.append(text)
+
+    def handle_starttag(self, tag: str, attrs: Attrs) -> None:  # noqa: D102
+        if self._dropping is not None:
+            if tag == self._dropping:
+                self._depth += 1
+            return
+        if self.drop(tag, attrs):
+            if tag not in void_elements:
+                self._dropping = tag
+                self._depth = 1
+            return
+        self.emit(self.get_starttag_text() or "")
+
+    def handle_startendtag(self, tag: str, attrs: Attrs) -> None:  # noqa: D102
+        if self._dropping is None and not self.drop(tag, attrs):
+            self.emit(self.get_starttag_text() or "")
+
+    def handle_endtag(self, tag: str) -> None:  # noqa: D102
+        if self._dropping is not None:
+            if tag == self._dropping:
+                self._depth -= 1
+                if not self._depth:
+                    self._dropping = None
+            return
+        self.emit(f"</{tag}>")
+
+    def handle_data(self, data: str) -> None:  # noqa: D102
+        self.emit(data)
+
+    def handle_entityref(self, name: str) -> None:  # noqa: D102
+        self.emit(f"&{name};")
+
+    def handle_charref(self, name: str) -> None:  # noqa: D102
+        self.emit(f"&#{name};")
+
+    def handle_comment(self, data: str) -> None:  # noqa: D102
+        self.emit(f"<!--{data}-->")
+
+    def handle_decl(self, decl: str) -> None:  # noqa: D102
+        self.emit(f"<!{decl}>")
+
+    def handle_pi(self, data: str) -> None:  # noqa: D102
+        self.emit(f"<?{data}>")
+
+    def unknown_decl(self, data: str) -> None:  # noqa: D102
+        self.emit(f"<![{data}]>")
+
+
+class PruneFilter(HTMLFilter):
+    """Filter removing content that is useless in manual pages.
+
+    Rules:
+
+    - `source`: source code blocks of mkdocstrings (`<details class="quote">`);
+    - `hidden`: hidden elements (`hidden` or `aria-hidden="true"` attributes, `display: none` style);
+    - `images`: inline SVGs, and images or links using data URIs;
+    - `permalinks`: heading permalinks (`<a class="headerlink">`).
+    """
+
+    def __init__(self, rules: Collection[str]) -> None:
+        """Initialize the filter.
+
+        Parameters:
+            rules: The pruning rules to apply.
+        """
+        super().__init__()
+        self.rules = frozenset(rules)
+        """The pruning rules to apply."""
+
+    def drop(self, tag: str, attrs: Attrs) -> bool:  # noqa: D102
+        rules = self.rules
+        if "source" in rules and tag == "details" and {"quote", "mkdocstrings-source"} & set(_classes(attrs)):
+            return True
+        if "permalinks" in rules and tag == "a" and "headerlink" in _classes(attrs):
+            return True
+        if "images" in rules:
+            if tag == "svg":
+                return True
+            if any(name in {"src", "href"} and (value or "").startswith("data:") for name, value in attrs):
+                return True
+        if "hidden" in rules:
+            for name, value in attrs:
+                if name == "hidden" or (name == "aria-hidden" and value == "true"):
+                    return True
+                if name == "style" and "display:none" in (value or "").replace(" ", ""):
+                    return True
+        return False
+
+
+def prune_html(html: str, rules: Collection[str]) -> str:
+    """Remove content that is useless in manual pages.
+
+    Parameters:
+        html: The HTML to prune.
+        rules: The pruning rules to apply (see [`PruneFilter`][mkdocs_manpage.filters.PruneFilter]).
+
+    Returns:
+        The pruned HTML.
+    """
+    return PruneFilter(rules).filter(html)
+
+
+class NormalizeFilter(HTMLFilter):
+    """Filter simplifying structures that are slow to convert and produce bloated manual pages.
+
+    - Syntax-highlighted code blocks, with Pygments spans on every token, are collapsed to plain `<pre>` text.
+    - Line-numbered code blocks (`<table class="highlighttable">`) are unwrapped, and line numbers are dropped.
+    - Tables nested in other tables are flattened to lines of text, with cells separated by `|`.
+    """
+
+    table_elements = frozenset(("caption", "col", "colgroup", "tbody", "td", "tfoot", "th", "thead", "tr"))
+    """Elements that are part of tables."""
+
+    def __init__(self) -> None:
+        """Initialize the filter."""
+        super().__init__()
+        self._pre = 0
+        self._tables: list[str] = []
+        self._cells = 0
+
+    def drop(self, tag: str, attrs: Attrs) -> bool:  # noqa: ARG002,D102
+        return bool({"linenos", "linenodiv"} & set(_classes(attrs)))
+
+    def _unwrapping(self, tag: str) -> bool:
+        return bool(self._tables) and self._tables[-1] != "table" and tag in self.table_elements
+
+    def handle_starttag(self, tag: str, attrs: Attrs) -> None:  # noqa: D102
+        if self._dropping is not None or self.drop(tag, attrs):
+            super().handle_starttag(tag, attrs)
+        elif self._pre:
+            if tag == "pre":
+                self._pre += 1
+        elif tag == "pre":
+            self._pre = 1
+            self.emit("<pre>")
+        elif tag == "table":
+            if "highlighttable" in _classes(attrs):
+                self._tables.append("highlight")
+            elif self._tables:
+                self._tables.append("nested")
+            else:
+                self._tables.append("table")
+                super().handle_starttag(tag, attrs)
+        elif self._unwrapping(tag):
+            if self._tables[-1] == "nested":
+                if tag == "tr":
+                    self._cells = 0
+                elif tag in {"td", "th"}:
+                    if self._cells:
+                        self.emit(" | ")
+                    self._cells += 1
+        else:
+            super().handle_starttag(tag, attrs)
+
+    def handle_startendtag(self, tag: str, attrs: Attrs) -> None:  # noqa: D102
+        if not self._pre and not self._unwrapping(tag):
+            super().handle_startendtag(tag, attrs)
+
+    def handle_endtag(self, tag: str) -> None:  # noqa: D102
+        if self._dropping is not None:
+            super().handle_endtag(tag)
+        elif self._pre:
+            if tag == "pre":
+                self._pre -= 1
+                if not self._pre:
+                    self.emit("</pre>")
+        elif tag == "table" and self._tables:
+            if self._tables.pop() == "table":
+                super().handle_endtag(tag)
+        elif self._unwrapping(tag):
+            if self._tables[-1] == "nested" and tag == "tr":
+                self.emit("<br>")
+        else:
+            super().handle_endtag(tag)
+
+
+def _collapse_pre(match: re.Match) -> str:
+    return "<pre>" + _TAG_RE.sub("", _LINENOS_RE.sub("", match.group(1))) + "</pre>"
+
+
+def normalize_html(html: str) -> str:
+    """Simplify structures that are slow to convert and produce bloated manual pages.
+
+    Code blocks are first collapsed with regular expressions, which is much faster
+    than parsing each of their tokens, then the HTML goes through
+    [`NormalizeFilter`][mkdocs_manpage.filters.NormalizeFilter].
+
+    Parameters:
+        html: The HTML to normalize.
+
+    Returns:
+        The normalized HTML.
+    """
+    if "<pre" in html:
+        html = _PRE_RE.sub(_collapse_pre, html)
+    return NormalizeFilter().filter(html)
+
+
+@dataclass
+class _Block:
+    tag: str
+    original: list[str] = field(default_factory=list)
+    rewritten: list[str] = field(default_factory=list)
+    references: int = 0
+
+
+class DedupFilter(HTMLFilter):
+    """Filter replacing repeated blocks by short references to their first occurrence.
+
+    The same filter instance must be used to filter all pages of a manual page,
+    so that blocks repeated across pages are found.
+    Blocks are compared bottom-up, but the largest repeated block is replaced as a whole.
+    """
+
+    block_elements = frozenset(("blockquote", "details", "div", "dl", "ol", "p", "pre", "section", "table", "ul"))
+    """Elements that are compared."""
+    heading_elements = frozenset(("h1", "h2", "h3", "h4", "h5", "h6"))
+    """Elements whose text is used to reference first occurrences."""
+
+    def __init__(self, min_size: int = 256) -> None:
+        """Initialize the filter.
+
+        Parameters:
+            min_size: Minimum size of blocks to replace, in characters.
+        """
+        super().__init__()
+        self.min_size = min_size
+        """Minimum size of blocks to replace, in characters."""
+        self.replaced = 0
+        """Number of replaced blocks."""
+        self.saved = 0
+        """Number of characters saved by replacing blocks."""
+        self._seen: dict[bytes, str] = {}
+        self._blocks: list[_Block] = []
+        self._heading = ""
+        self._heading_text: list[str] | None = None
+
+    def emit(self, text: str) -> None:  # noqa: D102
+        if self._blocks:
+            self._blocks[-1].original.append(text)
+            self._blocks[-1].rewritten.append(text)
+        else:
+            self.output.append(text)
+
+    def _close_block(self, *, compare: bool = True) -> None:
+        block = self._blocks.pop()
+        original_html = "".join(block.original)
+        rewritten_html = "".join(block.rewritten)
+        references = block.references
+        if compare and len(original_html) >= self.min_size:
+            digest = hashlib.blake2b(original_html.encode(), digest_size=16).digest()
+            if digest in self._seen:
+                reference = f"<p><em>(Same as in {self._seen[digest]}.)</em></p>"
+                # References to repeated blocks nested in this one are replaced too.
+                self.replaced += 1 - references
+                self.saved += len(rewritten_html) - len(reference)
+                rewritten_html = reference
+                references = 1
+            else:
+                self._seen[digest] = f'"{escape(self._heading, quote=False)}"' if self._heading else "the content above"
+        if self._blocks:
+            self._blocks[-1].original.append(original_html)
+            self._blocks[-1].rewritten.append(rewritten_html)
+            self._blocks[-1].references += references
+        else:
+            self.output.append(rewritten_html)
+
+    def handle_starttag(self, tag: str, attrs: Attrs) -> None:  # noqa: D102
+        if tag in self.block_elements:
+            self._blocks.append(_Block(tag))
+        elif tag in self.heading_elements:
+            self._heading_text = []
+        super().handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag: str) -> None:  # noqa: D102
+        super().handle_endtag(tag)
+        if tag in self.heading_elements and self._heading_text is not None:
+            self._heading = " ".join("".join(self._heading_text).split())
+            self._heading_text = None
+        elif tag in self.block_elements and any(block.tag == tag for block in self._blocks):
+            # Blocks that were implicitly closed are merged into their parent without comparison.
+            while self._blocks[-1].tag != tag:
+                self._close_block(compare=False)
+            self._close_block()
+
+    def handle_data(self, data: str) -> None:  # noqa: D102
+        if self._heading_text is not None:
+            self._heading_text.append(data)
+        super().handle_data(data)
+
+    def close(self) -> None:  # noqa: D102
+        super().close()
+        while self._blocks:
+            self._close_block(compare=False)
@@ -0,0 +1,207 @@
+"""Resolution of links between pages into manual page cross-references."""
+
+from __future__ import annotations
+
+import posixpath
+from dataclasses import dataclass, field
+from html import escape
+from html.parser import HTMLParser
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING
+from urllib.parse import unquote, urlsplit
+
+from mkdocs_manpage.filters import Attrs, HTMLFilter, _classes
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+_heading_elements = frozenset(("h1", "h2", "h3", "h4", "h5", "h6"))
+
+
+def _normalize_url(url: str) -> str:
+    path = posixpath.normpath("/" + url.lstrip("/")).lstrip("/")
+    if path.endswith("index.html"):
+        path = path[: -len("index.html")]
+    return path.strip("/")
+
+
+class _HeadingParser(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__()
+        self.headings: dict[str, str] = {}
+        self.title = ""
+        self._id: str | None = None
+        self._tag: str | None = None
+        self._text: list[str] = []
+        self._skip = 0
+
+    def handle_starttag(self, tag: str, attrs: Attrs) -> None:
+        if tag in _heading_elements and self._tag is None:
+            self._tag = tag
+            self._id = next((value for name, value in attrs if name == "id"), None)
+            self._text = []
+        elif self._tag and tag == "a" and "headerlink" in _classes(attrs):
+            self._skip += 1
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == self._tag:
+            text = " ".join("".join(self._text).split())
+            if self._id:
+                self.headings[self._id] = text
+            if tag == "h1" and not self.title:
+                self.title = text
+            self._tag = self._id = None
+        elif self._skip and tag == "a":
+            self._skip -= 1
+
+    def handle_data(self, data: str) -> None:
+        if self._tag and not self._skip:
+            self._text.append(data)
+
+
+@dataclass
+class _Target:
+    outputs: list[str]
+    title: str
+    headings: dict[str, str]
+
+
+@dataclass
+class LinkIndex:
+    """Index of the pages and headings of manual pages, used to resolve links between pages.
+
+    The index is built once per build, while pages are rendered,
+    so that links can then be resolved in a single pass over each page.
+    """
+
+    pages: dict[str, _Target] = field(default_factory=dict)
+    """Pages, by normalized URL."""
+
+    def add_page(self, url: str, outputs: list[str], html: str) -> None:
+        """Index a page and its headings.
+
+        Parameters:
+            url: The page URL, relative to the site root.
+            outputs: The output paths of the manual pages this page is part of.
+            html: The page HTML.
+        """
+        parser = _HeadingParser()
+        parser.feed(html)
+        parser.close()
+        self.pages[_normalize_url(url)] = _Target(outputs, parser.title, parser.headings)
+
+    def move_page(self, url: str, output: str, new_output: str) -> None:
+        """Move a page from a manual page to another one, for example when a manual page is split.
+
+        Parameters:
+            url: The page URL, relative to the site root.
+            output: The output path of the manual page the page was part of.
+            new_output: The output path of the manual page the page is now part of.
+        """
+        target = self.pages.get(_normalize_url(url))
+        if target is not None:
+            target.outputs = [new_output if path == output else path for path in target.outputs]
+
+    def resolve(self, page_url: str, href: str, output: str) -> tuple[str | None, str | None] | None:
+        """Resolve a link.
+
+        Parameters:
+            page_url: The URL of the page containing the link.
+            href: The link target, relative to the page.
+            output: The output path of the manual page being generated.
+
+        Returns:
+            None if the target is not part of a manual page, otherwise a tuple made of
+            the output path of the target manual page (none when it is the current manual page),
+            and the target heading (none when unknown).
+        """
+        parts = urlsplit(href)
+        if parts.scheme or parts.netloc:
+            return None
+        if parts.path:
+            base = page_url if page_url.endswith("/") else posixpath.dirname(page_url) + "/"
+            url = _normalize_url(posixpath.join(base, unquote(parts.path)))
+        else:
+            url = _normalize_url(page_url)
+        target = self.pages.get(url)
+        if target is None:
+            return None
+        heading = target.headings.get(unquote(parts.fragment)) if parts.fragment else target.title
+        if output in target.outputs:
+            return None, heading
+        return target.outputs[0], heading
+
+
+class LinkFilter(HTMLFilter):
+    """Filter rewriting links between pages into manual page cross-references.
+
+    Links to other manual pages are followed by a reference like **name**(section),
+    which is rendered as `.BR name (section)`. Links within the same manual page
+    are followed by the name of the target section, unless it is the link text.
+    Other links are left untouched.
+    """
+
+    def __init__(self, index: LinkIndex, output: str, names: Mapping[str, str] | None = None) -> None:
+        """Initialize the filter.
+
+        Parameters:
+            index: The index of pages and headings.
+            output: The output path of the manual page being generated.
+            names: The names of manual pages, by output path. Default: their file name without extension.
+        """
+        super().__init__()
+        self.index = index
+        """The index of pages and headings."""
+        self.names = names or {}
+        """The names of manual pages, by output path."""
+        self.manpage = output
+        """The output path of the manual page being generated."""
+        self.page_url = ""
+        """The URL of the page being filtered."""
+        self._link: tuple[str | None, str | None] | None = None
+        self._link_text: list[str] = []
+
+    def rewrite(self, html: str, page_url: str) -> str:
+        """Rewrite the links of a page.
+
+        Parameters:
+            html: The page HTML.
+            page_url: The page URL, relative to the site root.
+
+        Returns:
+            The HTML with rewritten links.
+        """
+        self.page_url = page_url
+        return self.filter(html)
+
+    def handle_starttag(self, tag: str, attrs: Attrs) -> None:  # noqa: D102
+        if tag == "a" and self._link is None:
+            href = next((value for name, value in attrs if name == "href"), None)
+            if href and "headerlink" not in _classes(attrs):
+                self._link = self.index.resolve(self.page_url, href, self.manpage)
+                if self._link is not None:
+                    self._link_text = []
+                    return
+        super().handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag: str) -> None:  # noqa: D102
+        if tag == "a" and self._link is not None:
+            output, heading = self._link
+            self._link = None
+            text = " ".join("".join(self._link_text).split())
+            if output is not None:
+                path = PurePosixPath(output)
+                name = self.names.get(output, path.stem)
+                reference = f"<strong>{escape(name)}</strong>({escape(path.suffix[1:])})"
+                if heading and heading != text:
+                    reference = f'"{escape(heading, quote=False)}" in {reference}'
+                self.emit(f" (see {reference})")
+            elif heading and heading != text:
+                self.emit(f' (see "{escape(heading, quote=False)}")')
+            return
+        super().handle_endtag(tag)
+
+    def handle_data(self, data: str) -> None:  # noqa: D102
+        if self._link is not None:
+            self._link_text.append(data)
+        super().handle_data(data)
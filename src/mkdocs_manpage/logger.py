@@ -10,7 +10,12 @@ if TYPE_CHECKING:
 
 
 class PluginLogger(logging.LoggerAdapter):
-    """A logger adapter to prefix messages with the originating package name."""
+    """A logger adapter to prefix messages with the originating package name.
+
+    Messages are only processed when their level is enabled.
+    Pass arguments separately (`logger.debug("Adding %s", uri)`)
+    rather than formatting messages in advance, so that disabled messages cost almost nothing.
+    """
 
     def __init__(self, prefix: str, logger: logging.Logger):
         """Initialize the object.
@@ -21,6 +26,7 @@ class PluginLogger(logging.LoggerAdapter):
         """
         super().__init__(logger, {})
         self.prefix = prefix
+        self._prefix = f"{prefix}: "
 
     def process(self, msg: str, kwargs: MutableMapping[str, Any]) -> tuple[str, Any]:
         """Process the message.
@@ -32,7 +38,7 @@ class PluginLogger(logging.LoggerAdapter):
         Returns:
             The processed message.
         """
-        return f"{self.prefix}: {msg}", kwargs
+        return self._prefix + msg, kwargs
 
 
 def get_logger(name: str) -> PluginLogger:
@@ -47,3 +53,17 @@ def get_logger(name: str) -> PluginLogger:
     """
     logger = logging.getLogger(f"mkdocs.plugins.{name}")
     return PluginLogger(name.split(".", 1)[0], logger)
+
+
+def debug_enabled(logger: PluginLogger) -> bool:
+    """Tell whether debug messages are enabled for the given logger.
+
+    Use it to skip preparing expensive debug information when it would not be logged.
+
+    Parameters:
+        logger: A logger returned by [`get_logger`][mkdocs_manpage.logger.get_logger].
+
+    Returns:
+        Whether debug messages are enabled.
+    """
+    return logger.isEnabledFor(logging.DEBUG)
@@ -0,0 +1,114 @@
+"""Manifest of the inputs of generated manpages, to regenerate only manpages whose inputs changed."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING
+
+from mkdocs_manpage.logger import get_logger
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+logger = get_logger(__name__)
+
+default_manifest = ".manpages.json"
+"""The default path of the manifest, relative to the MkDocs configuration file."""
+timings_file = ".manpages-timings.json"
+"""The file recording the timings of the last build, next to the MkDocs configuration file."""
+
+
+def source_hash(content: bytes) -> str:
+    """Hash the contents of a source file.
+
+    Parameters:
+        content: The file contents.
+
+    Returns:
+        The hash, as an hexadecimal string.
+    """
+    return hashlib.sha256(content).hexdigest()
+
+
+@dataclass
+class ManifestEntry:
+    """The state of the inputs of a manpage when it was generated."""
+
+    config: str
+    """A hash of the options used to generate the manpage."""
+    inputs: dict[str, str] = field(default_factory=dict)
+    """The hash of each input source file, by URI."""
+    names: list[tuple[str, str]] = field(default_factory=list, compare=False)
+    """The name and section of the manpage and of its parts, as written in the whatis index.
+
+    They are not compared: they are resolved when the manpage is generated, to keep the index entries
+    of manpages that are not generated again.
+    """
+
+
+def read_manifest(path: Path) -> dict[str, ManifestEntry]:
+    """Read a manifest.
+
+    Parameters:
+        path: The manifest path.
+
+    Returns:
+        The manifest entries, by manpage output path (relative to the MkDocs configuration file).
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf8"))
+        return {
+            output: ManifestEntry(
+                entry["config"],
+                dict(entry["inputs"]),
+                [(name, section) for name, section in entry.get("names", [])],
+            )
+            for output, entry in data.items()
+        }
+    except FileNotFoundError:
+        return {}
+    except (ValueError, KeyError, TypeError, AttributeError) as error:
+        logger.warning(f"Ignoring invalid manifest {path}: {error!r}")
+        return {}
+
+
+def write_manifest(path: Path, entries: dict[str, ManifestEntry]) -> None:
+    """Write a manifest, sorted by manpage output path.
+
+    Parameters:
+        path: The manifest path.
+        entries: The manifest entries, by manpage output path (relative to the MkDocs configuration file).
+    """
+    data = {output: asdict(entries[output]) for output in sorted(entries)}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n", encoding="utf8")
+
+
+def write_timings(path: Path, timings: dict[str, float]) -> None:
+    """Record the timings of the last build, as reported by `mkdocs-manpage --debug-info`.
+
+    Parameters:
+        path: The timings file.
+        timings: Durations of the build steps, in seconds.
+    """
+    path.write_text(json.dumps({"time": time.time(), **timings}) + "\n", encoding="utf8")
+
+
+def read_timings(path: Path) -> dict[str, float]:
+    """Read the timings of the last build.
+
+    Parameters:
+        path: The timings file.
+
+    Returns:
+        Durations of the build steps, in seconds, and the time at which they were recorded.
+        Empty if no build recorded its timings.
+    """
+    try:
+        return json.loads(path.read_text(encoding="utf8"))
+    except (OSError, ValueError):
+        return {}
@@ -2,25 +2,66 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import datetime as dt
 import fnmatch
-import subprocess
+import json
+import os
 import tempfile
+import time
 from collections import defaultdict
-from datetime import date
-from importlib import metadata
+from contextlib import nullcontext
+from functools import partial
+from html import escape
+from itertools import islice
 from pathlib import Path
-from shutil import which
 from typing import TYPE_CHECKING
 
+from mkdocs.config import load_config
 from mkdocs.config.defaults import MkDocsConfig
 from mkdocs.exceptions import PluginError
 from mkdocs.plugins import BasePlugin
-
-from mkdocs_manpage.config import PluginConfig
+from mkdocs.structure.files import get_files
+
+from mkdocs_manpage.assembly import assemble_html, split_budget, split_chunks, write_html
+from mkdocs_manpage.cache import Cache, parse_size
+from mkdocs_manpage.config import PageConfig, PluginConfig
+from mkdocs_manpage.convert import (
+    Limits,
+    catman_output,
+    find_groff,
+    find_pandoc,
+    format_output,
+    merge_document_files,
+    merge_documents,
+    pandoc_version,
+    run_sync,
+    write_output,
+)
+from mkdocs_manpage.debug import get_version
+from mkdocs_manpage.diagnostics import profile_pages, report
+from mkdocs_manpage.engine import Engine
+from mkdocs_manpage.filters import DedupFilter, normalize_html, prune_html
+from mkdocs_manpage.links import LinkFilter, LinkIndex
 from mkdocs_manpage.logger import get_logger
-from mkdocs_manpage.preprocess import preprocess
+from mkdocs_manpage.manifest import (
+    ManifestEntry,
+    read_manifest,
+    source_hash,
+    timings_file,
+    write_manifest,
+    write_timings,
+)
+from mkdocs_manpage.preprocess import Preprocessor, is_path, source_file, split_spec
+from mkdocs_manpage.preview import preview_command, preview_dir, preview_html, write_previews
+from mkdocs_manpage.render import ManpageMetadata
+from mkdocs_manpage.reproducible import last_modified, normalize_output, release_version, source_date_epoch
+from mkdocs_manpage.shards import ShardPage, read_shard, write_shard
+from mkdocs_manpage.whatis import first_paragraph, read_index, write_index
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable, MutableMapping
     from typing import Any
 
     from mkdocs.config.defaults import MkDocsConfig
@@ -31,30 +72,14 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
-def _log_pandoc_output(output: str) -> None:
-    for line in output.split("\n"):
-        if line.strip():
-            logger.debug(f"pandoc: {line.strip()}")
-
-
-section_headers = {
-    "1": "User Commands",
-    "2": "System Calls Manual",
-    "3": "Library Functions Manual",
-    "4": "Kernel Interfaces Manual",
-    "5": "File Formats Manual",
-    "6": "Games Manual",
-    "7": "Miscellaneous Information Manual",
-    "8": "System Administration",
-    "9": "Kernel Routines",
-}
-
-
 class MkdocsManpagePlugin(BasePlugin[PluginConfig]):
     """The MkDocs plugin to generate manpages.
 
     This plugin defines the following event hooks:
 
+    - `on_startup`
+    - `on_config`
+    - `on_files`
     - `on_page_content`
     - `on_post_build`
 
@@ -66,22 +91,56 @@ class MkdocsManpagePlugin(BasePlugin[PluginConfig]):
 
     def __init__(self) -> None:  # noqa: D107
         self.html_pages: dict[str, dict[str, str]] = defaultdict(dict)
-
-    def _expand_inputs(self, inputs: list[str], page_uris: list[str]) -> list[str]:
+        self.page_meta: dict[str, MutableMapping[str, Any]] = {}
+        self.page_sources: dict[str, str] = {}
+        self.page_urls: dict[str, str] = {}
+        self.page_titles: dict[str, str] = {}
+        self.link_index = LinkIndex()
+        self.cache: Cache | None = None
+        self.preprocessor: Preprocessor | None = None
+        self._preprocess_key: str | None = None
+        self.previews: dict[str, str] = {}
+        self._serving = False
+        self._manifest: dict[str, ManifestEntry] = {}
+        self._skipped: set[str] = set()
+        self._parts: dict[str, list[PageConfig]] = {}
+        self._indexes: dict[str, str] = {}
+        self._shard_uris: list[str] = []
+        self.manpage_metadata: dict[str, ManpageMetadata] = {}
+
+    def _expand_inputs(self, output: str, inputs: list[str], page_uris: list[str]) -> list[str]:
         expanded: list[str] = []
         for input_file in inputs:
             if "*" in input_file:
-                expanded.extend(fnmatch.filter(page_uris, input_file))
+                matches = fnmatch.filter(page_uris, input_file)
+                # Nodes of distributed builds only render some of the pages.
+                if not matches and not self.config.shard:
+                    raise PluginError(f"Input pattern {input_file} of manpage {output} matches no pages")
+                expanded.extend(matches)
             else:
                 expanded.append(input_file)
         return expanded
 
+    def on_startup(self, *, command: str, dirty: bool) -> None:  # noqa: ARG002
+        """Remember whether the site is being served.
+
+        Hook for the [`on_startup` event](https://www.mkdocs.org/user-guide/plugins/#on_startup).
+        Defining this hook also keeps the plugin instance across rebuilds of `mkdocs serve`,
+        so that manpage previews are only rendered again when manpages change.
+
+        Parameters:
+            command: The MkDocs command being run.
+            dirty: Whether the `--dirty` option was passed.
+        """
+        self._serving = command == "serve"
+
     def on_config(self, config: MkDocsConfig) -> MkDocsConfig | None:
         """Save the global MkDocs configuration.
 
         Hook for the [`on_config` event](https://www.mkdocs.org/user-guide/plugins/#on_config).
         In this hook, we save the global MkDocs configuration into an instance variable,
-        to re-use it later.
+        to re-use it later, we reset the pages recorded in previous builds (when serving),
+        and we set up the cache.
 
         Arguments:
             config: The MkDocs config object.
@@ -90,13 +149,41 @@ class MkdocsManpagePlugin(BasePlugin[PluginConfig]):
             The same, untouched config.
         """
         self.mkdocs_config = config
+        self.html_pages.clear()
+        self.page_meta.clear()
+        self.page_sources.clear()
+        self.page_urls.clear()
+        self.page_titles.clear()
+        self._shard_uris = []
+        self.link_index = LinkIndex()
+        for page in self.config.pages:
+            if page["max_size"] is not None:
+                try:
+                    page["max_size"] = parse_size(page["max_size"])
+                except ValueError as error:
+                    raise PluginError(f"Invalid max_size of manpage {page['output']}: {page['max_size']!r}") from error
+        self.preprocessor = Preprocessor(self.config.preprocess) if self.config.preprocess else None
+        self._preprocess_key = None
+        self.cache = None
+        if self.config.cache:
+            cache_dir = os.getenv("MKDOCS_MANPAGE_CACHE_DIR") or self.config.cache_dir
+            try:
+                max_size = parse_size(str(self.config.cache_max_size)) or None
+            except ValueError as error:
+                raise PluginError(f"Invalid cache_max_size: {self.config.cache_max_size!r}") from error
+            self.cache = Cache(Path(config.config_file_path).parent.joinpath(cache_dir), max_size=max_size)
+            if not self.cache.is_marked:
+                raise PluginError(
+                    f"Cache directory {self.cache.directory} is not empty and not marked with a CACHEDIR.TAG file",
+                )
         return config
 
     def on_files(self, files: Files, *, config: MkDocsConfig) -> Files | None:  # noqa: ARG002
         """Expand inputs for manual pages.
 
         Hook for the [`on_files` event](https://www.mkdocs.org/user-guide/plugins/#on_files).
-        In this hook we expand inputs for each manual pages (glob patterns using `*`).
+        In this hook we expand inputs for each manual pages (glob patterns using `*`),
+        against the files of the site and the pages loaded from shards.
 
         Parameters:
             files: The collection of MkDocs files.
@@ -105,15 +192,81 @@ class MkdocsManpagePlugin(BasePlugin[PluginConfig]):
         Returns:
             Modified collection or none.
         """
+        # Pages loaded from shards include pages generated by other plugins on other nodes.
+        page_uris = list(dict.fromkeys([*files.src_uris, *self._shard_uris]))
         for manpage in self.config.pages:
-            manpage["inputs"] = self._expand_inputs(manpage["inputs"], page_uris=list(files.src_uris.keys()))
+            manpage["inputs"] = self._expand_inputs(manpage["output"], manpage["inputs"], page_uris=page_uris)
+        self._skipped = set()
+        if self.config.changed_only:
+            self._check_manifest(files)
         return files
 
+    @property
+    def manpages(self) -> list[PageConfig]:
+        """The manual pages to generate in this build, including parts of split manual pages."""
+        pages = []
+        for page in self.config.pages:
+            if page["output"] not in self._skipped:
+                pages.append(page)
+                pages.extend(self._parts.get(page["output"], ()))
+        return pages
+
+    def _manifest_path(self) -> Path:
+        return Path(self.mkdocs_config.config_file_path).parent.joinpath(self.config.manifest)
+
+    def _relative_output(self, output: str) -> str:
+        return Path(os.path.relpath(output, Path(self.mkdocs_config.config_file_path).parent)).as_posix()
+
+    def _manifest_entry(self, page: PageConfig, files: Files) -> ManifestEntry:
+        # Manpages are also generated again when their options, or the code of pre-processing functions, change.
+        # This includes options changing how pages are pre-processed (one at a time or all at once),
+        # and the site name, which is the default title of manpages.
+        names = (
+            "preprocess",
+            "prune",
+            "normalize",
+            "cross_references",
+            "reproducible",
+            "footer",
+            "low_memory",
+            "cache",
+            "preprocess_pages",
+        )
+        options = {name: self.config[name] for name in names}
+        options["site_name"] = self.mkdocs_config.site_name
+        page_options = {**page, "output": self._relative_output(page["output"])}
+        sources = [source for source in map(source_file, self.config.preprocess) if source and source.is_file()]
+        config = Cache.key(get_version(), json.dumps([page_options, options], sort_keys=True, default=str), *sources)
+        inputs = {
+            uri: source_hash(files.src_uris[uri].content_bytes) for uri in page["inputs"] if uri in files.src_uris
+        }
+        return ManifestEntry(config, inputs)
+
+    def _check_manifest(self, files: Files) -> None:
+        previous = read_manifest(self._manifest_path())
+        self._manifest = {}
+        for page in self.config.pages:
+            key = self._relative_output(page["output"])
+            entry = self._manifest[key] = self._manifest_entry(page, files)
+            output_file = Path(page["output"])
+            outputs = [format_output(output_file, to) for to in page["formats"]]
+            if page["catman"] and "man" in page["formats"]:
+                outputs.append(catman_output(output_file))
+            if previous.get(key) == entry and all(output.exists() for output in outputs):
+                logger.info(f"Inputs of manpage {key} did not change, keeping previous output")
+                self._skipped.add(page["output"])
+                # The previous entry holds the names of the manpage, that are not resolved again.
+                self._manifest[key] = previous[key]
+
     def on_page_content(self, html: str, *, page: Page, **kwargs: Any) -> str | None:  # noqa: ARG002
         """Record pages contents.
 
         Hook for the [`on_page_content` event](https://www.mkdocs.org/user-guide/plugins/#on_page_content).
-        In this hook we simply record the HTML of the pages into a dictionary whose keys are the pages' URIs.
+        In this hook we record the HTML of the pages into a dictionary whose keys are the pages' URIs,
+        after pruning it according to the `prune` option, and normalizing code blocks and tables
+        unless `normalize` is disabled. We also index the headings of the pages,
+        to resolve links between pages later. Pages are not recorded for manpages
+        that are not generated again in `changed_only` mode.
 
         Parameters:
             html: The page HTML.
@@ -121,73 +274,583 @@ class MkdocsManpagePlugin(BasePlugin[PluginConfig]):
         """
         if not self.config.enabled:
             return None
-        for manpage in self.config.pages:
-            if page.file.src_uri in manpage["inputs"]:
-                logger.debug(f"Adding page {page.file.src_uri} to manpage {manpage['output']}")
-                self.html_pages[manpage["output"]][page.file.src_uri] = html
+        uri = page.file.src_uri
+        outputs = [manpage["output"] for manpage in self.config.pages if uri in manpage["inputs"]]
+        if outputs:
+            recorded = html
+            if any(output not in self._skipped for output in outputs):
+                recorded = prune_html(html, self.config.prune) if self.config.prune else html
+                if self.config.normalize:
+                    recorded = normalize_html(recorded)
+            self._record(
+                uri,
+                recorded,
+                outputs,
+                url=page.url,
+                title=page.title or uri,
+                meta=page.meta,
+                source=page.file.abs_src_path,
+                page_html=html,
+            )
         return html
 
+    def _record(
+        self,
+        uri: str,
+        html: str,
+        outputs: list[str],
+        *,
+        url: str,
+        title: str,
+        meta: MutableMapping[str, Any],
+        source: str | None,
+        page_html: str | None = None,
+    ) -> None:
+        for output in outputs:
+            if output not in self._skipped:
+                logger.debug("Adding page %s to manpage %s", uri, output)
+                self.html_pages[output][uri] = html
+        self.page_meta[uri] = meta
+        self.page_titles[uri] = title
+        if source:
+            self.page_sources[uri] = source
+        if self.config.cross_references:
+            self.page_urls[uri] = url
+            self.link_index.add_page(url, outputs, page_html or html)
+
+    def load_shards(self, shards: Iterable[Path]) -> None:
+        """Record pages from shards exported by other builds, as if they were rendered in this build.
+
+        Parameters:
+            shards: The shard files (see the `shard` option).
+        """
+        config_dir = Path(self.mkdocs_config.config_file_path).parent
+        docs_dir = Path(self.mkdocs_config.docs_dir)
+        for shard in shards:
+            count = 0
+            for page in read_shard(shard):
+                # Output paths are made absolute the same way MkDocs does it for the `output` option.
+                outputs = [os.path.abspath(config_dir / output) for output in page.outputs]
+                source = docs_dir / page.uri
+                source_path = str(source) if source.is_file() else None
+                self._record(
+                    page.uri,
+                    page.html,
+                    outputs,
+                    url=page.url,
+                    title=page.title,
+                    meta=page.meta,
+                    source=source_path,
+                )
+                self._shard_uris.append(page.uri)
+                count += 1
+            logger.info(f"Loaded {count} pages from shard {shard}")
+
+    def _export_shard(self, path: Path) -> None:
+        pages: dict[str, tuple[str, list[str]]] = {}
+        for output, recorded in self.html_pages.items():
+            for uri, html in recorded.items():
+                pages.setdefault(uri, (html, []))[1].append(self._relative_output(output))
+        shard_pages = (
+            ShardPage(
+                uri=uri,
+                url=self.page_urls.get(uri, ""),
+                title=self.page_titles.get(uri, uri),
+                outputs=outputs,
+                html=html,
+                meta=dict(self.page_meta.get(uri, {})),
+            )
+            for uri, (html, outputs) in pages.items()
+        )
+        count = write_shard(path, shard_pages)
+        logger.info(f"Exported {count} pages to shard {path}")
+
     def on_post_build(self, config: MkDocsConfig, **kwargs: Any) -> None:  # noqa: ARG002
         """Combine all recorded pages contents and convert it to a manual page with Pandoc.
 
         Hook for the [`on_post_build` event](https://www.mkdocs.org/user-guide/plugins/#on_post_build).
         In this hook we concatenate all previously recorded HTML, and convert it to a manual page with Pandoc.
+        Links between pages are first rewritten into cross-references, unless `cross_references` is disabled.
+        With `dedup` enabled, blocks repeated across the inputs of a manual page are replaced by references.
+        With `low_memory` enabled, input pages are pre-processed and written to a temporary file one at a time,
+        and Pandoc reads and writes files instead of in-memory strings.
+        The HTML of each manual page is parsed only once, then written to each configured format.
+        Manpages whose HTML is larger than their `max_size` are reported, and with `split` enabled,
+        they are split at input pages into numbered parts, the manpage itself becoming an index of the parts.
+        With `chunks` greater than one, the inputs of a manual page are split into chunks of similar sizes,
+        parsed in parallel, and the parsed documents are merged before being written.
+        Parsing and writing are run concurrently by an asynchronous [engine][mkdocs_manpage.engine.Engine],
+        with at most `jobs` concurrent Pandoc processes.
+        When a conversion fails and `fail_fast` is enabled (by default when building in strict mode),
+        running conversions are cancelled and the build is aborted.
+        With `diagnose` enabled, each input page is first converted separately to report its conversion time.
+        Pre-formatted manpages are then rendered for manpages that changed since the previous build,
+        and the whatis index is updated.
+        In `changed_only` mode, manpages whose inputs did not change are skipped,
+        and the manifest of generated manpages is updated.
+        When serving the site with `preview` enabled, manpages that changed are also rendered to HTML,
+        and previews of all manpages are served at `/manpages/`.
 
         Parameters:
             config: MkDocs configuration.
         """
         if not self.config.enabled:
             return
-        pandoc = which("pandoc")
-        if pandoc is None:
-            logger.debug("Could not find pandoc executable, trying to call 'pandoc' directly")
-            pandoc = "pandoc"
+        if self.config.shard:
+            # Manpages are generated later, from the shards of all nodes (see `merge_shards`).
+            self._export_shard(Path(self.config.shard))
+            return
+        timings = {}
+        start = time.perf_counter()
+        self._split()
+        self._resolve_metadata()
+        workdir_context = tempfile.TemporaryDirectory(prefix="mkdocs_manpage_") if self.config.low_memory else None
+        with workdir_context or nullcontext() as workdir:
+            htmls = [
+                self._assemble(page, Path(workdir, str(index)) if workdir else None)
+                for index, page in enumerate(self.manpages)
+            ]
+            timings["assembly"] = time.perf_counter() - start
+
+            if self.config.diagnose:
+                self._diagnose()
+
+            fail_fast = config.strict if self.config.fail_fast is None else self.config.fail_fast
+            conversion_start = time.perf_counter()
+            failed = self._convert(config, htmls, fail_fast=fail_fast)
+            timings["conversion"] = time.perf_counter() - conversion_start
+
+            if self.config.whatis:
+                self._update_whatis(Path(config.config_file_path).parent.joinpath(self.config.whatis), htmls)
+
+            if self.config.changed_only:
+                self._update_manifest(failed)
+
+            if self._serving and self.config.preview:
+                outputs = {page["output"] for page in (*self.config.pages, *self.manpages)}
+                self.previews = {output: html for output, html in self.previews.items() if output in outputs}
+                write_previews(Path(config.site_dir), self.previews)
+                logger.info(f"Manpage previews available at {config.site_url or '/'}{preview_dir}/")
+        timings["total"] = time.perf_counter() - start
+        write_timings(Path(config.config_file_path).parent.joinpath(timings_file), timings)
+
+        if self.cache:
+            self._log_cache_stats()
+            self.cache.record_stats()
+            self.cache.evict()
+
+    def _update_manifest(self, failed: set[str]) -> None:
+        # Manpages that failed are left out, to be generated again in the next build.
+        path = self._manifest_path()
+        previous = read_manifest(path)
+        manifest = {}
+        for page in self.config.pages:
+            key = self._relative_output(page["output"])
+            if page["output"] in self._skipped:
+                manifest[key] = previous.get(key, self._manifest[key])
+                continue
+            pages = [page, *self._parts.get(page["output"], ())]
+            if not {manpage["output"] for manpage in pages} & failed:
+                manifest[key] = self._manifest[key]
+                manifest[key].names = [
+                    (self.manpage_metadata[manpage["output"]].name, self.manpage_metadata[manpage["output"]].section)
+                    for manpage in pages
+                    if "man" in manpage["formats"]
+                ]
+        write_manifest(path, manifest)
 
+    def _split(self) -> None:
+        # Split manpages whose HTML is larger than their maximum size into parts, at input pages.
+        self._parts = {}
+        self._indexes = {}
         for page in self.config.pages:
+            if page["max_size"] is None or page["output"] in self._skipped:
+                continue
+            recorded = self.html_pages[page["output"]]
+            sizes = [len(recorded.get(uri, "").encode()) for uri in page["inputs"]]
+            if sum(sizes) <= page["max_size"]:
+                continue
+            counts = split_budget(sizes, page["max_size"])
+            message = f"Manpage {page['output']} has {sum(sizes)} bytes of HTML, more than its max_size"
+            if not page["split"] or len(counts) < 2:  # noqa: PLR2004
+                logger.warning(f"{message} of {page['max_size']} bytes")
+                continue
+            logger.warning(f"{message}, splitting it into {len(counts)} parts")
+            output = Path(page["output"])
+            section = output.suffix[1:]
+            inputs = iter(page["inputs"])
+            parts = []
+            items = []
+            for number, count in enumerate(counts, 1):
+                part = copy.copy(page)
+                part["title"] = f"{output.stem}-{number}"
+                # Parts are named after their output file, and described by their first paragraph.
+                part["name"] = None
+                part["description"] = None
+                part["output"] = str(output.with_name(f"{part['title']}{output.suffix}"))
+                part["inputs"] = list(islice(inputs, count))
+                self.html_pages[part["output"]] = {uri: recorded[uri] for uri in part["inputs"] if uri in recorded}
+                for uri in part["inputs"]:
+                    if uri in self.page_urls:
+                        self.link_index.move_page(self.page_urls[uri], page["output"], part["output"])
+                titles = ", ".join(escape(self.page_titles.get(uri, uri), quote=False) for uri in part["inputs"])
+                items.append(f"<li><strong>{escape(part['title'])}</strong>({escape(section)}): {titles}</li>")
+                parts.append(part)
+            self._parts[page["output"]] = parts
+            self._indexes[page["output"]] = (
+                f"<h1>Description</h1><p>This manual page is split into several parts:</p><ul>{''.join(items)}</ul>"
+            )
+
+    def _assemble(self, page: PageConfig, workfile: Path | None) -> list[str | Path]:
+        # Return the HTML of each chunk, in memory or written to files named after `workfile`.
+        if page["output"] in self._indexes:
+            return [self._indexes[page["output"]]]
+        recorded = self.html_pages[page["output"]]
+        for input_page in page["inputs"]:
+            if input_page not in recorded:
+                raise PluginError(f"Input page {input_page} of manpage {page['output']} was not rendered")
+        pages: Iterable[str] = (recorded[input_page] for input_page in page["inputs"])
+
+        if self.config.cross_references:
+            links = LinkFilter(self.link_index, page["output"], self._manpage_names())
+            pages = (links.rewrite(recorded[input_page], self.page_urls[input_page]) for input_page in page["inputs"])
+
+        dedup = DedupFilter() if page["dedup"] else None
+        if dedup:
+            pages = map(dedup.filter, pages)
+
+        per_page = workfile is not None or self.config.preprocess_pages
+        if per_page and self.preprocessor:
+            # Input pages are pre-processed one at a time, to write them one at a time,
+            # or when users ask for it, so that the result of each page is cached.
+            preprocessor = self.preprocessor
+            pages = (self._preprocess(preprocessor, page_html, page["output"]) for page_html in pages)
+
+        # Chunks are consumed in order from the same iterator, so that filters see every page once.
+        pages = iter(pages)
+        sizes = [len(recorded[input_page]) for input_page in page["inputs"]]
+        if self.cache and (per_page or not self.preprocessor):
+            # Pages are parsed separately, so that the parsed pages shared by several manpages or sites are cached.
+            # Merging the parsed pages gives the same output as parsing them at once (see `merge_documents`).
+            counts = [1] * len(sizes) or [0]
+        else:
+            counts = split_chunks(sizes, page["chunks"]) or [0]
+        chunks: list[str | Path] = []
+        for number, count in enumerate(counts, 1):
+            chunk_pages = islice(pages, count)
+            if workfile is None:
+                html = assemble_html(chunk_pages)
+                if self.preprocessor and not per_page:
+                    html = self._preprocess(self.preprocessor, html, page["output"])
+                chunks.append(html)
+            else:
+                name = f"{workfile.name}.html" if len(counts) == 1 else f"{workfile.name}-{number}.html"
+                chunks.append(write_html(chunk_pages, workfile.with_name(name)))
+
+        if dedup:
+            saved = f"saving {dedup.saved} bytes"
+            logger.info(f"Replaced {dedup.replaced} repeated blocks in {page['output']}, {saved}")
+        return chunks
+
+    def _manpage_names(self) -> dict[str, str]:
+        # Cross-references use the resolved names of manpages, as in their header and in the whatis index.
+        # Manpages skipped in `changed_only` mode are not resolved again: their names are read from the manifest.
+        names = {output: metadata.name for output, metadata in self.manpage_metadata.items()}
+        for page in self.config.pages:
+            entry = self._manifest.get(self._relative_output(page["output"]))
+            if page["output"] in self._skipped and entry and entry.names:
+                names[page["output"]] = entry.names[0][0]
+        return names
+
+    def _log_cache_stats(self) -> None:
+        cache = self.cache
+        if cache is None or not (cache.hits or cache.misses):
+            return
+        rate = cache.hits / (cache.hits + cache.misses)
+        logger.info(f"Cache: {cache.hits} hits, {cache.misses} misses ({rate:.0%} hit rate)")
+
+    def _preprocess(self, preprocessor: Preprocessor, html: str, output: str) -> str:
+        if self.cache is None:
+            return preprocessor(html, output)
+        if self._preprocess_key is None:
+            # Pre-processed HTML is invalidated when the modules defining pre-processing functions change.
+            # Changes to the modules they import are not detected: users bump `cache_salt` instead.
+            # Modules given by path are identified by their contents, so that sites in other directories share entries.
+            parts: list[str | Path] = [self.config.cache_salt]
+            for spec in preprocessor.specs:
+                parts.append(split_spec(spec)[1] if is_path(spec) else spec)
+                source = source_file(spec)
+                if source and source.is_file():
+                    parts.append(source)
+            self._preprocess_key = Cache.key(*parts)
+        key = Cache.key(self._preprocess_key, self._relative_output(output), html)
+        return self.cache.cached("preprocess", key, partial(preprocessor, html, output))
+
+    def _key(self, *parts: str | Path) -> str | None:
+        return Cache.key(self.config.cache_salt, *parts) if self.cache else None
+
+    async def _cached(
+        self,
+        namespace: str,
+        key: str | None,
+        compute: Callable[[], Awaitable[Any]],
+        destination: Path | None = None,
+    ) -> Any:
+        if self.cache is None or key is None:
+            return await compute()
+        if destination is not None:
+            if not self.cache.get_file(namespace, key, destination):
+                self.cache.set_file(namespace, key, await compute())
+            return destination
+        value = self.cache.get(namespace, key)
+        if value is None:
+            value = await compute()
+            self.cache.set(namespace, key, value)
+        return value
+
+    def _resolve_metadata(self) -> None:
+        # Metadata is resolved once per build, then passed as is to conversion steps.
+        today = dt.date.today()  # noqa: DTZ011
+        version = get_version()
+        epoch = source_date_epoch() if self.config.reproducible else None
+        footer = (
+            self.config.footer or f"mkdocs-manpage v{release_version(version) if self.config.reproducible else version}"
+        )
+        parts = {part["output"] for page_parts in self._parts.values() for part in page_parts}
+        self.manpage_metadata = {}
+        for page in self.manpages:
+            output = Path(page["output"])
+            meta = self.page_meta.get(page["inputs"][0], {}) if page["inputs"] else {}
+            # The front-matter of the first input page can override options, except for parts of split manpages.
+            overrides = meta.get("manpage") if page["output"] not in parts else None
+            if not isinstance(overrides, dict):
+                overrides = {}
+            date = today
+            if self.config.reproducible:
+                sources = [self.page_sources[uri] for uri in page["inputs"] if uri in self.page_sources]
+                source_date = epoch or last_modified(sources)
+                if source_date is None:
+                    logger.warning(f"Could not determine the date of manpage {page['output']} from its inputs")
+                date = source_date or today
+            authors = overrides.get("authors") or page["authors"] or meta.get("authors") or meta.get("author") or []
+            description = overrides.get("description") or page["description"] or meta.get("description") or ""
+            self.manpage_metadata[page["output"]] = ManpageMetadata.resolve(
+                str(overrides.get("title") or page["title"] or self.mkdocs_config.site_name),
+                output.suffix[1:],
+                name=str(overrides.get("name") or page["name"] or output.stem),
+                header=overrides.get("header") or page["header"],
+                date=date,
+                footer=overrides.get("footer") or footer,
+                description=" ".join(str(description).split()),
+                authors=[authors] if isinstance(authors, str) else map(str, authors),
+            )
+
+    def _convert(
+        self,
+        config: MkDocsConfig,
+        htmls: list[list[str | Path]],
+        *,
+        fail_fast: bool,
+    ) -> set[str]:
+        # Conversion steps are run by an asynchronous engine, in one task per manpage:
+        # parsing (each chunk), then writing each format, then rendering pre-formatted manpages.
+        pandoc = find_pandoc()
+        engine = Engine(pandoc=pandoc, groff=find_groff(), jobs=self.config.jobs)
+        version = pandoc_version(pandoc) if self.cache else ""
+        failed = set()
+        total = sum(len(page["formats"]) for page in self.manpages)
+        preview = self._serving and self.config.preview
+        done = 0
+
+        async def run(step: str, page: PageConfig, conversion: Awaitable[Any]) -> Any:
             try:
-                html = "\n\n".join(self.html_pages[page["output"]][input_page] for input_page in page["inputs"])
-            except KeyError as error:
-                raise PluginError(str(error)) from error
-
-            if self.config.get("preprocess"):
-                html = preprocess(html, self.config["preprocess"], page["output"])
-
-            output_file = Path(config.config_file_path).parent.joinpath(page["output"])
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            section = output_file.suffix[1:]
-            section_header = page.get("header", section_headers.get(section, section_headers["1"]))
-            title = page.get("title", self.mkdocs_config.site_name)
-
-            with tempfile.NamedTemporaryFile("w", prefix="mkdocs_manpage_", suffix=".1.html", encoding="utf8") as temp_file:
-                temp_file.write(html)
-                pandoc_variables = [
-                    f"title:{title}",
-                    f"section:{section}",
-                    f"date:{date.today().strftime('%Y-%m-%d')}",  # noqa: DTZ011
-                    f"footer:mkdocs-manpage v{metadata.version('mkdocs-manpage')}",
-                    f"header:{section_header}",
-                ]
-                pandoc_options = [
-                    "--verbose",
-                    "--standalone",
-                    "--wrap=none",
-                ]
-                pandoc_command = [
-                    pandoc,
-                    *pandoc_options,
-                    *[f"-V{var}" for var in pandoc_variables],
-                    "--to",
-                    "man",
-                    temp_file.name,
-                    "-o",
-                    str(output_file),
-                ]
-                pandoc_process = subprocess.run(  # noqa: S603
-                    pandoc_command,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    check=False,
+                return await conversion
+            except PluginError as error:
+                message = f"Failed {step}: {error} (largest input pages: {self._largest_inputs(page)})"
+                if fail_fast:
+                    raise PluginError(message) from error
+                logger.warning(message)
+                failed.add(page["output"])
+                return None
+
+        async def convert(page: PageConfig, chunks: list[str | Path]) -> None:
+            limits = Limits(timeout=page["timeout"], max_memory=page["max_memory"])
+            keys = [self._key(version, html) for html in chunks]
+            document_key = keys[0] if len(keys) == 1 else self._key(*filter(None, keys))
+            steps = []
+            for number, (html, key) in enumerate(zip(chunks, keys)):
+                step = f"parsing {page['output']}"
+                if len(chunks) > 1:
+                    step = f"{step} (chunk {number + 1}/{len(chunks)})"
+                if isinstance(html, Path):
+                    document_file = html.with_suffix(".json")
+                    parse_file = partial(engine.parse_html_file, html, document_file, limits)
+                    steps.append(run(step, page, self._cached("parse_html_file", key, parse_file, document_file)))
+                else:
+                    parse = partial(engine.parse_html, html, limits)
+                    steps.append(run(step, page, self._cached("parse_html", key, parse)))
+            parsed = await asyncio.gather(*steps)
+            if any(document is None for document in parsed):
+                return
+            document = parsed[0]
+            if len(parsed) > 1:
+                # Documents are merged before being written, so that the manpage has a single preamble.
+                if isinstance(document, Path):
+                    document = merge_document_files(parsed, document.with_suffix(".merged.json"))
+                else:
+                    document = merge_documents(parsed)
+                logger.debug("Merged %d parsed chunks of manpage %s", len(parsed), page["output"])
+            Path(config.config_file_path).parent.joinpath(page["output"]).parent.mkdir(parents=True, exist_ok=True)
+            await asyncio.gather(*(write(page, document, document_key, to, limits) for to in page["formats"]))
+
+        async def write(
+            page: PageConfig,
+            document: str | Path,
+            document_key: str | None,
+            to: str,
+            limits: Limits,
+        ) -> None:
+            nonlocal done
+            output_file = format_output(Path(config.config_file_path).parent.joinpath(page["output"]), to)
+            variables = self.manpage_metadata[page["output"]].pandoc_variables()
+            key = self._key(document_key, to, *variables) if document_key else None
+            compute = partial(engine.write_document, document, to, variables, limits)
+            text = await run(f"writing {output_file}", page, self._cached("write_document", key, compute))
+            if text is None:
+                return
+            done += 1
+            if self.config.reproducible:
+                text = normalize_output(text)
+            written = write_output(output_file, text)
+            logger.info(f"[{done}/{total}] Generated manpage {output_file}")
+            if to == "man" and page["max_size"] is not None and len(text.encode()) > page["max_size"]:
+                logger.warning(
+                    f"Manpage {output_file} has {len(text.encode())} bytes, "
+                    f"more than its max_size of {page['max_size']} bytes",
                 )
-            _log_pandoc_output(pandoc_process.stdout)
-            logger.info(f"Generated manpage {output_file}")
+            renders = []
+            if to == "man" and preview and (written or page["output"] not in self.previews):
+                renders.append(render_preview(page, output_file, text, limits))
+            if to == "man" and page["catman"]:
+                catman_file = catman_output(output_file)
+                if written or not catman_file.exists():
+                    renders.append(render_catman(page, catman_file, text, limits))
+                else:
+                    logger.debug("Manpage %s did not change, keeping %s", output_file, catman_file)
+            await asyncio.gather(*renders)
+
+        async def render_preview(page: PageConfig, output_file: Path, roff: str, limits: Limits) -> None:
+            async def compute() -> str:
+                output = await engine.run(*preview_command(engine.pandoc, engine.groff, roff, limits), limits)
+                return preview_html(output, engine.groff)
+
+            key = self._key(version, engine.groff or "", roff)
+            html = await run(f"previewing {output_file}", page, self._cached("render_preview", key, compute))
+            if html is not None:
+                self.previews[page["output"]] = html
+                logger.debug("Rendered preview of manpage %s", page["output"])
+
+        async def render_catman(page: PageConfig, catman_file: Path, roff: str, limits: Limits) -> None:
+            key = self._key(version, engine.groff or "", roff)
+            compute = partial(engine.render_catman, roff, limits)
+            text = await run(f"rendering {catman_file}", page, self._cached("render_catman", key, compute))
+            if text is not None:
+                catman_file.parent.mkdir(parents=True, exist_ok=True)
+                catman_file.write_text(text, encoding="utf8")
+                logger.info(f"Generated formatted manpage {catman_file}")
+
+        async def convert_all() -> None:
+            tasks = [asyncio.ensure_future(convert(page, chunks)) for page, chunks in zip(self.manpages, htmls)]
+            try:
+                await asyncio.gather(*tasks)
+            finally:
+                # When a conversion fails with `fail_fast`, the other ones are cancelled, killing their processes.
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        run_sync(convert_all())
+        return failed
+
+    def _diagnose(self) -> None:
+        pandoc = find_pandoc()
+        for page in self.manpages:
+            pages = {uri: self.html_pages[page["output"]][uri] for uri in page["inputs"]}
+            if self.preprocessor:
+                pages = {uri: self.preprocessor(html, page["output"]) for uri, html in pages.items()}
+            limits = Limits(timeout=page["timeout"], max_memory=page["max_memory"])
+            report(page["output"], profile_pages(pandoc, pages, jobs=self.config.jobs, limits=limits))
+
+    def _largest_inputs(self, page: PageConfig, count: int = 3) -> str:
+        sizes = {uri: len(html) for uri, html in self.html_pages[page["output"]].items()}
+        largest = sorted(sizes, key=sizes.__getitem__, reverse=True)[:count]
+        return ", ".join(f"{uri} ({sizes[uri]} bytes)" for uri in largest)
+
+    def _update_whatis(self, index_file: Path, htmls: list[list[str | Path]]) -> None:
+        index = read_index(index_file)
+        # Entries of manpages that are no longer generated are removed. Manpages skipped because
+        # their inputs did not change keep the entries recorded in the manifest, including their parts.
+        keys = {
+            (self.manpage_metadata[page["output"]].name, self.manpage_metadata[page["output"]].section)
+            for page in self.manpages
+            if "man" in page["formats"]
+        }
+        for page in self.config.pages:
+            if page["output"] in self._skipped:
+                keys.update(self._manifest[self._relative_output(page["output"])].names)
+        stale = [key for key in index if key not in keys]
+        for key in stale:
+            del index[key]
+        updated = bool(stale)
+        for page, chunks in zip(self.manpages, htmls):
+            html = chunks[0]
+            if "man" not in page["formats"]:
+                continue
+            # Descriptions are resolved again for every manpage, since they can change without changing
+            # the manpage itself. Only the first paragraph is read, and only entries that differ are rewritten.
+            metadata = self.manpage_metadata[page["output"]]
+            key = (metadata.name, metadata.section)
+            if metadata.description:
+                paragraph = ""
+            elif page["output"] in self._indexes:
+                # The index of a split manpage is described by the first paragraph of its first input,
+                # as the manpage would be without splitting.
+                recorded = self.html_pages[page["output"]]
+                paragraph = first_paragraph(recorded.get(page["inputs"][0], "")) if page["inputs"] else ""
+            elif isinstance(html, Path):
+                with html.open(encoding="utf8") as file:
+                    paragraph = first_paragraph(file)
+            else:
+                paragraph = first_paragraph(html)
+            description = metadata.description or paragraph or metadata.title
+            if index.get(key) != description:
+                index[key] = description
+                updated = True
+        if updated:
+            write_index(index_file, index)
+            logger.info(f"Updated whatis index {index_file}")
+
+
+def merge_shards(config_file: str | Path, shards: Iterable[Path]) -> None:
+    """Generate manpages from shards exported by builds distributed over several nodes.
+
+    No page is rendered: the recorded pages are loaded from the shards,
+    then manpages are assembled and converted as at the end of a build.
+
+    Parameters:
+        config_file: The MkDocs configuration file.
+        shards: The shard files exported by each node (see the `shard` option).
+
+    Raises:
+        PluginError: When the plugin is not enabled in the configuration.
+    """
+    config = load_config(str(config_file))
+    plugin = next((plugin for plugin in config.plugins.values() if isinstance(plugin, MkdocsManpagePlugin)), None)
+    if plugin is None:
+        raise PluginError(f"The manpage plugin is not enabled in {config_file}")
+    plugin.config["shard"] = None
+    plugin.on_config(config)
+    # Shards are loaded first, so that inputs are also expanded against the pages they contain.
+    plugin.load_shards(shards)
+    plugin.on_files(get_files(config), config=config)
+    plugin.on_post_build(config)
@@ -2,15 +2,26 @@
 
 from __future__ import annotations
 
+import os
 import sys
-from importlib.util import module_from_spec, spec_from_file_location
-from typing import TYPE_CHECKING
+from functools import cache
+from importlib import import_module
+from importlib.util import find_spec, module_from_spec, spec_from_file_location
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
 
 from mkdocs.exceptions import PluginError
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from types import ModuleType
 
+    from bs4 import BeautifulSoup
+
+
+PreprocessFunction = Callable[["BeautifulSoup", str], Any]
+"""Type of pre-processing functions: they modify the soup in place, and receive the manpage output path."""
+
 
 def _load_module(module_path: str) -> ModuleType:
     module_name = module_path.rsplit("/", 1)[-1].rsplit(".", 1)[-1]
@@ -24,33 +35,163 @@ def _load_module(module_path: str) -> ModuleType:
     raise RuntimeError("Spec or loader is null")
 
 
-def preprocess(html: str, module_path: str, output: str) -> str:
+def split_spec(spec: str) -> tuple[str, str]:
+    """Split a reference to a pre-processing function into a module and a function name.
+
+    Parameters:
+        spec: The reference to the function, like `scripts/preprocess.py` or `mypkg.docs:clean`.
+
+    Returns:
+        The module path or dotted path, and the function name (`preprocess` by default).
+    """
+    target, sep, attribute = spec.rpartition(":")
+    if sep and attribute.isidentifier():
+        return target, attribute
+    return spec, "preprocess"
+
+
+def is_path(spec: str) -> bool:
+    """Tell whether a pre-processing function is referenced by file path rather than by dotted path.
+
+    Parameters:
+        spec: The reference to the function, like `scripts/preprocess.py` or `mypkg.docs:preprocess`.
+
+    Returns:
+        Whether the reference is a file path.
+    """
+    target = split_spec(spec)[0]
+    return target.endswith(".py") or "/" in target or os.sep in target
+
+
+@cache
+def _load_function(spec: str, mtime: float | None) -> PreprocessFunction:  # noqa: ARG001
+    # The modification time of file modules is part of the cache key,
+    # so that modules edited while serving the documentation are loaded again.
+    target, attribute = split_spec(spec)
+    try:
+        module = _load_module(target) if is_path(spec) else import_module(target)
+    except Exception as error:
+        raise PluginError(f"Could not load module {target}: {error}") from error
+    try:
+        return getattr(module, attribute)
+    except AttributeError as error:
+        raise PluginError(f"Module {target} has no {attribute} function") from error
+
+
+def load_function(spec: str) -> PreprocessFunction:
+    """Load a pre-processing function, once per process (and modification of its file).
+
+    Parameters:
+        spec: The path of a Python module containing a `preprocess` function, like `scripts/preprocess.py`,
+            or the dotted path of an importable module, like `mypkg.docs`.
+            Another function name can be given after a colon, like `mypkg.docs:clean`.
+
+    Raises:
+        PluginError: When the module or function cannot be loaded.
+
+    Returns:
+        The pre-processing function.
+    """
+    if is_path(spec):
+        try:
+            mtime: float | None = Path(split_spec(spec)[0]).stat().st_mtime
+        except OSError as error:
+            raise PluginError(f"Could not load module: {error}") from error
+    else:
+        mtime = None
+    return _load_function(spec, mtime)
+
+
+def source_file(spec: str) -> Path | None:
+    """Return the file defining a pre-processing function.
+
+    Parameters:
+        spec: The reference to the function (see [`load_function`][mkdocs_manpage.preprocess.load_function]).
+
+    Returns:
+        The module file, if it could be found.
+    """
+    target = split_spec(spec)[0]
+    if is_path(spec):
+        return Path(target)
+    try:
+        module_spec = find_spec(target)
+    except (ImportError, ValueError):
+        return None
+    if module_spec and module_spec.origin and os.path.isfile(module_spec.origin):
+        return Path(module_spec.origin)
+    return None
+
+
+class Preprocessor:
+    """A pipeline of pre-processing functions.
+
+    Functions are loaded on first use, once per process, and are all applied to the same soup:
+    the HTML is parsed once and serialized once, whatever the number of functions.
+    Pre-processors only hold references to their functions,
+    so they can be pickled and sent to worker processes.
+    """
+
+    def __init__(self, specs: str | Sequence[str]) -> None:
+        """Initialize the pre-processor.
+
+        Parameters:
+            specs: References to the functions to apply, in order
+                (see [`load_function`][mkdocs_manpage.preprocess.load_function]).
+        """
+        self.specs = (specs,) if isinstance(specs, str) else tuple(specs)
+        """References to the functions to apply, in order."""
+
+    def __repr__(self) -> str:
+        return f"Preprocessor({list(self.specs)!r})"
+
+    @property
+    def functions(self) -> list[PreprocessFunction]:
+        """The functions to apply, in order."""
+        return [load_function(spec) for spec in self.specs]
+
+    def __call__(self, html: str, output: str) -> str:
+        """Pre-process HTML.
+
+        Parameters:
+            html: The HTML to process before conversion to a manpage.
+            output: The output path of the relevant manual page.
+
+        Raises:
+            PluginError: When the `preprocess` extra is not installed, or when a function fails.
+
+        Returns:
+            The processed HTML.
+        """
+        try:
+            from bs4 import BeautifulSoup  # noqa: PLC0415
+        except ImportError as error:
+            raise PluginError(
+                "mkdocs-manpage must be installed with the `preprocess` extra to use HTML pre-processing: "
+                "`pip install mkdocs-manpage[preprocess]",
+            ) from error
+        functions = self.functions
+        soup = BeautifulSoup(html, "lxml")
+        for spec, function in zip(self.specs, functions):
+            try:
+                function(soup, output)
+            except Exception as error:
+                raise PluginError(f"Could not pre-process HTML with {spec}: {error}") from error
+        return str(soup)
+
+
+def preprocess(html: str, module_path: str | Sequence[str], output: str) -> str:
     """Pre-process HTML with user-defined functions.
 
     Parameters:
         html: The HTML to process before conversion to a manpage.
-        module_path: The path of a Python module containing a `preprocess` function.
-            The function must accept one and only one argument called `soup`.
+        module_path: The path of a Python module containing a `preprocess` function,
+            the dotted path of a function, or a list of them (see [`Preprocessor`][mkdocs_manpage.preprocess.Preprocessor]).
+            Functions must accept two arguments: `soup` and `output`.
             The `soup` argument is an instance of [`bs4.BeautifulSoup`][].
         output: The output path of the relevant manual page.
 
     Returns:
         The processed HTML.
     """
-    try:
-        from bs4 import BeautifulSoup
-    except ImportError as error:
-        raise PluginError(
-            "mkdocs-manpage must be installed with the `preprocess` extra to use HTML pre-processing: "
-            "`pip install mkdocs-manpage[preprocess]",
-        ) from error
-    try:
-        module = _load_module(module_path)
-    except Exception as error:
-        raise PluginError(f"Could not load module: {error}") from error
-    soup = BeautifulSoup(html, "lxml")
-    try:
-        module.preprocess(soup, output)
-    except Exception as error:
-        raise PluginError(f"Could not pre-process HTML: {error}") from error
-    return str(soup)
+    return Preprocessor(module_path)(html, output)
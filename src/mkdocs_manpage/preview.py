@@ -0,0 +1,151 @@
+"""Preview of generated manual pages, served by `mkdocs serve`."""
+
+from __future__ import annotations
+
+import re
+from html import escape
+from pathlib import PurePath
+from typing import TYPE_CHECKING
+
+from mkdocs_manpage.convert import _run, catman_command, pandoc_command
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
+
+    from mkdocs_manpage.convert import Limits
+
+
+preview_dir = "manpages"
+"""The directory of the site in which previews are written, served at `/manpages/`."""
+
+_OVERSTRIKE_RE = re.compile(r"(?:(.)\x08\1)+|(?:_\x08.)+")
+
+_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>body {{ max-width: 60rem; margin: 2rem auto; font-family: monospace; }}</style>
+</head>
+<body>
+{body}
+</body>
+</html>
+"""
+
+
+def _overstrike(match: re.Match) -> str:
+    # Terminal output marks bold characters as `c\bc`, and underlined ones as `_\bc`.
+    text = match.group(0)
+    if match.group(1) is None:
+        return f"<i>{escape(text[2::3])}</i>"
+    return f"<b>{escape(text[::3])}</b>"
+
+
+def formatted_to_html(text: str) -> str:
+    """Convert a manual page formatted for terminals to HTML.
+
+    Parameters:
+        text: The formatted manual page, with bold and underlined characters marked by overstriking.
+
+    Returns:
+        The manual page, in a `pre` HTML element.
+    """
+    parts = []
+    position = 0
+    for match in _OVERSTRIKE_RE.finditer(text):
+        parts.append(escape(text[position : match.start()]))
+        parts.append(_overstrike(match))
+        position = match.end()
+    parts.append(escape(text[position:]))
+    return "<pre>" + "".join(parts) + "</pre>"
+
+
+def preview_command(
+    pandoc: str,
+    groff: str | None,
+    roff: str,
+    limits: Limits | None = None,
+) -> tuple[list[str], str]:
+    """Build the command line rendering a manual page for its preview.
+
+    With groff, the manual page is rendered as `man` would display it in a terminal.
+    Without groff, it is converted to HTML by Pandoc.
+
+    Parameters:
+        pandoc: The Pandoc executable, used to render the page when groff is not available.
+        groff: The groff executable, if available.
+        roff: The manual page source.
+        limits: The resource limits of the Pandoc process.
+
+    Returns:
+        The command, and the text to write to its standard input.
+    """
+    if groff is None:
+        return pandoc_command(pandoc, ["--from", "man", "--to", "html"], roff, limits)
+    return catman_command(pandoc, groff, roff, limits)
+
+
+def preview_html(output: str, groff: str | None) -> str:
+    """Return the HTML of a preview, from the output of its command.
+
+    See [`preview_command`][mkdocs_manpage.preview.preview_command].
+
+    Parameters:
+        output: The output of the preview command.
+        groff: The groff executable the command was built with, if any.
+
+    Returns:
+        The HTML of the manual page, without the surrounding document.
+    """
+    return output if groff is None else formatted_to_html(output)
+
+
+def render_preview(pandoc: str, groff: str | None, roff: str, *, limits: Limits | None = None) -> str:
+    """Render a manual page to HTML, to preview it in a browser.
+
+    Parameters:
+        pandoc: The Pandoc executable, used to render the page when groff is not available.
+        groff: The groff executable, if available.
+        roff: The manual page source.
+        limits: The resource limits of the groff or Pandoc process.
+
+    Returns:
+        The HTML of the manual page, without the surrounding document.
+    """
+    return preview_html(_run(*preview_command(pandoc, groff, roff, limits), limits), groff)
+
+
+def preview_output(output: str) -> str:
+    """Return the name of the preview file of a manual page.
+
+    Parameters:
+        output: The manpage output path.
+
+    Returns:
+        The file name, relative to the preview directory.
+    """
+    return f"{PurePath(output).name}.html"
+
+
+def write_previews(site_dir: Path, previews: Mapping[str, str]) -> Path:
+    """Write the previews of manual pages and their index into the site directory.
+
+    Parameters:
+        site_dir: The site directory.
+        previews: The HTML of each manual page, by output path.
+
+    Returns:
+        The preview directory.
+    """
+    directory = site_dir / preview_dir
+    directory.mkdir(parents=True, exist_ok=True)
+    items = []
+    for output, html in sorted(previews.items()):
+        name = preview_output(output)
+        directory.joinpath(name).write_text(_TEMPLATE.format(title=escape(output), body=html), encoding="utf8")
+        items.append(f'<li><a href="{escape(name)}">{escape(PurePath(output).name)}</a> ({escape(output)})</li>')
+    body = "<h1>Manual pages</h1>\n<ul>\n" + "\n".join(items) + "\n</ul>"
+    directory.joinpath("index.html").write_text(_TEMPLATE.format(title="Manual pages", body=body), encoding="utf8")
+    return directory
@@ -0,0 +1,272 @@
+"""Rendering of manual pages from HTML, outside of MkDocs builds."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from mkdocs_manpage.assembly import assemble_html
+from mkdocs_manpage.convert import run_sync
+from mkdocs_manpage.debug import get_version
+from mkdocs_manpage.engine import Engine
+from mkdocs_manpage.filters import DedupFilter, normalize_html, prune_html
+from mkdocs_manpage.preprocess import Preprocessor
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable, Sequence
+
+    from mkdocs_manpage.convert import Limits
+
+
+section_headers = {
+    "1": "User Commands",
+    "2": "System Calls Manual",
+    "3": "Library Functions Manual",
+    "4": "Kernel Interfaces Manual",
+    "5": "File Formats Manual",
+    "6": "Games Manual",
+    "7": "Miscellaneous Information Manual",
+    "8": "System Administration",
+    "9": "Kernel Routines",
+}
+"""Default headers of manual pages, by section (see `man man`)."""
+
+
+@dataclass(frozen=True)
+class ManpageMetadata:
+    """Metadata of a manual page, fully resolved.
+
+    Instances are immutable and picklable, so they can be resolved once
+    and passed as is to conversion workers.
+    """
+
+    name: str
+    """The manual page name, as listed in whatis indexes."""
+    title: str
+    """The manual page title."""
+    section: str
+    """The manual page section."""
+    header: str
+    """The manual page header."""
+    date: str
+    """The manual page date, formatted as `YYYY-MM-DD`."""
+    footer: str
+    """The manual page footer."""
+    description: str = ""
+    """The one-line description of the manual page."""
+    authors: tuple[str, ...] = ()
+    """The authors of the manual page, listed in its AUTHORS section."""
+
+    @classmethod
+    def resolve(
+        cls,
+        title: str,
+        section: str = "1",
+        *,
+        name: str | None = None,
+        header: str | None = None,
+        date: dt.date | None = None,
+        footer: str | None = None,
+        description: str = "",
+        authors: Iterable[str] = (),
+    ) -> ManpageMetadata:
+        """Resolve the metadata of a manual page, filling in default values.
+
+        Parameters:
+            title: The manual page title.
+            section: The manual page section.
+            name: The manual page name. Default: the title.
+            header: The manual page header. Default: common header of the section.
+            date: The manual page date. Default: today.
+            footer: The manual page footer. Default: `mkdocs-manpage v<version>`.
+            description: The one-line description of the manual page.
+            authors: The authors of the manual page.
+
+        Returns:
+            The resolved metadata.
+        """
+        return cls(
+            name=name or title,
+            title=title,
+            section=section,
+            header=header or section_headers.get(section, section_headers["1"]),
+            date=(date or dt.date.today()).strftime("%Y-%m-%d"),  # noqa: DTZ011
+            footer=footer or f"mkdocs-manpage v{get_version()}",
+            description=description,
+            authors=tuple(authors),
+        )
+
+    def variables(self) -> dict[str, str]:
+        """Return the Pandoc template variables of the manual page, except authors.
+
+        Returns:
+            The template variables.
+        """
+        return {
+            "title": self.title,
+            "section": self.section,
+            "date": self.date,
+            "footer": self.footer,
+            "header": self.header,
+        }
+
+    def pandoc_variables(self) -> list[str]:
+        """Return the Pandoc template variables of the manual page, as passed on the command line.
+
+        Returns:
+            The template variables, as `name:value` strings.
+        """
+        variables = [f"{name}:{value}" for name, value in self.variables().items()]
+        variables.extend(f"author:{author}" for author in self.authors)
+        return variables
+
+
+@dataclass
+class Manpage:
+    """A manual page to render, and its options (see [`render_manpage`][mkdocs_manpage.render.render_manpage])."""
+
+    pages: Sequence[str]
+    """The HTML of each input page."""
+    title: str
+    """The manual page title."""
+    section: str = "1"
+    """The manual page section."""
+    header: str | None = None
+    """The manual page header. Default: common header of the section."""
+    formats: Sequence[str] = ("man",)
+    """The output formats."""
+    prune: Collection[str] = ()
+    """The pruning rules applied to each page."""
+    normalize: bool = True
+    """Whether to simplify code blocks and tables (see [`NormalizeFilter`][mkdocs_manpage.filters.NormalizeFilter])."""
+    dedup: bool = False
+    """Whether to replace repeated blocks by references to their first occurrence."""
+    preprocess: str | Sequence[str] = ()
+    """References to pre-processing functions (see [`Preprocessor`][mkdocs_manpage.preprocess.Preprocessor])."""
+    output: str | None = None
+    """The output path passed to the `preprocess` function. Default: `<title>.<section>`."""
+    date: dt.date | None = None
+    """The manual page date. Default: today."""
+    footer: str | None = None
+    """The manual page footer. Default: `mkdocs-manpage v<version>`."""
+    metadata: dict[str, str] = field(init=False)
+    """The metadata passed to Pandoc."""
+
+    def __post_init__(self) -> None:
+        self.metadata = ManpageMetadata.resolve(
+            self.title,
+            self.section,
+            header=self.header,
+            date=self.date,
+            footer=self.footer,
+        ).variables()
+
+    def html(self) -> str:
+        """Assemble, prune, normalize, deduplicate and pre-process the HTML of the manual page.
+
+        Returns:
+            The HTML to convert.
+        """
+        pages: Iterable[str] = self.pages
+        if self.prune:
+            pages = (prune_html(page, self.prune) for page in pages)
+        if self.normalize:
+            pages = map(normalize_html, pages)
+        if self.dedup:
+            pages = map(DedupFilter().filter, pages)
+        html = assemble_html(pages)
+        if self.preprocess:
+            html = Preprocessor(self.preprocess)(html, self.output or f"{self.title}.{self.section}")
+        return html
+
+
+def render_manpages(
+    manpages: Iterable[Manpage],
+    *,
+    jobs: int | None = None,
+    pandoc: str | None = None,
+    limits: Limits | None = None,
+) -> list[dict[str, str]]:
+    """Render several manual pages, converting them in parallel.
+
+    This function runs its own event loop, and therefore cannot be called from a running one:
+    use [`Engine`][mkdocs_manpage.engine.Engine] in asynchronous code.
+
+    Parameters:
+        manpages: The manual pages to render.
+        jobs: The maximum number of concurrent Pandoc processes.
+        pandoc: The Pandoc executable. Default: found in `PATH`.
+        limits: The resource limits of Pandoc processes.
+
+    Returns:
+        The rendered manual pages, by format, in the same order as the given manual pages.
+    """
+    manpages = list(manpages)
+    htmls = [manpage.html() for manpage in manpages]
+
+    async def convert() -> list[dict[str, str]]:
+        engine = Engine(pandoc=pandoc, jobs=jobs, limits=limits)
+        return await asyncio.gather(
+            *(engine.convert(html, manpage.metadata, manpage.formats) for manpage, html in zip(manpages, htmls)),
+        )
+
+    return run_sync(convert())
+
+
+def render_manpage(
+    pages: Iterable[str],
+    title: str,
+    section: str = "1",
+    *,
+    header: str | None = None,
+    formats: Sequence[str] = ("man",),
+    prune: Collection[str] = (),
+    normalize: bool = True,
+    dedup: bool = False,
+    preprocess: str | Sequence[str] = (),
+    date: dt.date | None = None,
+    footer: str | None = None,
+    pandoc: str | None = None,
+    limits: Limits | None = None,
+) -> dict[str, str]:
+    """Render a manual page from the HTML of its input pages.
+
+    The HTML goes through the same pipeline as in the plugin, with the same defaults:
+    pruning, normalization, deduplication, pre-processing, then conversion with Pandoc.
+
+    Parameters:
+        pages: The HTML of each input page.
+        title: The manual page title.
+        section: The manual page section.
+        header: The manual page header. Default: common header of the section.
+        formats: The output formats, among [`formats`][mkdocs_manpage.convert.formats].
+        prune: The pruning rules applied to each page (see [`PruneFilter`][mkdocs_manpage.filters.PruneFilter]).
+        normalize: Whether to simplify code blocks and nested tables
+            (see [`NormalizeFilter`][mkdocs_manpage.filters.NormalizeFilter]).
+        dedup: Whether to replace repeated blocks by references to their first occurrence.
+        preprocess: References to pre-processing functions, by module path or dotted path
+            (see [`Preprocessor`][mkdocs_manpage.preprocess.Preprocessor]).
+        date: The manual page date. Default: today.
+        footer: The manual page footer. Default: `mkdocs-manpage v<version>`.
+        pandoc: The Pandoc executable. Default: found in `PATH`.
+        limits: The resource limits of Pandoc processes.
+
+    Returns:
+        The rendered manual page, by format.
+    """
+    manpage = Manpage(
+        list(pages),
+        title,
+        section,
+        header=header,
+        formats=formats,
+        prune=prune,
+        normalize=normalize,
+        dedup=dedup,
+        preprocess=preprocess,
+        date=date,
+        footer=footer,
+    )
+    return render_manpages([manpage], pandoc=pandoc, limits=limits)[0]
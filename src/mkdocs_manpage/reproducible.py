@@ -0,0 +1,98 @@
+"""Helpers for reproducible builds, producing byte-identical manual pages from the same sources."""
+
+from __future__ import annotations
+
+import datetime as dt
+import os
+import re
+import subprocess
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from mkdocs_manpage.logger import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+logger = get_logger(__name__)
+
+_GENERATOR_RE = re.compile(r'^\.\\" Automatically generated by Pandoc[^\n]*\n', re.MULTILINE)
+
+
+def source_date_epoch() -> dt.date | None:
+    """Return the date given by the `SOURCE_DATE_EPOCH` environment variable.
+
+    See [the specification](https://reproducible-builds.org/specs/source-date-epoch/).
+
+    Returns:
+        The date, in UTC, or none if the variable is not set or invalid.
+    """
+    epoch = os.getenv("SOURCE_DATE_EPOCH")
+    if not epoch:
+        return None
+    try:
+        return dt.datetime.fromtimestamp(int(epoch), tz=dt.timezone.utc).date()
+    except (ValueError, OverflowError, OSError):
+        logger.warning(f"Invalid SOURCE_DATE_EPOCH value: {epoch!r}")
+        return None
+
+
+def _git_timestamp(paths: list[Path]) -> int | None:
+    try:
+        process = subprocess.run(  # noqa: S603
+            ["git", "log", "-1", "--format=%ct", "--", *map(str, paths)],  # noqa: S607
+            cwd=paths[0].parent,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError:
+        return None
+    output = process.stdout.strip()
+    return int(output) if process.returncode == 0 and output.isdigit() else None
+
+
+def last_modified(paths: Iterable[str | Path]) -> dt.date | None:
+    """Return the date of the most recent modification of the given files.
+
+    The date of the last commit touching the files is used when they are tracked by Git,
+    otherwise their modification time is used.
+
+    Parameters:
+        paths: The files to check.
+
+    Returns:
+        The date, in UTC, or none if none of the files exist.
+    """
+    files = [path.absolute() for path in map(Path, paths) if path.is_file()]
+    if not files:
+        return None
+    timestamp = _git_timestamp(files)
+    if timestamp is None:
+        timestamp = max(int(path.stat().st_mtime) for path in files)
+    return dt.datetime.fromtimestamp(timestamp, tz=dt.timezone.utc).date()
+
+
+def release_version(version: str) -> str:
+    """Return a version without its local segment, which typically contains a commit hash.
+
+    Parameters:
+        version: A version number, like `1.2.3` or `1.2.4.dev3+g0123abc`.
+
+    Returns:
+        The version without its local segment, like `1.2.3` or `1.2.4.dev3`.
+    """
+    return version.split("+", 1)[0]
+
+
+def normalize_output(text: str) -> str:
+    """Remove non-reproducible parts of Pandoc outputs, like the generator comment of manual pages.
+
+    Parameters:
+        text: The Pandoc output.
+
+    Returns:
+        The normalized output.
+    """
+    return _GENERATOR_RE.sub("", text, count=1)
@@ -0,0 +1,92 @@
+"""Shards of recorded pages, to generate manpages from builds distributed over several nodes.
+
+Each node builds part of the site and exports the pages it recorded to a shard file.
+A final step loads all shards and generates the manpages, without rendering any page
+(see the `mkdocs-manpage merge` command).
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+from dataclasses import asdict, dataclass, field
+from typing import IO, TYPE_CHECKING, Any
+
+from mkdocs.exceptions import PluginError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
+
+shard_version = 1
+"""The version of the shard format."""
+
+
+@dataclass
+class ShardPage:
+    """A page recorded by a node, and the manpages it is part of."""
+
+    uri: str
+    """The page source URI, relative to the docs directory."""
+    url: str
+    """The page URL, relative to the site root."""
+    title: str
+    """The page title."""
+    outputs: list[str]
+    """The output paths of the manpages the page is part of, relative to the MkDocs configuration file."""
+    html: str
+    """The recorded HTML of the page, pruned and normalized."""
+    meta: dict[str, Any] = field(default_factory=dict)
+    """The page metadata."""
+
+
+def _open(path: Path, *, write: bool = False) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, "wt" if write else "rt", encoding="utf8")
+    return path.open("w" if write else "r", encoding="utf8")
+
+
+def write_shard(path: Path, pages: Iterable[ShardPage]) -> int:
+    """Write pages to a shard file, one page per line.
+
+    The file is compressed with gzip when its name ends with `.gz`.
+
+    Parameters:
+        path: The shard path.
+        pages: The recorded pages.
+
+    Returns:
+        The number of written pages.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    with _open(path, write=True) as file:
+        file.write(json.dumps({"mkdocs_manpage_shard": shard_version}) + "\n")
+        for page in pages:
+            file.write(json.dumps(asdict(page), default=str) + "\n")
+            count += 1
+    return count
+
+
+def read_shard(path: Path) -> Iterator[ShardPage]:
+    """Read pages from a shard file, one page at a time.
+
+    Parameters:
+        path: The shard path.
+
+    Raises:
+        PluginError: When the file is not a shard, or was written by an incompatible version.
+
+    Yields:
+        The recorded pages.
+    """
+    try:
+        with _open(path) as file:
+            header = json.loads(file.readline() or "{}")
+            if not isinstance(header, dict) or header.get("mkdocs_manpage_shard") != shard_version:
+                raise PluginError(f"{path} is not a shard of version {shard_version}")
+            for line in file:
+                yield ShardPage(**json.loads(line))
+    except (OSError, ValueError, TypeError) as error:
+        raise PluginError(f"Could not read shard {path}: {error}") from error
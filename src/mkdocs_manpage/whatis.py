@@ -0,0 +1,100 @@
+"""Whatis index of generated manpages, as used by `whatis` and `apropos`."""
+
+from __future__ import annotations
+
+import re
+from html.parser import HTMLParser
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+
+_ENTRY_RE = re.compile(r"^(?P<name>\S+) \((?P<section>[^)]+)\)\s+- (?P<description>.*)$")
+
+
+class _FirstParagraphParser(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__()
+        self.depth = 0
+        self.text: list[str] = []
+        self.done = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:  # noqa: ARG002
+        if tag == "p" and not self.done:
+            self.depth += 1
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "p" and self.depth:
+            self.depth -= 1
+            self.done = not self.depth and bool("".join(self.text).strip())
+
+    def handle_data(self, data: str) -> None:
+        if self.depth and not self.done:
+            self.text.append(data)
+
+
+def first_paragraph(html: str | Iterable[str]) -> str:
+    """Return the text of the first non-empty paragraph of an HTML document.
+
+    The document is parsed line by line, and parsing stops at the end of the first paragraph.
+
+    Parameters:
+        html: The HTML document, or an iterable of its lines (for example an open file).
+
+    Returns:
+        The paragraph text, on a single line.
+    """
+    parser = _FirstParagraphParser()
+    for line in html.splitlines(keepends=True) if isinstance(html, str) else html:
+        parser.feed(line)
+        if parser.done:
+            break
+    return " ".join("".join(parser.text).split())
+
+
+def format_entry(name: str, section: str, description: str) -> str:
+    """Format a whatis entry.
+
+    Parameters:
+        name: The manpage name.
+        section: The manpage section.
+        description: The one-line description of the manpage.
+
+    Returns:
+        The whatis entry, as a single line.
+    """
+    return f"{name} ({section}) - {' '.join(description.split())}"
+
+
+def read_index(path: Path) -> dict[tuple[str, str], str]:
+    """Read a whatis index.
+
+    Parameters:
+        path: The index path.
+
+    Returns:
+        The index entries, as descriptions keyed by manpage name and section.
+    """
+    try:
+        text = path.read_text(encoding="utf8")
+    except FileNotFoundError:
+        return {}
+    entries = {}
+    for line in text.splitlines():
+        if match := _ENTRY_RE.match(line):
+            entries[(match["name"], match["section"])] = match["description"]
+    return entries
+
+
+def write_index(path: Path, entries: dict[tuple[str, str], str]) -> None:
+    """Write a whatis index, sorted by manpage name and section.
+
+    Parameters:
+        path: The index path.
+        entries: The index entries, as descriptions keyed by manpage name and section.
+    """
+    lines = [format_entry(name, section, entries[(name, section)]) for name, section in sorted(entries)]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(lines) + "\n", encoding="utf8")
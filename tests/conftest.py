@@ -1 +1,44 @@
 """Configuration for the pytest test suite."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Literal
+
+import pytest
+import yaml
+from mkdocs.commands.build import build
+from mkdocs.config import load_config
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from mkdocs.config.defaults import MkDocsConfig
+
+
+@pytest.fixture
+def build_site(tmp_path: Path) -> Callable[..., MkDocsConfig]:
+    """Return a function writing an MkDocs configuration in `tmp_path`, and building the site.
+
+    The function accepts the options of the plugin as keyword arguments,
+    and returns the loaded configuration, to build the site again.
+    By default, a single manpage `man/project.1` is generated from `index.md`.
+    """
+
+    def _build_site(
+        *,
+        config_file: str = "mkdocs.yml",
+        command: Literal["build", "gh-deploy", "serve"] = "build",
+        site: dict[str, Any] | None = None,
+        **plugin_options: Any,
+    ) -> MkDocsConfig:
+        plugin_options.setdefault("pages", [{"title": "project", "output": "man/project.1", "inputs": ["index.md"]}])
+        mkdocs_yml = {"site_name": "Project", **(site or {}), "plugins": [{"manpage": plugin_options}]}
+        tmp_path.joinpath(config_file).write_text(yaml.safe_dump(mkdocs_yml, sort_keys=False))
+        config = load_config(str(tmp_path / config_file))
+        # The plugin defines `on_startup`, so MkDocs keeps its instance across builds: start it as MkDocs would.
+        config.plugins.on_startup(command=command, dirty=False)
+        build(config)
+        return config
+
+    return _build_site
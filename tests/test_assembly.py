@@ -0,0 +1,52 @@
+"""Tests for the assembly of manual pages."""
+
+import tracemalloc
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from mkdocs_manpage.assembly import assemble_html, split_chunks, write_html
+
+PAGE_SIZE = 100 * 1024
+PAGE_COUNT = 1024
+
+
+def _synthetic_pages() -> Iterator[str]:
+    for index in range(PAGE_COUNT):
+        yield f"<h2>Page {index}</h2>" + "<p>" + "x" * PAGE_SIZE + "</p>"
+
+
+def test_write_html_same_as_in_memory(tmp_path: Path) -> None:
+    """Write the same HTML as in-memory assembly."""
+    pages = ["<p>One</p>", "<p>Two</p>", "<p>Three</p>"]
+    html_file = write_html(iter(pages), tmp_path / "manpage.html")
+    assert html_file.read_text(encoding="utf8") == assemble_html(pages)
+
+
+def test_write_html_memory_is_bounded(tmp_path: Path) -> None:
+    """Assemble a 100 MB manpage while holding only a few pages in memory."""
+    tracemalloc.start()
+    try:
+        html_file = write_html(_synthetic_pages(), tmp_path / "manpage.html")
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert html_file.stat().st_size > PAGE_SIZE * PAGE_COUNT
+    assert peak < 10 * PAGE_SIZE
+
+
+@pytest.mark.parametrize(
+    ("sizes", "chunks", "expected"),
+    [
+        ([1] * 10, 3, [4, 3, 3]),
+        ([100, 1, 1, 1, 1], 3, [1, 1, 3]),
+        ([1, 1, 1, 1, 100], 3, [3, 1, 1]),
+        ([5, 5], 4, [1, 1]),
+        ([5, 5], 1, [2]),
+        ([], 3, []),
+    ],
+)
+def test_split_chunks(sizes: list[int], chunks: int, expected: list[int]) -> None:
+    """Split pages into balanced, non-empty chunks."""
+    assert split_chunks(sizes, chunks) == expected
@@ -0,0 +1,100 @@
+"""Tests for the cache."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+from mkdocs.exceptions import PluginError
+
+from mkdocs_manpage.cache import Cache, parse_size
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.parametrize(
+    ("size", "expected"),
+    [(1024, 1024), ("2048", 2048), ("1K", 1024), ("500M", 500 * 1024**2), ("1.5 GB", int(1.5 * 1024**3))],
+)
+def test_parse_size(size: int | str, expected: int) -> None:
+    """Parse sizes with units."""
+    assert parse_size(size) == expected
+
+
+def test_compute_only_once(tmp_path: Path) -> None:
+    """Compute values once, even across cache instances."""
+    calls = []
+
+    def compute() -> str:
+        calls.append(1)
+        return "value"
+
+    key = Cache.key("html", "man")
+    assert Cache(tmp_path, namespaces=["ns"]).cached("ns", key, compute) == "value"
+    assert Cache(tmp_path, namespaces=["ns"]).cached("ns", key, compute) == "value"
+    assert len(calls) == 1
+
+
+def test_cache_files(tmp_path: Path) -> None:
+    """Cache files, keyed by their contents."""
+    cache = Cache(tmp_path / "cache", namespaces=["ns"])
+    source = tmp_path / "source.json"
+    source.write_text("{}")
+    key = Cache.key(source)
+    assert key == Cache.key("{}")
+    cache.set_file("ns", key, source)
+    assert cache.get_file("ns", key, tmp_path / "copy.json")
+    assert (tmp_path / "copy.json").read_text() == "{}"
+
+
+def test_evict_least_recently_used(tmp_path: Path) -> None:
+    """Evict least recently used entries first."""
+    cache = Cache(tmp_path, max_size=250, namespaces=["ns"])
+    for index, key in enumerate(("a", "b", "c")):
+        cache.set("ns", key * 4, "x" * 100)
+        os.utime(cache.path("ns", key * 4), (index, index))
+    cache.get("ns", "aaaa")
+    assert cache.evict() == 1
+    assert cache.get("ns", "bbbb") is None
+    assert cache.get("ns", "aaaa") is not None
+    assert cache.get("ns", "cccc") is not None
+
+
+def test_record_stats(tmp_path: Path) -> None:
+    """Record hits and misses across cache instances."""
+    for _ in range(2):
+        cache = Cache(tmp_path, namespaces=["ns"])
+        cache.cached("ns", "abcd", lambda: "value")
+        cache.record_stats()
+    stats = Cache(tmp_path, namespaces=["ns"]).stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+    assert stats.entries == {"ns": 1}
+    Cache(tmp_path, namespaces=["ns"]).clear()
+    stats = Cache(tmp_path, namespaces=["ns"]).stats()
+    assert (stats.hits, stats.misses, stats.size) == (0, 0, 0)
+
+
+def test_refuse_to_clear_unmarked_directories(tmp_path: Path) -> None:
+    """Never evict or clear entries from directories that are not marked as cache directories."""
+    tmp_path.joinpath("docs").mkdir()
+    tmp_path.joinpath("ns", "ab").mkdir(parents=True)
+    tmp_path.joinpath("ns", "ab", "module.py").write_text("x" * 100)
+    cache = Cache(tmp_path, max_size=10, namespaces=["ns"])
+    assert not cache.is_marked
+    assert cache.evict() == 0
+    with pytest.raises(PluginError, match=r"CACHEDIR\.TAG"):
+        cache.clear()
+    assert tmp_path.joinpath("ns", "ab", "module.py").exists()
+
+
+def test_clear_only_cache_namespaces(tmp_path: Path) -> None:
+    """Mark new cache directories, and only remove the namespaces of the cache when clearing them."""
+    cache = Cache(tmp_path / "cache", namespaces=["ns"])
+    assert cache.is_marked
+    cache.set("ns", "abcd", "value")
+    tmp_path.joinpath("cache", "other").mkdir()
+    cache.clear()
+    assert not cache.path("ns", "abcd").exists()
+    assert tmp_path.joinpath("cache", "other").exists()
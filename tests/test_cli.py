@@ -0,0 +1,47 @@
+"""Tests for the CLI."""
+
+from pathlib import Path
+
+import pytest
+
+from mkdocs_manpage import cli
+from mkdocs_manpage.cache import Cache
+from mkdocs_manpage.manifest import timings_file, write_timings
+
+
+def test_show_help(capsys: pytest.CaptureFixture) -> None:
+    """Show help."""
+    with pytest.raises(SystemExit):
+        cli.main(["-h"])
+    captured = capsys.readouterr()
+    assert "mkdocs-manpage" in captured.out
+
+
+def test_show_debug_info(tmp_path: Path, capsys: pytest.CaptureFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Show debug information."""
+    monkeypatch.chdir(tmp_path)
+    write_timings(tmp_path / timings_file, {"conversion": 1.5})
+    with pytest.raises(SystemExit):
+        cli.main(["--debug-info"])
+    captured = capsys.readouterr().out.lower()
+    assert "python" in captured
+    assert "system" in captured
+    assert "pandoc" in captured
+    assert "when `jobs` is not set" in captured
+    assert "last build, in the current directory: conversion 1.50s" in captured
+
+
+def test_cache_stats_and_clear(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    """Show cache statistics, then clear the cache."""
+    Cache(tmp_path).set("parse_html", "abcd", "{}")
+    assert cli.main(["cache", "--cache-dir", str(tmp_path), "stats"]) == 0
+    assert "parse_html: 1" in capsys.readouterr().out
+    assert cli.main(["cache", "--cache-dir", str(tmp_path), "clear"]) == 0
+    assert Cache(tmp_path).stats().entries == {}
+
+
+def test_refuse_to_clear_unmarked_directory(tmp_path: Path) -> None:
+    """Refuse to clear directories that are not marked as cache directories."""
+    tmp_path.joinpath("docs").mkdir()
+    assert cli.main(["cache", "--cache-dir", str(tmp_path), "clear"]) == 1
+    assert tmp_path.joinpath("docs").exists()
@@ -0,0 +1,125 @@
+"""Tests for the conversion module."""
+
+import logging
+from pathlib import Path
+
+import pytest
+from mkdocs.exceptions import PluginError
+
+from mkdocs_manpage.convert import (
+    Limits,
+    catman_output,
+    find_pandoc,
+    format_output,
+    merge_document_files,
+    merge_documents,
+    pandoc_command,
+    parse_html,
+    render_catman,
+    run_pandoc,
+    write_document,
+    write_output,
+)
+
+
+@pytest.mark.parametrize(
+    ("to", "expected"),
+    [
+        ("man", "share/man/man1/project.1"),
+        ("plain", "share/man/man1/project.1.txt"),
+        ("markdown", "share/man/man1/project.1.md"),
+    ],
+)
+def test_format_output(to: str, expected: str) -> None:
+    """Append format-specific suffixes to output paths."""
+    assert format_output(Path("share/man/man1/project.1"), to) == Path(expected)
+
+
+def test_write_parsed_document_to_several_formats() -> None:
+    """Parse HTML once, write it to several formats."""
+    pandoc = find_pandoc()
+    document = parse_html(pandoc, "<h1>Usage</h1><p>Run <code>project</code>.</p>")
+    man = write_document(pandoc, document, "man", ["title:project", "section:1"])
+    assert '.TH "project" "1"' in man
+    assert ".SH Usage" in man
+    plain = write_document(pandoc, document, "plain", [])
+    assert "Run project." in plain
+    markdown = write_document(pandoc, document, "markdown", [])
+    assert "# Usage" in markdown
+
+
+@pytest.mark.parametrize(
+    ("output", "expected"),
+    [
+        ("share/man/man1/project.1", "share/man/cat1/project.1"),
+        ("share/man/man3/project.3", "share/man/cat3/project.3"),
+        ("share/man/man3p/project.3p", "share/man/cat3p/project.3p"),
+        ("docs/project.1", "docs/project.1.cat"),
+        ("share/manpages/project.1", "share/manpages/project.1.cat"),
+        ("docs/manual/project.1", "docs/manual/project.1.cat"),
+    ],
+)
+def test_catman_output(output: str, expected: str) -> None:
+    """Write formatted manpages in `cat` directories."""
+    assert catman_output(Path(output)) == Path(expected)
+
+
+def test_render_catman_without_groff() -> None:
+    """Fall back to Pandoc to render formatted manpages."""
+    pandoc = find_pandoc()
+    roff = write_document(pandoc, parse_html(pandoc, "<h1>Usage</h1><p>Run it.</p>"), "man", [])
+    assert "Run it." in render_catman(pandoc, None, roff)
+
+
+def test_write_output_only_when_changed(tmp_path: Path) -> None:
+    """Leave files untouched when their contents did not change."""
+    path = tmp_path / "project.1"
+    assert write_output(path, "contents")
+    assert not write_output(path, "contents")
+    assert write_output(path, "new contents")
+
+
+def test_report_pandoc_failures() -> None:
+    """Raise an error when Pandoc fails."""
+    with pytest.raises(PluginError, match="pandoc failed"):
+        run_pandoc(find_pandoc(), ["--from", "not-a-format"], "")
+
+
+def test_limit_pandoc_memory() -> None:
+    """Abort Pandoc when it exceeds its maximum memory."""
+    html = "<table>" + "<tr><td>x</td><td>y</td></tr>" * 20_000 + "</table>"
+    with pytest.raises(PluginError, match="Heap exhausted"):
+        parse_html(find_pandoc(), html, limits=Limits(max_memory="20M"))
+
+
+def test_limit_pandoc_time() -> None:
+    """Abort Pandoc when it exceeds its timeout."""
+    html = "<table>" + "<tr><td>x</td><td>y</td></tr>" * 20_000 + "</table>"
+    with pytest.raises(PluginError, match="timed out"):
+        parse_html(find_pandoc(), html, limits=Limits(timeout=0.01))
+
+
+def test_verbose_pandoc_only_when_debugging(caplog: pytest.LogCaptureFixture) -> None:
+    """Run Pandoc in verbose mode only when debug logs are enabled."""
+    caplog.set_level(logging.INFO, logger="mkdocs.plugins.mkdocs_manpage")
+    assert "--verbose" not in pandoc_command("pandoc", [], "")[0]
+    caplog.set_level(logging.DEBUG, logger="mkdocs.plugins.mkdocs_manpage")
+    assert "--verbose" in pandoc_command("pandoc", [], "")[0]
+
+
+def test_merged_chunks_same_as_single_run(tmp_path: Path) -> None:
+    """Write the same manpage from chunks parsed separately as from the whole HTML."""
+    pandoc = find_pandoc()
+    pages = [f"<h1>Page {index}</h1><p>Text<sup>{index}</sup> <a href='#x'>link</a>.</p>" for index in range(6)]
+    chunks = ["\n\n".join(pages[:2]), "\n\n".join(pages[2:5]), pages[5]]
+    documents = [parse_html(pandoc, chunk) for chunk in chunks]
+    variables = ["title:project", "section:1"]
+    expected = write_document(pandoc, parse_html(pandoc, "\n\n".join(pages)), "man", variables)
+    assert write_document(pandoc, merge_documents(documents), "man", variables) == expected
+
+    files = []
+    for index, document in enumerate(documents):
+        files.append(tmp_path / f"{index}.json")
+        files[-1].write_text(document, encoding="utf8")
+    merged = merge_document_files(files, tmp_path / "merged.json")
+    assert write_document(pandoc, merged, "man", variables) == expected
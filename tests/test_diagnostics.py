@@ -0,0 +1,25 @@
+"""Tests for the diagnostics module."""
+
+from mkdocs_manpage.convert import find_pandoc
+from mkdocs_manpage.diagnostics import PageStats, find_outliers, profile_pages
+
+
+def test_profile_pages() -> None:
+    """Convert and measure each page separately."""
+    stats = profile_pages(find_pandoc(), {"a.md": "<p>A.</p>", "b.md": "<p>B.</p>"})
+    assert [page.uri for page in stats] == ["a.md", "b.md"]
+    assert all(page.output_size and not page.error for page in stats)
+
+
+def test_find_outliers() -> None:
+    """Flag pages slow to convert, in absolute time or relative to their size."""
+    stats = [
+        PageStats("a.md", 1000, 100, 0.1),
+        PageStats("b.md", 1000, 100, 0.1),
+        PageStats("slow.md", 1000, 100, 1.0),
+        PageStats("c.md", 1000, 100, 0.1),
+        PageStats("dense.md", 10, 10, 0.1),
+        PageStats("failed.md", 100, 0, 5.0, error="pandoc failed"),
+    ]
+    outliers = find_outliers(stats)
+    assert set(outliers) == {"slow.md", "dense.md"}
@@ -0,0 +1,54 @@
+"""Tests for the asynchronous conversion engine."""
+
+import asyncio
+import sys
+import time
+
+import pytest
+from mkdocs.exceptions import PluginError
+
+from mkdocs_manpage.convert import Limits
+from mkdocs_manpage.engine import Engine
+
+
+def test_convert_to_several_formats() -> None:
+    """Parse HTML once, write it to several formats concurrently."""
+    html = "<h1>Usage</h1><p>Run <code>project</code>.</p>"
+    outputs = asyncio.run(Engine().convert(html, {"title": "project", "section": "1"}, formats=("man", "plain")))
+    assert '.TH "project" "1"' in outputs["man"]
+    assert "Run project." in outputs["plain"]
+
+
+def test_stream_large_inputs() -> None:
+    """Write and read more data than pipe buffers hold."""
+    text = "x" * 1_000_000
+    output = asyncio.run(Engine().run([sys.executable, "-c", "import sys; sys.stdout.write(sys.stdin.read())"], text))
+    assert output == text
+
+
+def test_report_failures() -> None:
+    """Raise an error when Pandoc fails."""
+    with pytest.raises(PluginError, match="pandoc failed"):
+        asyncio.run(Engine().run_pandoc(["--from", "not-a-format"], ""))
+
+
+def test_limit_time() -> None:
+    """Abort processes when they exceed their timeout."""
+    engine = Engine(limits=Limits(timeout=0.1))
+    with pytest.raises(PluginError, match="timed out"):
+        asyncio.run(engine.run([sys.executable, "-c", "import time; time.sleep(10)"]))
+
+
+def test_kill_cancelled_processes() -> None:
+    """Kill processes when their task is cancelled."""
+
+    async def cancel() -> None:
+        task = asyncio.ensure_future(Engine().run([sys.executable, "-c", "import time; time.sleep(10)"]))
+        await asyncio.sleep(0.5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    start = time.monotonic()
+    asyncio.run(cancel())
+    assert time.monotonic() - start < 5
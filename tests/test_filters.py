@@ -0,0 +1,99 @@
+"""Tests for the HTML filters."""
+
+import pytest
+
+from mkdocs_manpage.convert import find_pandoc, parse_html, write_document
+from mkdocs_manpage.filters import DedupFilter, HTMLFilter, normalize_html, prune_html
+
+
+def test_filter_preserves_html() -> None:
+    """Re-emit HTML untouched when nothing is dropped."""
+    html = '<!DOCTYPE html><h1 id="a">A &amp; B&#39;s</h1><!-- c --><p>Text<br/><img src="x.png"></p>'
+    assert HTMLFilter().filter(html) == html
+
+
+@pytest.mark.parametrize(
+    ("rule", "html", "expected"),
+    [
+        (
+            "source",
+            '<p>Doc.</p><details class="quote"><summary>Source</summary><details><p>x</p></details></details><p>End.</p>',
+            "<p>Doc.</p><p>End.</p>",
+        ),
+        ("hidden", '<p>A<span aria-hidden="true">B</span><span style="display: none">C</span></p>', "<p>A</p>"),
+        ("hidden", "<div hidden><div>A</div></div><p>B</p>", "<p>B</p>"),
+        ("images", '<p>A<svg><svg><path d=""/></svg></svg><img src="data:image/png;base64,AAA">B</p>', "<p>AB</p>"),
+        ("permalinks", '<h2 id="x">X<a class="headerlink" href="#x">&para;</a></h2>', '<h2 id="x">X</h2>'),
+    ],
+)
+def test_prune(rule: str, html: str, expected: str) -> None:
+    """Prune content according to rules."""
+    assert prune_html(html, [rule]) == expected
+
+
+def test_prune_nothing_without_rules() -> None:
+    """Keep everything when no rule is selected."""
+    html = '<h2 id="x">X<a class="headerlink" href="#x">&para;</a></h2><svg></svg>'
+    assert prune_html(html, []) == html
+
+
+def test_dedup_across_pages() -> None:
+    """Replace blocks repeated across pages by references."""
+    table = "<table>" + "<tr><td>param</td><td>Some description.</td></tr>" * 10 + "</table>"
+    dedup = DedupFilter(min_size=100)
+    first = dedup.filter(f"<h2>ClassA.method</h2><div>{table}</div><p>Short.</p>")
+    second = dedup.filter(f"<h2>ClassB.method</h2><div>{table}</div><p>Short.</p>")
+    assert first == f"<h2>ClassA.method</h2><div>{table}</div><p>Short.</p>"
+    assert second == '<h2>ClassB.method</h2><p><em>(Same as in "ClassA.method".)</em></p><p>Short.</p>'
+    assert dedup.replaced == 1
+    assert dedup.saved == len(f"<div>{table}</div>") - len('<p><em>(Same as in "ClassA.method".)</em></p>')
+
+
+def test_dedup_unclosed_blocks() -> None:
+    """Keep implicitly closed blocks."""
+    html = "<div><p>One<p>Two</div><ul><li>Three</ul>"
+    assert DedupFilter().filter(html) == html
+
+
+@pytest.mark.parametrize(
+    ("html", "expected"),
+    [
+        (
+            (
+                '<div class="highlight"><pre><span></span><code><span class="n">a</span> &lt; <span class="mi">1</span>'
+                "</code></pre></div>"
+            ),
+            '<div class="highlight"><pre>a &lt; 1</pre></div>',
+        ),
+        ('<pre><code><span class="linenos" data-linenos="1 "></span>a</code></pre>', "<pre>a</pre>"),
+        (
+            (
+                '<table class="highlighttable"><tr><td class="linenos"><div class="linenodiv"><pre>1\n2</pre></div></td>'
+                '<td class="code"><div class="highlight"><pre><code>a\nb</code></pre></div></td></tr></table>'
+            ),
+            '<div class="highlight"><pre>a\nb</pre></div>',
+        ),
+        (
+            (
+                "<table><tr><td>x</td><td><table><tr><th>a</th><th>b</th></tr><tr><td>1</td><td>2</td></tr></table>"
+                "</td></tr></table>"
+            ),
+            "<table><tr><td>x</td><td>a | b<br>1 | 2<br></td></tr></table>",
+        ),
+        ("<table><tr><td>x</td></tr></table><p>y</p>", "<table><tr><td>x</td></tr></table><p>y</p>"),
+    ],
+)
+def test_normalize(html: str, expected: str) -> None:
+    """Collapse highlighted code, unwrap line-numbered code blocks, and flatten nested tables."""
+    assert normalize_html(html) == expected
+
+
+def test_normalize_keeps_output() -> None:
+    """Convert highlighted code blocks to the same manual page."""
+    code = "".join(
+        f'<span class="n">x{line}</span> <span class="o">=</span> <span class="mi">1</span>\n' for line in range(5)
+    )
+    html = f'<p>Example:</p><div class="highlight"><pre><span></span><code>{code}</code></pre></div>'
+    pandoc = find_pandoc()
+    outputs = [write_document(pandoc, parse_html(pandoc, page), "man", []) for page in (html, normalize_html(html))]
+    assert outputs[0] == outputs[1]
@@ -0,0 +1,40 @@
+"""Tests for links resolution."""
+
+import pytest
+
+from mkdocs_manpage.links import LinkFilter, LinkIndex
+
+
+@pytest.fixture
+def index() -> LinkIndex:
+    """An index of three pages, in two manual pages."""
+    index = LinkIndex()
+    index.add_page("", ["man/project.1"], '<h1 id="project">Project</h1><h2 id="usage">Usage</h2>')
+    index.add_page("options/", ["man/project.1"], '<h1 id="options">Options <a class="headerlink">¶</a></h1>')
+    index.add_page("api/", ["man/project.3"], '<h1 id="api">API</h1><h2 id="project.main">main</h2>')
+    return index
+
+
+@pytest.mark.parametrize(
+    ("href", "text", "expected"),
+    [
+        ("#usage", "Usage", "Usage"),
+        ("#usage", "how to use it", 'how to use it (see "Usage")'),
+        ("../options/", "the options", 'the options (see "Options")'),
+        ("../api/#project.main", "main", "main (see <strong>project</strong>(3))"),
+        ("../api/", "the API", 'the API (see "API" in <strong>project</strong>(3))'),
+        ("https://example.org/api/", "example", '<a href="https://example.org/api/">example</a>'),
+        ("../unknown/", "unknown", '<a href="../unknown/">unknown</a>'),
+    ],
+)
+def test_rewrite_links(index: LinkIndex, href: str, text: str, expected: str) -> None:
+    """Rewrite links into cross-references or section names."""
+    html = f'<p><a href="{href}">{text}</a></p>'
+    assert LinkFilter(index, "man/project.1").rewrite(html, "") == f"<p>{expected}</p>"
+
+
+def test_reference_manpages_by_name(index: LinkIndex) -> None:
+    """Reference other manual pages by their resolved name."""
+    html = '<p><a href="../api/#project.main">main</a></p>'
+    links = LinkFilter(index, "man/project.1", {"man/project.3": "project-api"})
+    assert links.rewrite(html, "") == "<p>main (see <strong>project-api</strong>(3))</p>"
@@ -0,0 +1,85 @@
+"""Tests for the generation of manpages whose inputs changed."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from mkdocs_manpage.manifest import ManifestEntry, read_manifest, read_timings, timings_file, write_manifest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+_PAGES = [
+    {"title": "project", "output": "man/project.1", "inputs": ["index.md"]},
+    {"title": "other", "output": "man/other.1", "inputs": ["other.md"]},
+]
+
+
+def test_generate_changed_manpages_only(tmp_path: Path, build_site: Callable) -> None:
+    """Skip manpages whose inputs did not change, keeping their previous output."""
+
+    def _build() -> dict[str, int]:
+        build_site(changed_only=True, pages=_PAGES)
+        return {path.name: path.stat().st_mtime_ns for path in (tmp_path / "man").iterdir()}
+
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    docs.joinpath("index.md").write_text("# Usage\n\nRun `project`.\n")
+    docs.joinpath("other.md").write_text("# Other\n\nRun `other`.\n")
+
+    first = _build()
+    manifest = json.loads((tmp_path / ".manpages.json").read_text())
+    assert set(manifest) == {"man/project.1", "man/other.1"}
+    assert set(manifest["man/project.1"]["inputs"]) == {"index.md"}
+
+    (tmp_path / "man" / "other.1").write_text("previous output")
+    docs.joinpath("index.md").write_text("# Usage\n\nRun `project --help`.\n")
+    second = _build()
+    assert second["other.1"] != first["other.1"]  # Written by the test above.
+    assert (tmp_path / "man" / "other.1").read_text() == "previous output"
+    assert "help" in (tmp_path / "man" / "project.1").read_text()
+
+    third = _build()
+    assert third == second
+
+    (tmp_path / "man" / "other.1").unlink()
+    _build()
+    assert "Run" in (tmp_path / "man" / "other.1").read_text()
+
+
+def test_regenerate_when_options_change(tmp_path: Path, build_site: Callable) -> None:
+    """Generate manpages again when options that change their output change."""
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    docs.joinpath("index.md").write_text("# Usage\n\nRun `project`.\n")
+    pages = [{"output": "man/project.1", "inputs": ["index.md"]}]
+    for footer, site_name in (("Project 1.0", "Project"), ("Project 2.0", "Project"), ("Project 2.0", "Renamed")):
+        build_site(changed_only=True, footer=footer, site={"site_name": site_name}, pages=pages)
+        output = (tmp_path / "man" / "project.1").read_text()
+        assert f'.TH "{site_name}"' in output
+        assert f'"{footer}"' in output
+
+
+def test_record_last_build_timings(tmp_path: Path, build_site: Callable) -> None:
+    """Record the timings of the last build, with or without the cache."""
+    (tmp_path / "docs").mkdir()
+    tmp_path.joinpath("docs", "index.md").write_text("# Usage\n")
+    assert read_timings(tmp_path / timings_file) == {}
+    build_site()
+    first = read_timings(tmp_path / timings_file)
+    assert {"assembly", "conversion", "total"} <= set(first)
+    build_site()
+    assert read_timings(tmp_path / timings_file)["time"] >= first["time"]
+
+
+def test_read_invalid_manifest(tmp_path: Path) -> None:
+    """Ignore invalid manifests, and read back written ones."""
+    path = tmp_path / "manifest.json"
+    path.write_text('{"man/project.1": []}')
+    assert read_manifest(path) == {}
+    entries = {"man/project.1": ManifestEntry("abc", {"index.md": "def"}, [("project", "1")])}
+    write_manifest(path, entries)
+    assert read_manifest(path) == entries
+    assert read_manifest(path)["man/project.1"].names == [("project", "1")]
@@ -1,9 +1,25 @@
 """Tests for the plugin."""
 
+from __future__ import annotations
+
 import os
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, NoReturn
 
 import pytest
 from duty.tools import mkdocs
+from mkdocs.exceptions import Abort
+
+from mkdocs_manpage import assembly, plugin
+from mkdocs_manpage.engine import Engine
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+
+    from bs4 import BeautifulSoup
+
+_PAGE = {"title": "project", "output": "man/project.1", "inputs": ["index.md"]}
 
 
 def test_plugin() -> None:
@@ -12,3 +28,143 @@ def test_plugin() -> None:
     with pytest.raises(expected_exception=SystemExit) as exc:
         mkdocs.build()()
     assert exc.value.code == 0
+
+
+@pytest.mark.parametrize("low_memory", [False, True])
+def test_chunked_conversion(tmp_path: Path, build_site: Callable, low_memory: bool) -> None:
+    """Generate the same manpage from chunks converted in parallel as from a single run."""
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    for index in range(7):
+        docs.joinpath(f"page{index}.md").write_text(f"# Page {index}\n\nText[^{index}].\n\n[^{index}]: Note.\n")
+    outputs = []
+    page = {"title": "project", "output": "man/project.1", "inputs": ["page*.md"], "formats": ["man", "plain"]}
+    for chunks in (1, 3):
+        build_site(low_memory=low_memory, pages=[{**page, "chunks": chunks}])
+        outputs.append([(tmp_path / "man" / name).read_text() for name in ("project.1", "project.1.txt")])
+    assert outputs[0] == outputs[1]
+    assert outputs[1][0].count(".TH") == 1
+
+
+def test_front_matter_overrides(tmp_path: Path, build_site: Callable) -> None:
+    """Resolve metadata from the front-matter of the first input page, with defaults for missing options."""
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    docs.joinpath("index.md").write_text(
+        "---\nmanpage:\n  title: tool\n  authors: [Jane Doe]\ndescription: Do things.\n---\n\n# Tool\n\nText.\n",
+    )
+    build_site(whatis="man/whatis", pages=[{"output": "man/project.1", "inputs": ["index.md"]}])
+    man = (tmp_path / "man" / "project.1").read_text()
+    assert '.TH "tool" "1"' in man
+    assert '"User Commands"' in man
+    assert ".SH AUTHORS" in man
+    assert "Jane Doe" in man
+    assert (tmp_path / "man" / "whatis").read_text() == "project (1) - Do things.\n"
+
+
+def test_cache_is_transparent(tmp_path: Path, build_site: Callable) -> None:
+    """Pre-process whole manpages whether the cache is enabled or not."""
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    docs.joinpath("one.md").write_text("# One\n\nText.\n")
+    docs.joinpath("two.md").write_text("# Two\n\nText.\n")
+    tmp_path.joinpath("preprocess.py").write_text(
+        "def preprocess(soup, output):\n    for heading in soup.find_all('h1')[1:]:\n        heading.decompose()\n",
+    )
+    page = {"title": "project", "output": "man/project.1", "inputs": ["one.md", "two.md"]}
+    outputs = []
+    for cache in (False, True, True):
+        build_site(cache=cache, preprocess="preprocess.py", pages=[page])
+        outputs.append((tmp_path / "man" / "project.1").read_text())
+    assert outputs[0].count(".SH") == 1
+    assert outputs[0] == outputs[1] == outputs[2]
+
+
+def test_cache_preprocessed_pages(tmp_path: Path, build_site: Callable) -> None:
+    """Cache pre-processed pages one at a time, invalidating them when the salt changes."""
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    docs.joinpath("one.md").write_text("# One\n\nText.\n")
+    docs.joinpath("two.md").write_text("# Two\n\nText.\n")
+    calls = tmp_path / "calls.txt"
+    tmp_path.joinpath("preprocess.py").write_text(
+        "def preprocess(soup, output):\n"
+        f"    with open({str(calls)!r}, 'a') as file:\n"
+        "        file.write(soup.h1.text + '\\n')\n",
+    )
+
+    def build_with(salt: str) -> list[str]:
+        calls.write_text("")
+        page = {"title": "project", "output": "man/project.1", "inputs": ["one.md", "two.md"]}
+        build_site(cache=True, cache_salt=salt, preprocess="preprocess.py", preprocess_pages=True, pages=[page])
+        return calls.read_text().split()
+
+    assert build_with("1") == ["One", "Two"]
+    docs.joinpath("two.md").write_text("# Two\n\nChanged.\n")
+    assert build_with("1") == ["Two"]
+    assert build_with("2") == ["One", "Two"]
+
+
+def test_cache_parsed_pages(tmp_path: Path, build_site: Callable) -> None:
+    """Cache the parsed documents of each input page, to share them between manpages and builds."""
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    docs.joinpath("one.md").write_text("# One\n\nText.\n")
+    docs.joinpath("two.md").write_text("# Two\n\nText.\n")
+    page = {"title": "project", "output": "man/project.1", "inputs": ["one.md", "two.md"]}
+    entries = tmp_path / ".cache" / "mkdocs-manpage" / "parse_html"
+    build_site(cache=True, pages=[page])
+    assert len(list(entries.glob("*/*"))) == 2
+    docs.joinpath("one.md").write_text("# One\n\nChanged.\n")
+    build_site(cache=True, pages=[page])
+    assert len(list(entries.glob("*/*"))) == 3
+
+
+def test_invalid_cache_max_size(tmp_path: Path, build_site: Callable, caplog: pytest.LogCaptureFixture) -> None:
+    """Report invalid cache sizes as plugin errors."""
+    (tmp_path / "docs").mkdir()
+    with pytest.raises(Abort):
+        build_site(cache=True, cache_max_size="10 gigs", pages=[])
+    assert "Invalid cache_max_size: '10 gigs'" in caplog.text
+
+
+_events: list[str] = []
+
+
+def record_page(soup: BeautifulSoup, output: str) -> None:  # noqa: ARG001
+    """Record that a page is pre-processed."""
+    _events.append(f"pre-process {soup.h1.text if soup.h1 else ''}")
+
+
+def test_low_memory_streams_pages(
+    tmp_path: Path,
+    build_site: Callable,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Pre-process and write pages to a file one at a time, and parse the file, in `low_memory` mode."""
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    for name in ("One", "Two", "Three"):
+        docs.joinpath(f"{name.lower()}.md").write_text(f"# {name}\n\nText.\n")
+
+    def write_html(pages: Iterable[str], path: Path) -> Path:
+        assert isinstance(pages, Iterator)
+
+        def written() -> Iterator[str]:
+            for page in pages:
+                yield page
+                _events.append("write")
+
+        return assembly.write_html(written(), path)
+
+    def fail(*args: Any, **kwargs: Any) -> NoReturn:  # noqa: ARG001
+        raise AssertionError("HTML was assembled or parsed in memory")
+
+    monkeypatch.setattr(plugin, "write_html", write_html)
+    monkeypatch.setattr(plugin, "assemble_html", fail)
+    monkeypatch.setattr(Engine, "parse_html", fail)
+    _events.clear()
+    inputs = ["one.md", "two.md", "three.md"]
+    build_site(low_memory=True, preprocess="tests.test_plugin:record_page", pages=[{**_PAGE, "inputs": inputs}])
+    assert _events == ["pre-process One", "write", "pre-process Two", "write", "pre-process Three", "write"]
+    assert ".SH Three" in (tmp_path / "man" / "project.1").read_text()
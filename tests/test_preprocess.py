@@ -0,0 +1,57 @@
+"""Tests for HTML pre-processing."""
+
+from __future__ import annotations
+
+import pickle
+from typing import TYPE_CHECKING
+
+from mkdocs_manpage.config import PluginConfig
+from mkdocs_manpage.preprocess import Preprocessor, load_function
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from bs4 import BeautifulSoup
+
+
+def remove_images(soup: BeautifulSoup, output: str) -> None:  # noqa: ARG001
+    """Remove images."""
+    for image in soup.find_all("img"):
+        image.decompose()
+
+
+def mark_output(soup: BeautifulSoup, output: str) -> None:
+    """Append the output path to the first paragraph."""
+    if soup.p is not None:
+        soup.p.append(output)
+
+
+def test_chain_functions_by_dotted_path() -> None:
+    """Apply several functions, referenced by dotted path, to the same soup."""
+    preprocessor = Preprocessor(["tests.test_preprocess:remove_images", "tests.test_preprocess:mark_output"])
+    html = preprocessor("<p>Hello <img src='x.png'/></p>", "project.1")
+    assert "img" not in html
+    assert "Hello project.1" in html
+
+
+def test_load_functions_once(tmp_path: Path) -> None:
+    """Load functions once, unless their module changed."""
+    module = tmp_path / "preprocess.py"
+    module.write_text("def preprocess(soup, output): pass\n")
+    spec = f"{module}:preprocess"
+    assert load_function(spec) is load_function(spec)
+
+
+def test_pickle_preprocessor() -> None:
+    """Send pre-processors to other processes."""
+    preprocessor = Preprocessor("tests.test_preprocess:remove_images")
+    assert pickle.loads(pickle.dumps(preprocessor)).specs == preprocessor.specs  # noqa: S301
+
+
+def test_resolve_preprocess_paths(tmp_path: Path) -> None:
+    """Resolve module paths relative to the configuration file, keep dotted paths."""
+    (tmp_path / "preprocess.py").write_text("def preprocess(soup, output): pass\n")
+    config = PluginConfig(config_file_path=str(tmp_path / "mkdocs.yml"))
+    config.load_dict({"pages": [], "preprocess": ["preprocess.py", "mypkg.docs:clean"]})
+    assert config.validate() == ([], [])
+    assert config.preprocess == [f"{tmp_path / 'preprocess.py'}:preprocess", "mypkg.docs:clean"]
@@ -0,0 +1,73 @@
+"""Tests for the preview of manual pages."""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from mkdocs.commands.build import build
+
+from mkdocs_manpage.convert import find_pandoc
+from mkdocs_manpage.preview import formatted_to_html, render_preview
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import pytest
+
+_PAGES = [
+    {"title": "project", "output": "man/project.1", "inputs": ["index.md"]},
+    {"title": "other", "output": "man/other.1", "inputs": ["other.md"]},
+]
+
+
+def test_formatted_to_html() -> None:
+    """Convert overstruck characters to bold and italic text."""
+    text = "N\bNA\bAM\bME\bE\n  _\bf_\bi_\bl_\be <&>"
+    assert formatted_to_html(text) == "<pre><b>NAME</b>\n  <i>file</i> &lt;&amp;&gt;</pre>"
+
+
+def test_render_preview_without_groff() -> None:
+    """Render manual pages to HTML with Pandoc when groff is not available."""
+    html = render_preview(find_pandoc(), None, '.TH "project" "1"\n.SH NAME\nproject - do things\n')
+    assert "NAME" in html
+    assert "project - do things" in html
+
+
+def test_preview_changed_manpages_only(
+    tmp_path: Path,
+    build_site: Callable,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Serve previews of all manpages, rendering only the ones that changed."""
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    docs.joinpath("index.md").write_text("# Usage\n\nRun `project`.\n")
+    docs.joinpath("other.md").write_text("# Other\n\nRun `other`.\n")
+    caplog.set_level(logging.DEBUG, logger="mkdocs.plugins.mkdocs_manpage")
+
+    def rendered() -> list[str]:
+        messages = [record.getMessage() for record in caplog.records]
+        return sorted(Path(message.split()[-1]).stem for message in messages if "Rendered preview" in message)
+
+    config = build_site(command="serve", pages=_PAGES)
+    assert rendered() == ["other", "project"]
+
+    docs.joinpath("index.md").write_text("# Usage\n\nRun `project --help`.\n")
+    build(config)
+    assert rendered() == ["other", "project", "project"]
+    preview = tmp_path / "site" / "manpages"
+    assert "--help" in preview.joinpath("project.1.html").read_text()
+    assert preview.joinpath("other.1.html").exists()
+    assert 'href="project.1.html"' in preview.joinpath("index.html").read_text()
+
+
+def test_no_preview_when_building(tmp_path: Path, build_site: Callable) -> None:
+    """Don't render previews outside of `mkdocs serve`."""
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    docs.joinpath("index.md").write_text("# Usage\n")
+    docs.joinpath("other.md").write_text("# Other\n")
+    build_site(pages=_PAGES)
+    assert not (tmp_path / "site" / "manpages").exists()
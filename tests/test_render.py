@@ -0,0 +1,36 @@
+"""Tests for the programmatic API."""
+
+import datetime as dt
+import pickle
+
+from mkdocs_manpage import Manpage, ManpageMetadata, render_manpage, render_manpages
+
+
+def test_render_manpage_with_plugin_defaults() -> None:
+    """Render a manual page with the default header and footer of its section."""
+    pages = ["<h1>Usage</h1><p>Run it.</p>", "<h2>Options</h2><p>None.</p>"]
+    man = render_manpage(pages, "project", "3", date=dt.date(2024, 1, 2))["man"]
+    assert '.TH "project" "3" "2024-01-02" "mkdocs-manpage v' in man
+    assert '"Library Functions Manual"' in man
+    assert ".SS Options" in man
+
+
+def test_render_several_manpages() -> None:
+    """Render several manual pages at once, in order."""
+    manpages = [
+        Manpage([f"<p>Page {index}.</p>"], f"page{index}", formats=("man", "plain"), prune=["images"])
+        for index in range(5)
+    ]
+    outputs = render_manpages(manpages, jobs=2)
+    assert [output["plain"].strip() for output in outputs] == [f"Page {index}." for index in range(5)]
+
+
+def test_resolve_manpage_metadata() -> None:
+    """Resolve default metadata once, into an immutable and picklable record."""
+    metadata = ManpageMetadata.resolve("project", "5", date=dt.date(2024, 1, 2), authors=["Jane Doe"])
+    assert metadata.name == "project"
+    assert metadata.header == "File Formats Manual"
+    assert metadata.date == "2024-01-02"
+    assert metadata.footer.startswith("mkdocs-manpage v")
+    assert "author:Jane Doe" in metadata.pandoc_variables()
+    assert pickle.loads(pickle.dumps(metadata)) == metadata  # noqa: S301
@@ -0,0 +1,51 @@
+"""Tests for reproducible builds."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from mkdocs_manpage.reproducible import normalize_output, release_version
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A project whose documentation was last modified on January 1st, 2020."""
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    index = tmp_path / "docs" / "index.md"
+    index.parent.mkdir()
+    index.write_text("# Usage\n\nRun `project`.\n")
+    os.utime(index, (1577880000, 1577880000))
+    return tmp_path
+
+
+def _build(project: Path, build_site: Callable) -> bytes:
+    build_site(reproducible=True)
+    return (project / "man" / "project.1").read_bytes()
+
+
+def test_bit_identical_builds(project: Path, build_site: Callable) -> None:
+    """Build the same manpage twice, byte for byte."""
+    first = _build(project, build_site)
+    (project / "man" / "project.1").unlink()
+    assert _build(project, build_site) == first
+    assert b'"2020-01-01"' in first
+    assert b"Automatically generated by Pandoc" not in first
+
+
+def test_date_from_source_date_epoch(project: Path, build_site: Callable, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Take the date from `SOURCE_DATE_EPOCH` when set."""
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+    assert b'"2023-11-14"' in _build(project, build_site)
+
+
+def test_normalize_output() -> None:
+    """Remove the generator comment and local version segments."""
+    assert normalize_output('.\\" Automatically generated by Pandoc 3.1\n.TH "x"\n') == '.TH "x"\n'
+    assert release_version("1.2.4.dev3+g0123abc") == "1.2.4.dev3"
@@ -0,0 +1,64 @@
+"""Tests for distributed builds, through shards of recorded pages."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from mkdocs.exceptions import PluginError
+
+from mkdocs_manpage import cli
+from mkdocs_manpage.shards import ShardPage, read_shard, write_shard
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+_PAGES = [{"title": "project", "output": "man/project.1", "inputs": ["one.md", "two.md"]}]
+
+
+def test_merge_shards(tmp_path: Path, build_site: Callable) -> None:
+    """Generate the same manpage from shards of two builds as from a single build."""
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    docs.joinpath("one.md").write_text("# One\n\nSee [two](two.md#details).\n")
+    docs.joinpath("two.md").write_text("# Two\n\n## Details\n\nText.\n")
+
+    build_site(pages=_PAGES)
+    expected = (tmp_path / "man" / "project.1").read_text()
+    (tmp_path / "man" / "project.1").unlink()
+
+    for node, shard, exclude in (("node1", "one.jsonl", "two.md"), ("node2", "two.jsonl.gz", "one.md")):
+        build_site(config_file=f"{node}.yml", site={"exclude_docs": exclude}, shard=f"shards/{shard}", pages=_PAGES)
+    assert not (tmp_path / "man" / "project.1").exists()
+    assert [page.uri for page in read_shard(tmp_path / "shards" / "two.jsonl.gz")] == ["two.md"]
+
+    shards = [str(tmp_path / "shards" / name) for name in ("one.jsonl", "two.jsonl.gz")]
+    assert cli.main(["merge", "-f", str(tmp_path / "mkdocs.yml"), *shards]) == 0
+    assert (tmp_path / "man" / "project.1").read_text() == expected
+    assert "(see \\(dqDetails\\(dq)" in expected
+
+
+def test_merge_generated_pages(tmp_path: Path, build_site: Callable, capsys: pytest.CaptureFixture) -> None:
+    """Expand inputs against pages found in shards, like pages generated by other plugins."""
+    (tmp_path / "docs").mkdir()
+    pages = [{"title": "api", "output": "man/api.3", "inputs": ["reference/*.md"]}]
+    build_site(shard="shards/node.jsonl", pages=pages)
+    generated = ShardPage("reference/api.md", "", "API", ["man/api.3"], "<h1>Module</h1><p>Generated.</p>")
+    write_shard(tmp_path / "shards" / "generated.jsonl", [generated])
+    shards = [str(tmp_path / "shards" / name) for name in ("node.jsonl", "generated.jsonl")]
+    assert cli.main(["merge", "-f", str(tmp_path / "mkdocs.yml"), *shards]) == 0
+    assert "Generated." in (tmp_path / "man" / "api.3").read_text()
+
+    assert cli.main(["merge", "-f", str(tmp_path / "mkdocs.yml"), shards[0]]) == 1
+    assert "Input pattern reference/*.md of manpage" in capsys.readouterr().err
+
+
+def test_read_invalid_shard(tmp_path: Path) -> None:
+    """Refuse to read files that are not shards."""
+    path = tmp_path / "shard.jsonl"
+    write_shard(path, [ShardPage("index.md", "", "Index", ["man/project.1"], "<p>Hello.</p>")])
+    assert next(read_shard(path)).html == "<p>Hello.</p>"
+    path.write_text('{"pages": []}\n')
+    with pytest.raises(PluginError, match="not a shard"):
+        list(read_shard(path))
@@ -0,0 +1,86 @@
+"""Tests for the size budget and splitting of manpages."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from mkdocs_manpage.assembly import split_budget
+from mkdocs_manpage.whatis import read_index
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """A project with three pages of about 220 bytes of HTML each."""
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    docs.joinpath("one.md").write_text("# One\n\n" + "Text. " * 30 + "\n\nSee [three](three.md).\n")
+    docs.joinpath("two.md").write_text("# Two\n\n" + "Text. " * 30 + "\n")
+    docs.joinpath("three.md").write_text("# Three\n\n" + "Text. " * 30 + "\n")
+    return tmp_path
+
+
+def _build(build_site: Callable, *, split: bool, **options: Any) -> None:
+    page = {"title": "project", "output": "man/project.1", "inputs": ["one.md", "two.md", "three.md"]}
+    build_site(pages=[{**page, "max_size": 500, "split": split, **options}], whatis="man/whatis")
+
+
+@pytest.mark.parametrize(
+    ("sizes", "expected"),
+    [([100, 100, 100], [2, 1]), ([300, 50, 50, 300], [1, 2, 1]), ([50], [1]), ([], [])],
+)
+def test_split_budget(sizes: list[int], expected: list[int]) -> None:
+    """Group pages within the size budget, giving oversized pages their own group."""
+    assert split_budget(sizes, 200) == expected
+
+
+def test_warn_about_large_manpages(project: Path, build_site: Callable, caplog: pytest.LogCaptureFixture) -> None:
+    """Warn when a manpage is larger than its maximum size."""
+    _build(build_site, split=False)
+    assert "more than its max_size of 500 bytes" in caplog.text
+    assert not (project / "man" / "project-1.1").exists()
+
+
+def test_split_large_manpages(project: Path, build_site: Callable) -> None:
+    """Split manpages into parts, and turn the manpage into an index of its parts."""
+    _build(build_site, split=True)
+    index = (project / "man" / "project.1").read_text()
+    assert "project\\-1" in index
+    assert "project\\-2" in index
+    assert "Three" in index
+    first = (project / "man" / "project-1.1").read_text()
+    second = (project / "man" / "project-2.1").read_text()
+    assert '.TH "project-1" "1"' in first
+    assert "\\f[B]project\\-2\\f[R](1)" in first
+    assert ".SH Three" in second
+
+
+def test_name_parts_after_their_output(project: Path, build_site: Callable) -> None:
+    """Give parts their own names and descriptions, rather than the ones of the split manpage."""
+    _build(build_site, split=True, name="tool", description="Do things.")
+    assert read_index(project / "man" / "whatis") == {
+        ("tool", "1"): "Do things.",
+        ("project-1", "1"): "Text. " * 29 + "Text.",
+        ("project-2", "1"): "Text. " * 29 + "Text.",
+    }
+
+
+def test_describe_index_pages(project: Path, build_site: Callable) -> None:
+    """Describe the index of a split manpage by the first paragraph of its first input."""
+    _build(build_site, split=True)
+    assert read_index(project / "man" / "whatis")[("project", "1")] == "Text. " * 29 + "Text."
+
+
+def test_measure_html_in_bytes(project: Path, build_site: Callable, caplog: pytest.LogCaptureFixture) -> None:
+    """Measure the HTML of pages in bytes, not characters."""
+    docs = project / "docs"
+    docs.joinpath("one.md").write_text("# One\n\n" + "é" * 300 + "\n", encoding="utf8")
+    docs.joinpath("two.md").write_text("# Two\n")
+    docs.joinpath("three.md").write_text("# Three\n")
+    _build(build_site, split=False)
+    assert "bytes of HTML, more than its max_size of 500 bytes" in caplog.text
@@ -0,0 +1,70 @@
+"""Tests for the whatis index."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from mkdocs_manpage.whatis import first_paragraph, read_index, write_index
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+def test_first_paragraph() -> None:
+    """Extract the first non-empty paragraph of a page."""
+    html = "<h1>Project</h1>\n<p></p>\n<p>Generate <em>great</em>\n  manpages.</p>\n<p>Second.</p>"
+    assert first_paragraph(html) == "Generate great manpages."
+
+
+def test_update_index(tmp_path: Path) -> None:
+    """Write, read and update an index."""
+    index_file = tmp_path / "whatis"
+    write_index(index_file, {("project", "1"): "Do things.", ("project", "3"): "Python API."})
+    assert index_file.read_text() == "project (1) - Do things.\nproject (3) - Python API.\n"
+    index = read_index(index_file)
+    index[("another", "1")] = "Another project."
+    write_index(index_file, index)
+    assert read_index(index_file) == {
+        ("another", "1"): "Another project.",
+        ("project", "1"): "Do things.",
+        ("project", "3"): "Python API.",
+    }
+
+
+def test_prune_removed_manpages(tmp_path: Path, build_site: Callable) -> None:
+    """Remove entries of manpages that are no longer generated."""
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    docs.joinpath("index.md").write_text("# Project\n\nDo things.\n")
+    docs.joinpath("other.md").write_text("# Other\n\nDo other things.\n")
+    pages = [{"output": "man/project.1", "inputs": ["index.md"]}, {"output": "man/other.1", "inputs": ["other.md"]}]
+    build_site(whatis="man/whatis", pages=pages)
+    assert read_index(tmp_path / "man" / "whatis") == {
+        ("other", "1"): "Do other things.",
+        ("project", "1"): "Do things.",
+    }
+    build_site(whatis="man/whatis", pages=pages[:1])
+    assert read_index(tmp_path / "man" / "whatis") == {("project", "1"): "Do things."}
+
+
+def test_keep_entries_of_skipped_manpages(tmp_path: Path, build_site: Callable) -> None:
+    """Keep the entries of manpages skipped in `changed_only` mode, with their resolved names."""
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    docs.joinpath("index.md").write_text("---\nmanpage:\n  name: tool\n---\n\n# Tool\n\nDo things.\n")
+    pages = [{"output": "man/project.1", "inputs": ["index.md"]}]
+    for _ in range(2):
+        build_site(whatis="man/whatis", changed_only=True, pages=pages)
+        assert read_index(tmp_path / "man" / "whatis") == {("tool", "1"): "Do things."}
+
+
+def test_update_changed_descriptions(tmp_path: Path, build_site: Callable) -> None:
+    """Rewrite entries whose description changed, even when their manpage did not."""
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    docs.joinpath("index.md").write_text("# Project\n\nDo things.\n")
+    for description in ("Old description.", "New description.", None):
+        page = {"output": "man/project.1", "inputs": ["index.md"], "description": description}
+        build_site(whatis="man/whatis", pages=[page])
+        assert read_index(tmp_path / "man" / "whatis") == {("project", "1"): description or "Do things."}